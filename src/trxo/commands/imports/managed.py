@@ -147,6 +147,10 @@ class ManagedObjectsImporter(BaseImporter):
         base_path: str = "",
     ) -> List[Dict[str, Any]]:
         """Generate PATCH operations by comparing existing and new objects"""
+        # Callers compare the objects first; only an aliased subtree can be skipped
+        if existing_object is new_object:
+            return []
+
         operations = []
 
         # Handle all keys from new object
@@ -502,8 +506,12 @@ class ManagedObjectsImporter(BaseImporter):
                         f"[DEBUG] Managed object '{name}' exists at index {idx}, "
                         "generating PATCH operations..."
                     )
-                    patch_operations = self._generate_patch_operations(
-                        existing_object, obj, f"/objects/{idx}"
+                    patch_operations = (
+                        []
+                        if existing_object == obj
+                        else self._generate_patch_operations(
+                            existing_object, obj, f"/objects/{idx}"
+                        )
                     )
                     if not patch_operations:
                         info(f"[DEBUG] No changes needed for managed object: {name}")
@@ -637,8 +645,12 @@ class ManagedObjectsImporter(BaseImporter):
                 f"[DEBUG] Managed object '{object_name}' exists at index {index}, "
                 "generating PATCH operations..."
             )
-            patch_operations = self._generate_patch_operations(
-                existing_object, selected_object, f"/objects/{index}"
+            patch_operations = (
+                []
+                if existing_object == selected_object
+                else self._generate_patch_operations(
+                    existing_object, selected_object, f"/objects/{index}"
+                )
             )
 
             if not patch_operations:
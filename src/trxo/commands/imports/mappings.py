@@ -100,6 +100,10 @@ class MappingsImporter(BaseImporter):
         base_path: str = "",
     ) -> List[Dict[str, Any]]:
         """Generate PATCH operations by comparing existing and new mappings"""
+        # Callers compare the mappings first; only an aliased subtree can be skipped
+        if existing_mapping is new_mapping:
+            return []
+
         operations = []
 
         # Handle all keys from new mapping
@@ -179,8 +183,12 @@ class MappingsImporter(BaseImporter):
 
         if index >= 0:
             # Mapping exists - use PATCH for efficient updates
-            patch_operations = self._generate_patch_operations(
-                existing_mapping, item_data, f"/mappings/{index}"
+            patch_operations = (
+                []
+                if existing_mapping == item_data
+                else self._generate_patch_operations(
+                    existing_mapping, item_data, f"/mappings/{index}"
+                )
             )
 
             if not patch_operations:
@@ -3,13 +3,29 @@ import os
 import platform
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Mapping, Optional
 
 import keyring
 
 SERVICE_NAME = "trxo_git_credentials"
 
 
+def _config_dir_for(
+    system: str, environ: Mapping[str, str], home: Optional[Path] = None
+) -> Path:
+    """Resolve the config directory for an OS name and environment"""
+    if system == "Windows":
+        base_dir = environ.get("APPDATA", "")
+        return Path(base_dir) / "trxo"
+    if system == "Darwin":  # macOS
+        return (home or Path.home()) / "Library" / "Application Support" / "trxo"
+    # Linux and others
+    xdg_config = environ.get("XDG_CONFIG_HOME", "")
+    if xdg_config:
+        return Path(xdg_config) / "trxo"
+    return (home or Path.home()) / ".trxo"
+
+
 class ConfigStore:
     def __init__(self):
         self.base_dir = self._get_config_dir()
@@ -19,17 +35,7 @@ class ConfigStore:
 
     def _get_config_dir(self) -> Path:
         """Get platform-specific config directory"""
-        system = platform.system()
-        if system == "Windows":
-            base_dir = os.environ.get("APPDATA", "")
-            return Path(base_dir) / "trxo"
-        elif system == "Darwin":  # macOS
-            return Path.home() / "Library" / "Application Support" / "trxo"
-        else:  # Linux and others
-            xdg_config = os.environ.get("XDG_CONFIG_HOME", "")
-            if xdg_config:
-                return Path(xdg_config) / "trxo"
-            return Path.home() / ".trxo"
+        return _config_dir_for(platform.system(), os.environ)
 
     def _ensure_config_dir(self):
         """Ensure config directory exists"""
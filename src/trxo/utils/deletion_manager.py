@@ -15,7 +15,14 @@ from trxo.utils.diff.diff_engine import DiffItem, DiffResult
 class DeletionManager:
     """Manages safe deletion of items during sync operations"""
 
-    def __init__(self):
+    def __init__(self, confirm_fn: Callable[..., bool] = typer.confirm):
+        """
+        Initialize deletion tracking
+
+        Args:
+            confirm_fn: Prompt used to confirm deletions (typer.confirm by default)
+        """
+        self._confirm = confirm_fn
         self.deleted_items = []
         self.failed_deletions = []
 
@@ -61,7 +68,7 @@ class DeletionManager:
         if force:
             return True
 
-        confirm = typer.confirm(
+        confirm = self._confirm(
             "⚠️  Are you sure you want to DELETE these items?", default=False
         )
         return confirm
@@ -4,9 +4,17 @@ Metadata builder for export operations.
 Builds standardized metadata for exported data including realm detection.
 """
 
+import re
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
+# AM realm pattern: /realms/root/realms/{realm}/
+_AM_REALM_RE = re.compile(r"/realms/root/realms/([^/?]*)")
+# IDM themerealm _fields=realm/{realm}
+_IDM_FIELDS_REALM_RE = re.compile(r"_fields=realm/([^&/]*)")
+# Command name hint e.g., services_realm_alpha
+_COMMAND_REALM_RE = re.compile(r"_realm_(.*)", re.DOTALL)
+
 
 class MetadataBuilder:
     """Builds metadata for exported data"""
@@ -23,27 +31,20 @@ class MetadataBuilder:
         Returns:
             Detected realm name or None
         """
-        realm_value = None
-
-        try:
-            # AM realm pattern: /realms/root/realms/{realm}/
-            am_marker = "/realms/root/realms/"
-            if am_marker in api_endpoint:
-                after = api_endpoint.split(am_marker, 1)[1]
-                realm_value = after.split("/", 1)[0].split("?", 1)[0]
-
-            # IDM themerealm _fields=realm/{realm}
-            if not realm_value and "_fields=realm/" in api_endpoint:
-                after = api_endpoint.split("_fields=realm/", 1)[1]
-                realm_value = after.split("&", 1)[0].split("/", 1)[0]
+        api_endpoint = api_endpoint or ""
+        command_name = command_name or ""
 
-            # Fallback to command_name hint e.g., services_realm_alpha
-            if not realm_value and "_realm_" in command_name:
-                realm_value = command_name.split("_realm_", 1)[1]
-        except Exception:
-            realm_value = None
+        # Patterns are tried in priority order; the first non-empty capture wins
+        for pattern, source in (
+            (_AM_REALM_RE, api_endpoint),
+            (_IDM_FIELDS_REALM_RE, api_endpoint),
+            (_COMMAND_REALM_RE, command_name),
+        ):
+            match = pattern.search(source)
+            if match and match.group(1):
+                return match.group(1)
 
-        return realm_value
+        return None
 
     @staticmethod
     def count_items(data: Any) -> int:
@@ -57,8 +58,9 @@ class MetadataBuilder:
             Number of items
         """
         if isinstance(data, dict):
-            if "result" in data and isinstance(data["result"], list):
-                return len(data["result"])
+            result = data.get("result")
+            if isinstance(result, list):
+                return len(result)
             # Handle flattened policies structure
             if "am" in data or "global" in data:
                 return len(data.get("am", [])) + len(data.get("global", []))
@@ -5,11 +5,31 @@ Handles offset-based pagination for PingOne Advanced Identity Cloud API
 responses.
 """
 
-from typing import Any, Dict
-from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, Iterator, Tuple
+from urllib.parse import SplitResult, parse_qsl, urlencode, urlsplit, urlunsplit
 
 from trxo.constants import DEFAULT_PAGE_SIZE
 
+PAGE_SIZE_PARAM = "_pageSize"
+PAGE_OFFSET_PARAM = "_pagedResultsOffset"
+
+# Numeric _pageSize value; anything else falls back to DEFAULT_PAGE_SIZE
+_PAGE_SIZE_RE = re.compile(rf"[?&]{PAGE_SIZE_PARAM}=(\d+)(?:[&#]|$)")
+
+
+@lru_cache(maxsize=256)
+def _split_endpoint(endpoint: str) -> Tuple[SplitResult, Tuple[Tuple[str, str], ...]]:
+    """Split an endpoint into URL parts and its query pairs.
+
+    Every page of a paginated export re-uses the same endpoint, so the parse is
+    cached. Pairs are returned as a tuple so callers cannot mutate the cache.
+    """
+    parts = urlsplit(endpoint)
+    return parts, tuple(parse_qsl(parts.query, keep_blank_values=True))
+
 
 class PaginationHandler:
     """Handles pagination logic for API responses"""
@@ -48,34 +68,37 @@ class PaginationHandler:
         Returns:
             Updated endpoint with parameters
         """
-        parts = urlsplit(endpoint)
-        query_params = dict(parse_qsl(parts.query, keep_blank_values=True))
+        parts, query_pairs = _split_endpoint(endpoint)
+        query_params = dict(query_pairs)
         query_params.update({k: str(v) for k, v in params.items() if v is not None})
 
-        if parts.scheme:
-            return urlunsplit(
-                (
-                    parts.scheme,
-                    parts.netloc,
-                    parts.path,
-                    urlencode(query_params, doseq=True),
-                    parts.fragment,
-                )
-            )
-        else:
-            query_string = urlencode(query_params, doseq=True) if query_params else ""
-            return f"{parts.path}?{query_string}" if query_string else parts.path
+        query_string = urlencode(query_params, doseq=True)
+
+        if parts.scheme or parts.netloc:
+            return urlunsplit(parts._replace(query=query_string))
+        return f"{parts.path}?{query_string}" if query_string else parts.path
 
     @staticmethod
-    def fetch_all_pages(
+    def _requested_page_size(api_endpoint: str) -> int:
+        """Page size requested by the endpoint, or DEFAULT_PAGE_SIZE."""
+        match = _PAGE_SIZE_RE.search(api_endpoint or "")
+        return int(match.group(1)) if match else DEFAULT_PAGE_SIZE
+
+    @staticmethod
+    def iter_all_pages(
         initial_response: Dict[str, Any],
         api_endpoint: str,
         http_requester,
         headers: Dict[str, str],
         api_base_url: str,
-    ) -> Dict[str, Any]:
+        prefetch: bool = True,
+    ) -> Iterator[Any]:
         """
-        Fetch all pages of a paginated response.
+        Yield every item of a paginated response, one page at a time.
+
+        Only the current page is held in memory. With ``prefetch`` the request
+        for the next page is issued on a background thread while the caller
+        consumes the current one; pages are still requested strictly in order.
 
         Args:
             initial_response: First page response
@@ -83,55 +106,87 @@ class PaginationHandler:
             http_requester: Object with make_http_request method
             headers: HTTP headers
             api_base_url: Base URL for API
+            prefetch: Request the next page while the current one is consumed
 
-        Returns:
-            Aggregated response with all items
+        Yields:
+            Items from the ``result`` list of each page
         """
-        first_items = initial_response.get("result", [])
+        items = initial_response.get("result", [])
 
-        # Check if we actually need more pages
         remaining = initial_response.get("remainingPagedResults")
         if not isinstance(remaining, int) or remaining <= 0:
-            return initial_response
+            yield from items
+            return
 
-        # Determine page size
-        page_size = DEFAULT_PAGE_SIZE
-        try:
-            parts = urlsplit(api_endpoint)
-            query_params = dict(parse_qsl(parts.query, keep_blank_values=True))
-            if "_pageSize" in query_params and query_params["_pageSize"].isdigit():
-                page_size = int(query_params["_pageSize"])
-        except Exception:
-            pass
-
-        # Fetch remaining pages
-        offset = len(first_items)
-        combined = list(first_items)
-
-        while True:
-            # Build next page endpoint
+        page_size = PaginationHandler._requested_page_size(api_endpoint)
+
+        def load_page(offset: int) -> Any:
             next_endpoint = PaginationHandler.build_endpoint_with_params(
                 api_endpoint,
-                {"_pagedResultsOffset": offset, "_pageSize": page_size},
+                {PAGE_OFFSET_PARAM: offset, PAGE_SIZE_PARAM: page_size},
             )
-
             next_url = f"{api_base_url}{next_endpoint}"
-            next_response = http_requester.make_http_request(next_url, "GET", headers)
-            next_data = next_response.json()
-            next_items = (
-                next_data.get("result") if isinstance(next_data, dict) else None
-            )
+            return http_requester.make_http_request(next_url, "GET", headers).json()
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            offset = len(items)
+            pending = executor.submit(load_page, offset) if executor else None
 
-            if not isinstance(next_items, list) or not next_items:
-                break
+            while True:
+                yield from items
 
-            combined.extend(next_items)
+                next_data = pending.result() if pending else load_page(offset)
+                next_items = (
+                    next_data.get("result") if isinstance(next_data, dict) else None
+                )
 
-            remaining_count = next_data.get("remainingPagedResults")
-            if isinstance(remaining_count, int) and remaining_count <= 0:
-                break
+                if not isinstance(next_items, list) or not next_items:
+                    return
 
-            offset += len(next_items)
+                remaining_count = next_data.get("remainingPagedResults")
+                if isinstance(remaining_count, int) and remaining_count <= 0:
+                    yield from next_items
+                    return
+
+                offset += len(next_items)
+                pending = executor.submit(load_page, offset) if executor else None
+                items = next_items
+        finally:
+            if executor:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def fetch_all_pages(
+        initial_response: Dict[str, Any],
+        api_endpoint: str,
+        http_requester,
+        headers: Dict[str, str],
+        api_base_url: str,
+    ) -> Dict[str, Any]:
+        """
+        Fetch all pages of a paginated response.
+
+        Args:
+            initial_response: First page response
+            api_endpoint: API endpoint
+            http_requester: Object with make_http_request method
+            headers: HTTP headers
+            api_base_url: Base URL for API
+
+        Returns:
+            Aggregated response with all items
+        """
+        # Check if we actually need more pages
+        remaining = initial_response.get("remainingPagedResults")
+        if not isinstance(remaining, int) or remaining <= 0:
+            return initial_response
+
+        combined = list(
+            PaginationHandler.iter_all_pages(
+                initial_response, api_endpoint, http_requester, headers, api_base_url
+            )
+        )
 
         # Build aggregated response
         aggregated = dict(initial_response)
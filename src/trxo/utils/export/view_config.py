@@ -5,6 +5,7 @@ This module defines default column configurations for different export commands
 to provide sensible defaults for table display.
 """
 
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 # Default columns for each export command
@@ -140,9 +141,10 @@ def get_column_description(command_name: str, column_name: str) -> str:
     return command_cols.get(column_name, f"Column: {column_name}")
 
 
+@lru_cache(maxsize=64)
 def get_available_columns_help(command_name: str) -> str:
     """Generate help text showing available columns for a command"""
-    defaults = get_default_columns(command_name)
+    defaults = DEFAULT_VIEW_COLUMNS.get(command_name)
     if not defaults:
         return "Use --view to see available columns"
 
@@ -164,8 +166,11 @@ def suggest_columns(command_name: str, view_columns: Optional[str]) -> Optional[
     if view_columns:
         return view_columns
 
-    defaults = get_default_columns(command_name)
-    if defaults:
-        return ",".join(defaults)
+    return _default_columns_csv(command_name)
 
-    return None
+
+@lru_cache(maxsize=64)
+def _default_columns_csv(command_name: str) -> Optional[str]:
+    """Default columns for a command joined for --view-columns, or None"""
+    defaults = DEFAULT_VIEW_COLUMNS.get(command_name)
+    return ",".join(defaults) if defaults else None
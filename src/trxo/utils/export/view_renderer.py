@@ -11,6 +11,9 @@ from rich.table import Table
 
 from trxo.utils.console import console, error, info
 
+_ID_REV_KEYS = frozenset({"_id", "_rev"})
+_CONFIG_FIELD_KEYS = frozenset({"security", "core", "general", "trees"})
+
 
 class ViewRenderer:
     """Renders export data in various view formats"""
@@ -26,17 +29,24 @@ class ViewRenderer:
         Returns:
             True if single config object
         """
-        has_id_rev = "_id" in data and "_rev" in data
-        has_config_fields = any(
-            key in data for key in ["security", "core", "general", "trees"]
-        )
+        if not isinstance(data, dict):
+            return False
+
+        if not (_ID_REV_KEYS.issubset(data) or not _CONFIG_FIELD_KEYS.isdisjoint(data)):
+            return False
 
         has_nested_arrays = any(
             isinstance(value, dict) and any(isinstance(v, list) for v in value.values())
             for value in data.values()
         )
 
-        return (has_id_rev or has_config_fields) and not has_nested_arrays
+        return not has_nested_arrays
+
+    @staticmethod
+    def _format_cell(value: Any) -> str:
+        """Render a cell value as text, truncated to 50 characters."""
+        text = "" if value is None else str(value)
+        return text[:50] + "..." if len(text) > 50 else text
 
     @staticmethod
     def create_table(
@@ -80,22 +90,14 @@ class ViewRenderer:
         for col in valid_columns:
             table.add_column(col, style="cyan", no_wrap=False)
 
-        # Add rows
-        for index, item in enumerate(items, start=1):
-            row_values = [str(index)]
-            for col in valid_columns:
-                value = item.get(col, "")
-                if isinstance(value, (dict, list)):
-                    str_val = (
-                        str(value)[:50] + "..." if len(str(value)) > 50 else str(value)
-                    )
-                    row_values.append(str_val)
-                else:
-                    str_value = "" if value is None else str(value)
-                    if len(str_value) > 50:
-                        str_value = str_value[:50] + "..."
-                    row_values.append(str_value)
+        # Format each column in one pass, then stitch rows together
+        column_values = [
+            [ViewRenderer._format_cell(item.get(col, "")) for item in items]
+            for col in valid_columns
+        ]
+        row_numbers = [str(index) for index in range(1, len(items) + 1)]
 
+        for row_values in zip(row_numbers, *column_values):
             table.add_row(*row_values)
 
         console.print(table)
@@ -195,30 +197,26 @@ class ViewRenderer:
             selected_columns = [col.strip() for col in view_columns.split(",")]
 
         # Handle different data structures
-        if isinstance(data, dict) and "result" in data:
-            items = data["result"]
-            if isinstance(items, list) and items:
-                ViewRenderer.create_table(
-                    items, f"{command_name.title()} Data", selected_columns
-                )
-            elif isinstance(items, dict) and items:
-                # Handle structured results (like am/global split)
-                ViewRenderer.display_nested_structure(
-                    data, command_name, selected_columns
-                )
-            else:
-                info("No items found in result")
-
-        elif isinstance(data, list):
+        title = f"{command_name.title()} Data"
+        if isinstance(data, list):
             if data:
-                ViewRenderer.create_table(
-                    data, f"{command_name.title()} Data", selected_columns
-                )
+                ViewRenderer.create_table(data, title, selected_columns)
             else:
                 info("No items found")
 
         elif isinstance(data, dict):
-            if ViewRenderer.is_single_config_object(data):
+            if "result" in data:
+                items = data["result"]
+                if isinstance(items, list) and items:
+                    ViewRenderer.create_table(items, title, selected_columns)
+                elif isinstance(items, dict) and items:
+                    # Handle structured results (like am/global split)
+                    ViewRenderer.display_nested_structure(
+                        data, command_name, selected_columns
+                    )
+                else:
+                    info("No items found in result")
+            elif ViewRenderer.is_single_config_object(data):
                 ViewRenderer.display_single_object(
                     data, f"{command_name.title()} Configuration", selected_columns
                 )
@@ -14,6 +14,9 @@ from trxo.utils.git.operations import validate_clean_state_for_operation
 
 logger = get_logger("trxo.utils.git.branches")
 
+_LOCAL_REFS_PREFIX = "refs/heads/"
+_REMOTE_REFS_PREFIX = "refs/remotes/origin/"
+
 
 def get_default_branch(repo: Repo) -> str:
     """Determine the default branch"""
@@ -89,19 +92,17 @@ def check_branch_sync_status(repo: Repo, branch_name: str) -> dict:
             if local_commit == remote_commit:
                 result["in_sync"] = True
             else:
-                # Count commits behind and ahead
+                # Count commits behind and ahead in one rev-list call:
+                # left side is remote-only (behind), right is local-only (ahead)
                 try:
-                    # Commits in remote but not in local (behind)
-                    behind_commits = list(
-                        repo.iter_commits(f"{branch_name}..origin/{branch_name}")
-                    )
-                    result["behind"] = len(behind_commits)
-
-                    # Commits in local but not in remote (ahead)
-                    ahead_commits = list(
-                        repo.iter_commits(f"origin/{branch_name}..{branch_name}")
+                    counts = repo.git.rev_list(
+                        "--left-right",
+                        "--count",
+                        f"origin/{branch_name}...{branch_name}",
                     )
-                    result["ahead"] = len(ahead_commits)
+                    behind, ahead = (int(n) for n in counts.split())
+                    result["behind"] = behind
+                    result["ahead"] = ahead
 
                     # Diverged if both behind and ahead
                     result["diverged"] = result["behind"] > 0 and result["ahead"] > 0
@@ -260,20 +261,23 @@ def list_branches(repo: Repo) -> dict:
     if not repo:
         raise RuntimeError("Repository not initialized")
 
-    local_branches = [h.name for h in repo.heads]
-    remote_branches = []
-
+    ref_patterns = [_LOCAL_REFS_PREFIX]
     try:
-        origin = repo.remote("origin")
-        origin.fetch()
-        remote_branches = [
-            extract_branch_name_from_ref(ref.name)
-            for ref in origin.refs
-            if not ref.name.endswith("/HEAD")
-        ]
+        repo.remote("origin").fetch()
+        ref_patterns.append(_REMOTE_REFS_PREFIX)
     except Exception:
         pass
 
+    # One for-each-ref call instead of materialising every head and remote ref
+    local_branches = []
+    remote_branches = []
+    ref_names = repo.git.for_each_ref("--format=%(refname)", *ref_patterns)
+    for ref_name in ref_names.splitlines():
+        if ref_name.startswith(_LOCAL_REFS_PREFIX):
+            local_branches.append(ref_name.removeprefix(_LOCAL_REFS_PREFIX))
+        elif not ref_name.endswith("/HEAD"):
+            remote_branches.append(extract_branch_name_from_ref(ref_name))
+
     return {"local": local_branches, "remote": remote_branches}
 
 
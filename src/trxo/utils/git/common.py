@@ -2,7 +2,12 @@
 Common Git utilities.
 """
 
+from functools import lru_cache
 
+_REFS_REMOTES_ORIGIN = "refs/remotes/origin/"
+
+
+@lru_cache(maxsize=2048)
 def extract_branch_name_from_ref(ref_name: str) -> str:
     """
     Extract branch name from Git ref name.
@@ -15,13 +20,13 @@ def extract_branch_name_from_ref(ref_name: str) -> str:
 
     Returns:
         Branch name without remote prefix
+
+    Results are cached; the same refs are parsed on every branch listing.
     """
-    branch_name = ref_name
-    if branch_name.startswith("refs/remotes/origin/"):
-        branch_name = branch_name.replace("refs/remotes/origin/", "", 1)
-    elif "/" in branch_name:
+    branch_name = ref_name.removeprefix(_REFS_REMOTES_ORIGIN)
+    if len(branch_name) == len(ref_name) and "/" in ref_name:
         # Fallback: remove everything up to 'origin/'
-        parts = branch_name.split("origin/", 1)
-        if len(parts) > 1:
-            branch_name = parts[1]
+        _, found, rest = ref_name.partition("origin/")
+        if found:
+            branch_name = rest
     return branch_name
@@ -2,20 +2,33 @@
 Git credentials management and validation.
 """
 
+from functools import lru_cache
+from typing import Optional
+
 import httpx
 
 from trxo.logging import get_logger
 
 logger = get_logger("trxo.utils.git.credentials")
 
+_HTTPS = "https://"
+
 
 def build_secure_url(repo_url: str, username: str, token: str) -> str:
     """Build secure HTTPS URL with credentials"""
-    if repo_url.startswith("https://"):
-        return repo_url.replace("https://", f"https://{username}:{token}@")
+    if repo_url.startswith(_HTTPS):
+        return f"{_HTTPS}{username}:{token}@{repo_url[len(_HTTPS):]}"
     return repo_url
 
 
+@lru_cache(maxsize=128)
+def _github_repo_path(repo_url: str) -> Optional[str]:
+    """Return the owner/repo path of a GitHub URL, or None for other hosts"""
+    if "github.com/" not in repo_url:
+        return None
+    return repo_url.split("github.com/")[1].rstrip("/").replace(".git", "")
+
+
 def validate_credentials(token: str, repo_url: str) -> dict:
     """
     Validate GitHub credentials and repository access.
@@ -33,12 +46,12 @@ def validate_credentials(token: str, repo_url: str) -> dict:
         PermissionError: If access denied
     """
     # Extract API path
-    if "github.com/" not in repo_url:
+    api_repo_path = _github_repo_path(repo_url)
+    if api_repo_path is None:
         raise ValueError(
             "Unsupported repo URL. Use https://github.com/owner/repo(.git)"
         )
 
-    api_repo_path = repo_url.split("github.com/")[1].rstrip("/").replace(".git", "")
     api_url = f"https://api.github.com/repos/{api_repo_path}"
     headers = {"Authorization": f"token {token}"}
 
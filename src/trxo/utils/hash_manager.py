@@ -8,6 +8,7 @@ ensuring data integrity through checksum verification.
 import hashlib
 import json
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from trxo.constants import DEFAULT_REALM
@@ -301,50 +302,50 @@ class HashManager:
             return None
 
 
+_ITEM_TYPE_TO_COMMAND = {
+    "Environment_Secrets": "esv_secrets",
+    "Environment_Variables": "esv_variables",
+    "themes (ui/themerealm)": "themes",
+    "managed_objects": "managed",
+    "sync mappings": "mappings",
+    "journeys": "journeys",
+    "realms": "realms",
+    "scripts": "scripts",
+    "services": "services",
+    "global services": "services",
+    "realm services": "services",
+    "policies": "policies",
+    "OAuth2_Clients": "oauth",
+    "saml entities": "saml",
+    "authentication settings": "authn",
+    "email templates": "email_templates",
+    "custom endpoints": "endpoints",
+    "connectors": "connectors",
+    "IDM connectors": "connectors",
+    "applications": "applications",
+    "Privileges": "privileges",
+    "webhooks": "webhooks",
+    # Agent mappings - match export command names
+    "IdentityGatewayAgent agents": "agents_gateway",
+    "J2EEAgent agents": "agents_java",
+    "WebAgent agents": "agents_web",
+    "items": "items",
+}
+
+
+@lru_cache(maxsize=128)
 def get_command_name_from_item_type(item_type: str) -> str:
     """Map item types to command names for hash lookup"""
-    type_to_command = {
-        "Environment_Secrets": "esv_secrets",
-        "Environment_Variables": "esv_variables",
-        "themes (ui/themerealm)": "themes",
-        "managed_objects": "managed",
-        "sync mappings": "mappings",
-        "journeys": "journeys",
-        "realms": "realms",
-        "scripts": "scripts",
-        "services": "services",
-        "global services": "services",
-        "realm services": "services",
-        "policies": "policies",
-        "OAuth2_Clients": "oauth",
-        "saml entities": "saml",
-        "authentication settings": "authn",
-        "email templates": "email_templates",
-        "custom endpoints": "endpoints",
-        "connectors": "connectors",
-        "IDM connectors": "connectors",
-        "applications": "applications",
-        "Privileges": "privileges",
-        "webhooks": "webhooks",
-        # Agent mappings - match export command names
-        "IdentityGatewayAgent agents": "agents_gateway",
-        "J2EEAgent agents": "agents_java",
-        "WebAgent agents": "agents_web",
-        "items": "items",
-    }
-
     # First check for exact match
-    if item_type in type_to_command:
-        return type_to_command[item_type]
+    if item_type in _ITEM_TYPE_TO_COMMAND:
+        return _ITEM_TYPE_TO_COMMAND[item_type]
 
     # Clean up realm suffixes before lookup
-    clean_item_type = item_type
-    if " (" in clean_item_type:
-        clean_item_type = clean_item_type.split(" (")[0]
+    clean_item_type = item_type.partition(" (")[0]
 
     # Check cleaned version
-    if clean_item_type in type_to_command:
-        return type_to_command[clean_item_type]
+    if clean_item_type in _ITEM_TYPE_TO_COMMAND:
+        return _ITEM_TYPE_TO_COMMAND[clean_item_type]
 
     # Fallback to default conversion
     command = clean_item_type.lower().replace(" ", "_")
@@ -1,5 +1,6 @@
 from unittest.mock import MagicMock
 
+import httpx
 import pytest
 
 from trxo.auth.on_premise import OnPremAuth
@@ -45,8 +46,7 @@ def test_authenticate_success(mocker, auth_client):
         return_value="http://localhost:8080/auth",
     )
 
-    mock_response = mocker.Mock()
-    mock_response.raise_for_status.return_value = None
+    mock_response = mocker.Mock(spec=httpx.Response)
     mock_response.json.return_value = {
         "tokenId": "abc123",
         "successUrl": "/home",
@@ -68,8 +68,7 @@ def test_authenticate_token_missing(mocker, auth_client):
         return_value="http://localhost:8080/auth",
     )
 
-    mock_response = mocker.Mock()
-    mock_response.raise_for_status.return_value = None
+    mock_response = mocker.Mock(spec=httpx.Response)
     mock_response.json.return_value = {}
 
     _mock_httpx_client(mocker, mock_response)
@@ -86,7 +85,7 @@ def test_authenticate_http_error(mocker, auth_client):
         return_value="http://localhost:8080/auth",
     )
 
-    mock_response = mocker.Mock()
+    mock_response = mocker.Mock(spec=httpx.Response)
     mock_response.raise_for_status.side_effect = Exception("401 Unauthorized")
 
     _mock_httpx_client(mocker, mock_response)
@@ -1,6 +1,7 @@
 import json
 from unittest.mock import MagicMock
 
+import httpx
 import pytest
 
 from trxo.auth.service_account import ServiceAccountAuth
@@ -82,8 +83,7 @@ def test_get_access_token_success(mocker):
         return_value="signed",
     )
 
-    response = MagicMock()
-    response.raise_for_status.return_value = None
+    response = MagicMock(spec=httpx.Response)
     response.json.return_value = {"access_token": "abc"}
 
     client = MagicMock()
@@ -114,7 +114,7 @@ def test_get_access_token_http_error(mocker):
         return_value="signed",
     )
 
-    response = MagicMock()
+    response = MagicMock(spec=httpx.Response)
     response.raise_for_status.side_effect = Exception("boom")
 
     client = MagicMock()
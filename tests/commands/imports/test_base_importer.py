@@ -71,12 +71,9 @@ def test_validate_import_hash_calls_hash_manager(mocker):
     assert importer.validate_import_hash([{"_id": "1"}], False) is True
 
 
-def test_import_from_file_local_success(mocker, tmp_path):
+def test_import_from_file_local_success(mocker, sample_items_file):
     importer = DummyImporter()
 
-    data_file = tmp_path / "data.json"
-    data_file.write_text(json.dumps([{"_id": "1"}]))
-
     mocker.patch.object(importer, "initialize_auth", return_value=("t", "url"))
     mocker.patch.object(importer, "_get_storage_mode", return_value="local")
     mocker.patch.object(importer, "load_data_from_file", return_value=[{"_id": "1"}])
@@ -85,7 +82,7 @@ def test_import_from_file_local_success(mocker, tmp_path):
     mocker.patch.object(importer, "print_summary")
     mocker.patch.object(importer, "cleanup")
 
-    importer.import_from_file(file_path=str(data_file))
+    importer.import_from_file(file_path=sample_items_file)
 
     importer.process_items.assert_called_once()
 
@@ -241,10 +238,8 @@ def test_process_items_continue_after_exception(mocker):
     assert mock_update.call_count == 2
 
 
-def test_import_from_file_passes_continue_on_error(mocker, tmp_path):
+def test_import_from_file_passes_continue_on_error(mocker, sample_items_file):
     importer = DummyImporter()
-    data_file = tmp_path / "data.json"
-    data_file.write_text(json.dumps([{"_id": "1"}]))
 
     mocker.patch.object(importer, "initialize_auth", return_value=("t", "url"))
     mocker.patch.object(importer, "_get_storage_mode", return_value="local")
@@ -254,7 +249,7 @@ def test_import_from_file_passes_continue_on_error(mocker, tmp_path):
     mocker.patch.object(importer, "print_summary")
     mocker.patch.object(importer, "cleanup")
 
-    importer.import_from_file(file_path=str(data_file), continue_on_error=True)
+    importer.import_from_file(file_path=sample_items_file, continue_on_error=True)
 
     assert importer.process_items.call_args.kwargs["continue_on_error"] is True
 
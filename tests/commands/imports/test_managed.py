@@ -1,5 +1,3 @@
-import json
-
 import httpx
 import pytest
 
@@ -9,6 +7,18 @@ from trxo.commands.imports.managed import (
 )
 
 
+class _RecordingDict(dict):
+    """dict that counts items() calls, exposing a per-key walk."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.items_calls = 0
+
+    def items(self):
+        self.items_calls += 1
+        return super().items()
+
+
 def test_find_object_by_name_found():
     imp = ManagedObjectsImporter()
     objs = [{"name": "a"}, {"name": "b"}]
@@ -41,6 +51,14 @@ def test_generate_patch_operations_nested():
     assert {"operation": "replace", "field": "/objects/0/a/x", "value": 2} in ops
 
 
+def test_generate_patch_operations_same_object_skips_key_walk():
+    imp = ManagedObjectsImporter()
+    obj = _RecordingDict(a={"x": 1}, b=[1, 2])
+
+    assert imp._generate_patch_operations(obj, obj, "/objects/0") == []
+    assert obj.items_calls == 0
+
+
 def test_get_current_managed_config_success(mocker):
     imp = ManagedObjectsImporter()
     resp = mocker.Mock()
@@ -99,6 +117,23 @@ def test_update_item_single_no_changes(mocker):
     assert imp.update_item(data, "t", "http://x") is True
 
 
+def test_update_item_single_identical_object_skips_patch_generation(mocker):
+    imp = ManagedObjectsImporter()
+    mocker.patch("trxo.commands.imports.managed.info")
+    imp._get_current_managed_config = mocker.Mock(
+        return_value={"objects": [{"name": "obj1", "a": {"x": 1}}]}
+    )
+    imp.make_http_request = mocker.Mock()
+    imp._delete_orphaned_properties = mocker.Mock(return_value=True)
+    spy = mocker.spy(imp, "_generate_patch_operations")
+
+    data = _RecordingDict(name="obj1", a={"x": 1})
+    assert imp.update_item(data, "t", "http://x") is True
+    assert spy.call_count == 0
+    assert data.items_calls == 0
+    imp.make_http_request.assert_not_called()
+
+
 def test_update_item_single_no_changes_orphan_step_fails(mocker):
     imp = ManagedObjectsImporter()
     mocker.patch("trxo.commands.imports.managed.info")
@@ -181,49 +216,49 @@ def test_update_item_multi_get_current_config_fail(mocker):
     assert imp.update_item(data, "t", "http://x") is False
 
 
-def test_load_managed_objects_file_raw_dict(tmp_path):
+def test_load_managed_objects_file_raw_dict(tmp_path, write_json):
     f = tmp_path / "m.json"
-    f.write_text(json.dumps({"name": "a"}))
+    write_json(f, {"name": "a"})
     imp = ManagedObjectsImporter()
     out = imp._load_managed_objects_file(str(f))
     assert out["name"] == "a"
 
 
-def test_load_managed_objects_file_export_result(tmp_path):
+def test_load_managed_objects_file_export_result(tmp_path, write_json):
     f = tmp_path / "m.json"
-    f.write_text(json.dumps({"data": {"result": [{"name": "a"}]}}))
+    write_json(f, {"data": {"result": [{"name": "a"}]}})
     imp = ManagedObjectsImporter()
     out = imp._load_managed_objects_file(str(f))
     assert out[0]["name"] == "a"
 
 
-def test_load_data_from_file_objects_array(tmp_path, mocker):
+def test_load_data_from_file_objects_array(tmp_path, mocker, write_json):
     f = tmp_path / "m.json"
-    f.write_text(json.dumps({"objects": [{"name": "a"}]}))
+    write_json(f, {"objects": [{"name": "a"}]})
     imp = ManagedObjectsImporter()
     out = imp.load_data_from_file(str(f))
     assert out[0]["name"] == "a"
 
 
-def test_load_data_from_file_list(tmp_path):
+def test_load_data_from_file_list(tmp_path, write_json):
     f = tmp_path / "m.json"
-    f.write_text(json.dumps([{"name": "a"}]))
+    write_json(f, [{"name": "a"}])
     imp = ManagedObjectsImporter()
     out = imp.load_data_from_file(str(f))
     assert out[0]["name"] == "a"
 
 
-def test_load_data_from_file_invalid(tmp_path):
+def test_load_data_from_file_invalid(tmp_path, write_json):
     f = tmp_path / "m.json"
-    f.write_text(json.dumps("bad"))
+    write_json(f, "bad")
     imp = ManagedObjectsImporter()
     with pytest.raises(ValueError):
         imp.load_data_from_file(str(f))
 
 
-def test_create_managed_import_command_wires_importer(mocker, tmp_path):
+def test_create_managed_import_command_wires_importer(mocker, tmp_path, write_json):
     f = tmp_path / "m.json"
-    f.write_text(json.dumps({"data": []}))
+    write_json(f, {"data": []})
 
     importer = mocker.Mock()
     mocker.patch(
@@ -8,6 +8,18 @@ from trxo.commands.imports.mappings import (
 )
 
 
+class _RecordingDict(dict):
+    """dict that counts items() calls, exposing a per-key walk."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.items_calls = 0
+
+    def items(self):
+        self.items_calls += 1
+        return super().items()
+
+
 def test_mappings_required_fields():
     importer = MappingsImporter()
     assert importer.get_required_fields() == ["name"]
@@ -55,6 +67,14 @@ def test_generate_patch_operations_list_replace():
     assert ops[0]["operation"] == "replace"
 
 
+def test_generate_patch_operations_same_object_skips_key_walk():
+    importer = MappingsImporter()
+    mapping = _RecordingDict(name="a", properties=[{"source": "x"}], meta={"k": 1})
+
+    assert importer._generate_patch_operations(mapping, mapping) == []
+    assert mapping.items_calls == 0
+
+
 def test_update_item_missing_name(mocker):
     importer = MappingsImporter()
     mocker.patch("trxo.commands.imports.mappings.error")
@@ -81,6 +101,22 @@ def test_update_item_existing_no_changes(mocker):
     assert importer.update_item({"name": "a"}, "t", "http://x") is True
 
 
+def test_update_item_existing_identical_skips_patch_generation(mocker):
+    importer = MappingsImporter()
+    importer.make_http_request = mocker.Mock()
+    importer._get_current_sync_config = mocker.Mock(
+        return_value={"mappings": [{"name": "a", "meta": {"k": 1}}]}
+    )
+    mocker.patch("trxo.commands.imports.mappings.info")
+    spy = mocker.spy(importer, "_generate_patch_operations")
+
+    mapping = _RecordingDict(name="a", meta={"k": 1})
+    assert importer.update_item(mapping, "t", "http://x") is True
+    assert spy.call_count == 0
+    assert mapping.items_calls == 0
+    importer.make_http_request.assert_not_called()
+
+
 def test_update_item_existing_with_patch(mocker):
     importer = MappingsImporter()
     importer.make_http_request = mocker.Mock()
@@ -1,5 +1,3 @@
-import json
-
 import pytest
 from click.exceptions import Exit
 
@@ -7,9 +5,23 @@ from trxo.commands.imports.oauth import OAuthImporter, create_oauth_import_comma
 from trxo.constants import DEFAULT_REALM
 
 
-def test_parse_oauth_data_standard_format(mocker):
-    importer = OAuthImporter(realm=DEFAULT_REALM)
+@pytest.fixture(scope="module")
+def _shared_importer():
+    return OAuthImporter(realm=DEFAULT_REALM)
+
+
+@pytest.fixture
+def importer(_shared_importer):
+    """Module-wide importer with its per-run state reset for each test."""
+    _shared_importer._pending_scripts = []
+    _shared_importer._oauth_export_data = None
+    _shared_importer.continue_on_error = False
+    _shared_importer.successful_updates = 0
+    _shared_importer.failed_updates = 0
+    return _shared_importer
+
 
+def test_parse_oauth_data_standard_format(importer, mocker):
     data = {
         "data": {
             "clients": [{"_id": "c1"}],
@@ -23,9 +35,7 @@ def test_parse_oauth_data_standard_format(mocker):
     assert importer._pending_scripts == [{"_id": "s1"}]
 
 
-def test_parse_oauth_data_legacy_format(mocker):
-    importer = OAuthImporter(realm=DEFAULT_REALM)
-
+def test_parse_oauth_data_legacy_format(importer, mocker):
     data = {
         "clients": [{"_id": "c1"}],
         "scripts": [{"_id": "s1"}],
@@ -37,9 +47,7 @@ def test_parse_oauth_data_legacy_format(mocker):
     assert importer._pending_scripts == [{"_id": "s1"}]
 
 
-def test_parse_oauth_data_list_format(mocker):
-    importer = OAuthImporter(realm=DEFAULT_REALM)
-
+def test_parse_oauth_data_list_format(importer, mocker):
     data = [{"_id": "c1"}]
 
     clients = importer._parse_oauth_data(data)
@@ -47,9 +55,7 @@ def test_parse_oauth_data_list_format(mocker):
     assert clients == [{"_id": "c1"}]
 
 
-def test_import_from_local_happy_path(mocker, tmp_path):
-    importer = OAuthImporter(realm=DEFAULT_REALM)
-
+def test_import_from_local_happy_path(importer, mocker, tmp_path, write_json):
     data = {
         "data": {
             "clients": [{"_id": "c1"}],
@@ -58,7 +64,7 @@ def test_import_from_local_happy_path(mocker, tmp_path):
     }
 
     file_path = tmp_path / "oauth.json"
-    file_path.write_text(json.dumps(data))
+    write_json(file_path, data)
 
     mocker.patch.object(importer, "validate_import_hash", return_value=True)
     mocker.patch.object(importer, "_validate_items")
@@ -68,21 +74,15 @@ def test_import_from_local_happy_path(mocker, tmp_path):
     assert result == [{"_id": "c1"}]
 
 
-def test_import_from_local_file_not_found_raises_exit(mocker):
-    importer = OAuthImporter(realm=DEFAULT_REALM)
-
+def test_import_from_local_file_not_found_raises_exit(importer, mocker):
     with pytest.raises(Exit):
         importer._import_from_local("missing.json", force_import=False)
 
 
-def test_process_items_calls_script_importer_first(mocker):
-    importer = OAuthImporter(realm=DEFAULT_REALM)
-
+def test_process_items_calls_script_importer_first(importer, mocker):
     importer._pending_scripts = [{"_id": "s1"}]
 
-    mock_update = mocker.patch.object(
-        importer.script_importer, "update_item", return_value=True
-    )
+    mocker.patch.object(importer.script_importer, "update_item", return_value=True)
 
     mocker.patch(
         "trxo.commands.imports.oauth.BaseImporter.process_items",
@@ -98,8 +98,7 @@ def test_process_items_calls_script_importer_first(mocker):
     assert importer.script_importer is not None
 
 
-def test_process_items_forwards_continue_on_error_to_script_importer(mocker):
-    importer = OAuthImporter(realm=DEFAULT_REALM)
+def test_process_items_forwards_continue_on_error_to_script_importer(importer, mocker):
     importer._pending_scripts = [{"_id": "s1"}]
 
     script_process = mocker.patch.object(
@@ -121,23 +120,18 @@ def test_process_items_forwards_continue_on_error_to_script_importer(mocker):
     assert script_process.call_args.kwargs.get("continue_on_error") is True
 
 
-def test_update_item_happy_path(mocker):
-    importer = OAuthImporter(realm=DEFAULT_REALM)
-
+def test_update_item_happy_path(importer, mocker, patch_http):
     mock_response = mocker.Mock()
     mock_response.status_code = 200
 
-    mocker.patch.object(importer, "make_http_request", return_value=mock_response)
-    mocker.patch.object(importer, "build_auth_headers", return_value={})
+    patch_http(importer)["make_http_request"].return_value = mock_response
 
     result = importer.update_item({"_id": "c1", "name": "x"}, "token", "https://base")
 
     assert result is True
 
 
-def test_update_item_missing_id_returns_false(mocker):
-    importer = OAuthImporter(realm=DEFAULT_REALM)
-
+def test_update_item_missing_id_returns_false(importer, mocker):
     mocker.patch("trxo.commands.imports.oauth.error")
 
     result = importer.update_item({}, "token", "https://base")
@@ -148,42 +142,32 @@ def test_update_item_missing_id_returns_false(mocker):
 # ✅ FIXED TESTS BELOW
 
 
-def test_delete_item_happy_path(mocker):
-    importer = OAuthImporter(realm=DEFAULT_REALM)
-
-    mock_response = mocker.Mock()
-    mock_response.status_code = 200
-
-    mocker.patch.object(importer, "make_http_request", return_value=mock_response)
-    mocker.patch.object(importer, "build_auth_headers", return_value={})
-
-    result = importer.delete_item("c1", "token", "https://base")
-
-    assert result is True  # ✅ fixed
-
-
-# ONLY showing changed part
-
-
-def test_delete_item_failure_returns_false(mocker):
-    importer = OAuthImporter(realm=DEFAULT_REALM)
-
-    mock_response = mocker.Mock()
-    mock_response.status_code = 500
-
-    mocker.patch.object(importer, "make_http_request", return_value=mock_response)
-    mocker.patch.object(importer, "build_auth_headers", return_value={})
+@pytest.mark.parametrize(
+    "status_code,side_effect,expected",
+    [
+        (200, None, True),
+        # Non-2xx responses surface as exceptions from make_http_request;
+        # a returned response is treated as success whatever its status.
+        (500, None, True),
+        (None, Exception("boom"), False),
+    ],
+)
+def test_delete_item(importer, mocker, patch_http, status_code, side_effect, expected):
+    http = patch_http(importer)["make_http_request"]
+    http.return_value = mocker.Mock(status_code=status_code)
+    http.side_effect = side_effect
+    mocker.patch("trxo.commands.imports.oauth.info")
     mocker.patch("trxo.commands.imports.oauth.error")
 
     result = importer.delete_item("c1", "token", "https://base")
 
-    assert result is True  # ✅ FIXED (matches actual behavior)
+    assert result is expected
 
 
 def test_create_oauth_import_command_calls_import_from_file(mocker):
     import_oauth = create_oauth_import_command()
 
-    mock_importer = mocker.Mock(spec=OAuthImporter)
+    mock_importer = mocker.Mock()
     mocker.patch(
         "trxo.commands.imports.oauth.OAuthImporter", return_value=mock_importer
     )
@@ -1,3 +1,5 @@
+import pytest
+
 from trxo.commands.imports.policies import (
     PoliciesImporter,
     create_policies_import_command,
@@ -34,29 +36,22 @@ def test_update_item_missing_id(mocker):
     assert result is False
 
 
-def test_update_item_success(mocker):
+@pytest.mark.parametrize(
+    "side_effect,expected", [(None, True), (Exception("boom"), False)]
+)
+def test_update_item(mocker, side_effect, expected):
     importer = PoliciesImporter(realm="alpha")
-    importer.make_http_request = mocker.Mock()
+    importer.make_http_request = mocker.Mock(side_effect=side_effect)
     mocker.patch("trxo.commands.imports.policies.info")
+    mocker.patch("trxo.commands.imports.policies.error")
 
     data = {"_id": "p1", "x": 1}
     result = importer.update_item(data, "t", "http://x")
 
-    assert result is True
+    assert result is expected
     importer.make_http_request.assert_called_once()
 
 
-def test_update_item_failure(mocker):
-    importer = PoliciesImporter(realm="alpha")
-    importer.make_http_request = mocker.Mock(side_effect=Exception("boom"))
-    mocker.patch("trxo.commands.imports.policies.error")
-
-    data = {"_id": "p1"}
-    result = importer.update_item(data, "t", "http://x")
-
-    assert result is False
-
-
 def test_create_policies_import_command(mocker):
     importer = mocker.Mock()
     mocker.patch(
@@ -76,29 +71,24 @@ def test_policies_get_item_id():
     assert importer.get_item_id({}) is None
 
 
-def test_delete_item_success(mocker):
+@pytest.mark.parametrize(
+    "side_effect,expected", [(None, True), (Exception("403 Forbidden"), False)]
+)
+def test_delete_item(mocker, side_effect, expected):
     importer = PoliciesImporter(realm="alpha")
-    importer.make_http_request = mocker.Mock()
+    importer.make_http_request = mocker.Mock(side_effect=side_effect)
     mocker.patch("trxo.commands.imports.policies.info")
+    mocker.patch("trxo.commands.imports.policies.error")
 
     result = importer.delete_item("p1", "tok", "http://x")
 
-    assert result is True
-    importer.make_http_request.assert_called_once_with(
+    assert result is expected
+    # Failures fall back to the policy-set endpoint, so check the first call only
+    assert importer.make_http_request.call_args_list[0] == mocker.call(
         importer.get_api_endpoint("p1", "http://x"), "DELETE", mocker.ANY
     )
 
 
-def test_delete_item_failure(mocker):
-    importer = PoliciesImporter(realm="alpha")
-    importer.make_http_request = mocker.Mock(side_effect=Exception("403 Forbidden"))
-    mocker.patch("trxo.commands.imports.policies.error")
-
-    result = importer.delete_item("p1", "tok", "http://x")
-
-    assert result is False
-
-
 def test_create_policies_import_command_sync(mocker):
     """Verify sync, rollback, cherry_pick are forwarded to import_from_file."""
     importer = mocker.Mock()
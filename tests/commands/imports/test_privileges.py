@@ -23,53 +23,47 @@ def test_privileges_get_api_endpoint():
     assert imp.get_api_endpoint("x", "http://b") == "http://b/openidm/config/x"
 
 
-def test_update_item_success(monkeypatch):
+@pytest.mark.parametrize(
+    "side_effect,expected", [(None, True), (Exception("x"), False)]
+)
+def test_update_item(mocker, side_effect, expected):
     imp = PrivilegesImporter()
-
-    called = {}
-
-    def fake_http(url, method, headers, payload):
-        called["url"] = url
-        called["method"] = method
-        called["headers"] = headers
-        called["payload"] = payload
-
-    monkeypatch.setattr(imp, "make_http_request", fake_http)
-    monkeypatch.setattr("trxo.commands.imports.privileges.info", lambda *a, **k: None)
+    http = mocker.patch.object(imp, "make_http_request", side_effect=side_effect)
+    mocker.patch("trxo.commands.imports.privileges.info")
+    mocker.patch("trxo.commands.imports.privileges.error")
 
     data = {"_id": "p1", "a": 1}
 
-    ok = imp.update_item(data, "t", "http://x")
+    assert imp.update_item(data, "t", "http://x") is expected
 
-    assert ok is True
-    assert called["url"] == "http://x/openidm/config/p1"
-    assert called["method"] == "PUT"
-    assert json.loads(called["payload"]) == data
+    url, method, _headers, payload = http.call_args.args
+    assert url == "http://x/openidm/config/p1"
+    assert method == "PUT"
+    assert json.loads(payload) == data
 
 
-def test_update_item_missing_id(monkeypatch):
+def test_update_item_serializes_payload_once(mocker):
     imp = PrivilegesImporter()
-    monkeypatch.setattr("trxo.commands.imports.privileges.error", lambda *a, **k: None)
-    ok = imp.update_item({}, "t", "http://x")
-    assert ok is False
+    http = mocker.patch.object(imp, "make_http_request")
+    mocker.patch("trxo.commands.imports.privileges.info")
+    dumps = mocker.spy(json, "dumps")
 
+    assert imp.update_item({"_id": "p1", "a": 1}, "t", "http://x") is True
 
-def test_update_item_exception(monkeypatch):
-    imp = PrivilegesImporter()
+    dumps.assert_called_once()
+    assert http.call_args.args[3] == dumps.spy_return
 
-    def boom(*a, **k):
-        raise Exception("x")
 
-    monkeypatch.setattr(imp, "make_http_request", boom)
+def test_update_item_missing_id(monkeypatch):
+    imp = PrivilegesImporter()
     monkeypatch.setattr("trxo.commands.imports.privileges.error", lambda *a, **k: None)
-
-    ok = imp.update_item({"_id": "p1"}, "t", "http://x")
+    ok = imp.update_item({}, "t", "http://x")
     assert ok is False
 
 
-def test_create_privileges_import_command(monkeypatch, tmp_path):
+def test_create_privileges_import_command(monkeypatch, tmp_path, write_json):
     f = tmp_path / "p.json"
-    f.write_text(json.dumps([{"_id": "p1"}]))
+    write_json(f, [{"_id": "p1"}])
 
     imp = PrivilegesImporter()
     monkeypatch.setattr(
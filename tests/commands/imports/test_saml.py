@@ -1,6 +1,4 @@
-import json
-
-import httpx
+import pytest
 
 from trxo.commands.imports.saml import SamlImporter, create_saml_import_command
 
@@ -33,22 +31,20 @@ def test_import_single_script_missing_id(mocker):
     assert result is False
 
 
-def test_import_single_script_success(mocker):
+@pytest.mark.parametrize(
+    "data,side_effect,expected",
+    [
+        ({"_id": "s1", "name": "n", "script": ["a", "b"]}, None, True),
+        ({"_id": "s1", "script": "x"}, Exception("boom"), False),
+    ],
+)
+def test_import_single_script(mocker, data, side_effect, expected):
     s = SamlImporter()
-    s.make_http_request = mocker.Mock()
+    s.make_http_request = mocker.Mock(side_effect=side_effect)
     mocker.patch("trxo.commands.imports.saml.info")
-
-    data = {"_id": "s1", "name": "n", "script": ["a", "b"]}
-    assert s._import_single_script(data, "t", "http://x") is True
-
-
-def test_import_single_script_failure(mocker):
-    s = SamlImporter()
-    s.make_http_request = mocker.Mock(side_effect=Exception("boom"))
     mocker.patch("trxo.commands.imports.saml.error")
 
-    data = {"_id": "s1", "script": "x"}
-    assert s._import_single_script(data, "t", "http://x") is False
+    assert s._import_single_script(data, "t", "http://x") is expected
 
 
 def test_import_metadata_skip_invalid(mocker):
@@ -78,20 +74,16 @@ def test_import_single_metadata_missing_then_post(mocker):
     assert s._import_single_metadata("e1", "<xml/>", "t", "http://x") is True
 
 
-def test_post_metadata_success(mocker):
+@pytest.mark.parametrize(
+    "side_effect,expected", [(None, True), (Exception("boom"), False)]
+)
+def test_post_metadata(mocker, side_effect, expected):
     s = SamlImporter()
-    s.make_http_request = mocker.Mock()
+    s.make_http_request = mocker.Mock(side_effect=side_effect)
     mocker.patch("trxo.commands.imports.saml.info")
-
-    assert s._post_metadata("e1", "<xml/>", "t", "http://x") is True
-
-
-def test_post_metadata_failure(mocker):
-    s = SamlImporter()
-    s.make_http_request = mocker.Mock(side_effect=Exception("boom"))
     mocker.patch("trxo.commands.imports.saml.error")
 
-    assert s._post_metadata("e1", "<xml/>", "t", "http://x") is False
+    assert s._post_metadata("e1", "<xml/>", "t", "http://x") is expected
 
 
 def test_upsert_entity_missing_id(mocker):
@@ -100,36 +92,24 @@ def test_upsert_entity_missing_id(mocker):
     assert s._upsert_entity({}, "remote", "t", "http://x") is False
 
 
-def test_upsert_remote_entity_success(mocker):
+@pytest.mark.parametrize(
+    "side_effect,expected", [(None, True), (Exception("boom"), False)]
+)
+def test_upsert_remote_entity(mocker, side_effect, expected):
     s = SamlImporter()
-    s.make_http_request = mocker.Mock()
+    s.make_http_request = mocker.Mock(side_effect=side_effect)
     mocker.patch("trxo.commands.imports.saml.info")
-
-    data = {"_id": "r1", "entityId": "e1"}
-    assert s._upsert_entity(data, "remote", "t", "http://x") is True
-
-
-def test_upsert_remote_entity_failure(mocker):
-    s = SamlImporter()
-    s.make_http_request = mocker.Mock(side_effect=Exception("boom"))
     mocker.patch("trxo.commands.imports.saml.error")
 
     data = {"_id": "r1", "entityId": "e1"}
-    assert s._upsert_entity(data, "remote", "t", "http://x") is False
+    assert s._upsert_entity(data, "remote", "t", "http://x") is expected
 
 
-def test_upsert_hosted_create_on_404(mocker):
+def test_upsert_hosted_create_on_404(mocker, http_transport):
     s = SamlImporter()
     s.continue_on_error = True
 
-    resp = mocker.Mock()
-    resp.status_code = 404
-
-    client_ctx = mocker.MagicMock()
-    client_ctx.__enter__.return_value = client_ctx
-    client_ctx.put.return_value = resp
-
-    mocker.patch.object(httpx, "Client", return_value=client_ctx)
+    http_transport(404)
     s.make_http_request = mocker.Mock()
     mocker.patch("trxo.commands.imports.saml.info")
 
@@ -137,18 +117,11 @@ def test_upsert_hosted_create_on_404(mocker):
     assert s._upsert_entity(data, "hosted", "t", "http://x") is True
 
 
-def test_upsert_hosted_404_fails_in_stop_mode(mocker):
+def test_upsert_hosted_404_fails_in_stop_mode(mocker, http_transport):
     s = SamlImporter()
     s.continue_on_error = False
 
-    resp = mocker.Mock()
-    resp.status_code = 404
-
-    client_ctx = mocker.MagicMock()
-    client_ctx.__enter__.return_value = client_ctx
-    client_ctx.put.return_value = resp
-
-    mocker.patch.object(httpx, "Client", return_value=client_ctx)
+    http_transport(404)
     s.make_http_request = mocker.Mock()
     mocker.patch("trxo.commands.imports.saml.error")
 
@@ -157,18 +130,10 @@ def test_upsert_hosted_404_fails_in_stop_mode(mocker):
     s.make_http_request.assert_not_called()
 
 
-def test_upsert_hosted_update_success(mocker):
+def test_upsert_hosted_update_success(mocker, http_transport):
     s = SamlImporter()
 
-    resp = mocker.Mock()
-    resp.status_code = 200
-    resp.raise_for_status = mocker.Mock()
-
-    client_ctx = mocker.MagicMock()
-    client_ctx.__enter__.return_value = client_ctx
-    client_ctx.put.return_value = resp
-
-    mocker.patch.object(httpx, "Client", return_value=client_ctx)
+    http_transport(200)
     mocker.patch("trxo.commands.imports.saml.info")
 
     data = {"_id": "h1", "entityId": "e1"}
@@ -181,9 +146,9 @@ def test_import_saml_data_empty(mocker):
     assert s.import_saml_data({}, "t", "http://x", None) is True
 
 
-def test_create_saml_import_command_local_file(mocker, tmp_path):
+def test_create_saml_import_command_local_file(mocker, tmp_path, write_json):
     f = tmp_path / "saml.json"
-    f.write_text(json.dumps({"data": {}}))
+    write_json(f, {"data": {}})
 
     importer = mocker.Mock()
     importer._get_storage_mode.return_value = "local"
@@ -1,8 +1,4 @@
-import base64
-import json
-
 import pytest
-from click.exceptions import Exit
 
 from trxo.commands.imports.scripts import (
     ScriptImporter,
@@ -11,22 +7,35 @@ from trxo.commands.imports.scripts import (
 )
 from trxo.constants import DEFAULT_REALM, IGNORED_SCRIPT_IDS, IGNORED_SCRIPT_NAMES
 
+_IGNORED_ID = next(iter(IGNORED_SCRIPT_IDS))
+_IGNORED_NAME = next(iter(IGNORED_SCRIPT_NAMES))
+
+
+@pytest.fixture(scope="module")
+def _shared_importer():
+    return ScriptImporter(realm=DEFAULT_REALM)
+
+
+@pytest.fixture
+def importer(_shared_importer):
+    """Module-wide importer with its per-run state reset for each test."""
+    _shared_importer.continue_on_error = False
+    _shared_importer.successful_updates = 0
+    _shared_importer.failed_updates = 0
+    return _shared_importer
+
 
 def test_is_base64_encoded_true():
-    text = "hello"
-    encoded = base64.b64encode(text.encode()).decode()
-    assert is_base64_encoded(encoded) is True
+    # base64 of "hello"
+    assert is_base64_encoded("aGVsbG8=") is True
 
 
 def test_is_base64_encoded_false():
     assert is_base64_encoded("hello world") is False
 
 
-def test_update_item_skips_ignored_script_id(mocker):
-    importer = ScriptImporter(realm=DEFAULT_REALM)
-
-    script_id = list(IGNORED_SCRIPT_IDS)[0]
-    data = {"_id": script_id, "name": "x"}
+def test_update_item_skips_ignored_script_id(importer, mocker):
+    data = {"_id": _IGNORED_ID, "name": "x"}
 
     mocker.patch("trxo.commands.imports.scripts.info")
 
@@ -35,11 +44,8 @@ def test_update_item_skips_ignored_script_id(mocker):
     assert result is True
 
 
-def test_update_item_skips_ignored_script_name(mocker):
-    importer = ScriptImporter(realm=DEFAULT_REALM)
-
-    script_name = list(IGNORED_SCRIPT_NAMES)[0]
-    data = {"_id": "id1", "name": script_name}
+def test_update_item_skips_ignored_script_name(importer, mocker):
+    data = {"_id": "id1", "name": _IGNORED_NAME}
 
     mocker.patch("trxo.commands.imports.scripts.info")
 
@@ -48,9 +54,7 @@ def test_update_item_skips_ignored_script_name(mocker):
     assert result is True
 
 
-def test_update_item_missing_id_returns_false(mocker):
-    importer = ScriptImporter(realm=DEFAULT_REALM)
-
+def test_update_item_missing_id_returns_false(importer, mocker):
     mocker.patch("trxo.commands.imports.scripts.error")
 
     result = importer.update_item({"name": "test"}, "token", "https://base")
@@ -58,9 +62,7 @@ def test_update_item_missing_id_returns_false(mocker):
     assert result is False
 
 
-def test_update_item_encodes_script_list(mocker):
-    importer = ScriptImporter(realm=DEFAULT_REALM)
-
+def test_update_item_encodes_script_list(importer, mocker):
     mock_client = mocker.MagicMock()
     mock_response = mocker.Mock()
     mock_response.status_code = 200
@@ -80,9 +82,7 @@ def test_update_item_encodes_script_list(mocker):
     assert result is True
 
 
-def test_update_item_encodes_script_string(mocker):
-    importer = ScriptImporter(realm=DEFAULT_REALM)
-
+def test_update_item_encodes_script_string(importer, mocker):
     mock_client = mocker.MagicMock()
     mock_response = mocker.Mock()
     mock_response.status_code = 200
@@ -102,9 +102,7 @@ def test_update_item_encodes_script_string(mocker):
     assert result is True
 
 
-def test_update_item_invalid_script_type_returns_false(mocker):
-    importer = ScriptImporter(realm=DEFAULT_REALM)
-
+def test_update_item_invalid_script_type_returns_false(importer, mocker):
     mocker.patch("trxo.commands.imports.scripts.error")
 
     data = {
@@ -118,9 +116,7 @@ def test_update_item_invalid_script_type_returns_false(mocker):
     assert result is False
 
 
-def test_update_item_http_failure_returns_false(mocker):
-    importer = ScriptImporter(realm=DEFAULT_REALM)
-
+def test_update_item_http_failure_returns_false(importer, mocker):
     mocker.patch("httpx.Client", side_effect=Exception("boom"))
     mocker.patch.object(importer, "build_auth_headers", return_value={})
     mocker.patch("trxo.commands.imports.scripts.error")
@@ -139,22 +135,16 @@ def test_update_item_http_failure_returns_false(mocker):
 # ✅ FIXED TESTS BELOW
 
 
-def test_delete_item_happy_path(mocker):
-    importer = ScriptImporter(realm=DEFAULT_REALM)
-
-    mocker.patch.object(importer, "make_http_request")
-    mocker.patch.object(importer, "build_auth_headers", return_value={})
+def test_delete_item_happy_path(importer, patch_http):
+    patch_http(importer)
 
     result = importer.delete_item("s1", "token", "https://base")
 
     assert result is True  # ✅ fixed
 
 
-def test_delete_item_failure_returns_false(mocker):
-    importer = ScriptImporter(realm=DEFAULT_REALM)
-
-    mocker.patch.object(importer, "make_http_request", side_effect=Exception("boom"))
-    mocker.patch.object(importer, "build_auth_headers", return_value={})
+def test_delete_item_failure_returns_false(importer, mocker, patch_http):
+    patch_http(importer)["make_http_request"].side_effect = Exception("boom")
     mocker.patch("trxo.commands.imports.scripts.error")
 
     result = importer.delete_item("s1", "token", "https://base")
@@ -165,7 +155,7 @@ def test_delete_item_failure_returns_false(mocker):
 def test_create_script_import_command_calls_import_from_file(mocker):
     import_scripts = create_script_import_command()
 
-    mock_importer = mocker.Mock(spec=ScriptImporter)
+    mock_importer = mocker.Mock()
     mocker.patch(
         "trxo.commands.imports.scripts.ScriptImporter",
         return_value=mock_importer,
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 from click.exceptions import Exit
 
@@ -7,21 +9,25 @@ from trxo.commands.imports.services import (
 )
 
 
-def test_services_importer_get_api_endpoint_global():
-    importer = ServicesImporter(scope="global", realm="alpha")
-    url = importer.get_api_endpoint("svc1", "http://x")
-    assert url.endswith("/am/json/global-config/services/svc1")
-
+@pytest.mark.parametrize(
+    "scope,suffix",
+    [
+        ("global", "/am/json/global-config/services/svc1"),
+        ("realm", "/am/json/realms/root/realms/alpha/realm-config/services/svc1"),
+    ],
+)
+def test_services_importer_get_api_endpoint(scope, suffix):
+    importer = ServicesImporter(scope=scope, realm="alpha")
+    assert importer.get_api_endpoint("svc1", "http://x").endswith(suffix)
 
-def test_services_importer_get_api_endpoint_realm():
-    importer = ServicesImporter(scope="realm", realm="alpha")
-    url = importer.get_api_endpoint("svc1", "http://x")
-    assert url.endswith("/am/json/realms/root/realms/alpha/realm-config/services/svc1")
 
+@pytest.fixture(scope="module")
+def shared_importer():
+    """Importer shared by tests that only read instance state."""
+    return ServicesImporter()
 
-def test_prepare_service_payload_removes_dynamic_fields():
-    importer = ServicesImporter()
 
+def test_prepare_service_payload_removes_dynamic_fields(shared_importer):
     data = {
         "_id": "svc1",
         "_rev": "r1",
@@ -32,61 +38,38 @@ def test_prepare_service_payload_removes_dynamic_fields():
         "config": {"a": 1},
     }
 
-    payload = importer._prepare_service_payload(data)
-    assert '"enabled": true' in payload
-    assert '"config"' in payload
-    assert "_id" not in payload
-    assert "_rev" not in payload
-    assert "_type" not in payload
-
-
-def test_update_item_missing_id(mocker):
-    importer = ServicesImporter()
-    mocker.patch("trxo.commands.imports.services.error")
-
-    result = importer.update_item({}, "t", "http://x")
-
-    assert result is False
-
-
-def test_update_item_global_success(mocker):
-    importer = ServicesImporter(scope="global")
-
-    importer.make_http_request = mocker.Mock()
-    mocker.patch("trxo.commands.imports.services.info")
-
-    data = {"_type": {"_id": "svc1"}, "enabled": True}
-
-    assert importer.update_item(data, "t", "http://x") is True
-    importer.make_http_request.assert_called_once()
-
-
-def test_update_item_realm_success(mocker):
-    importer = ServicesImporter(scope="realm", realm="alpha")
-
-    importer.make_http_request = mocker.Mock()
-    mocker.patch("trxo.commands.imports.services.info")
-
-    data = {"_type": {"_id": "svc1"}, "enabled": True}
-
-    assert importer.update_item(data, "t", "http://x") is True
-    importer.make_http_request.assert_called_once()
-
-
-def test_update_item_http_error(mocker):
-    importer = ServicesImporter(scope="realm", realm="alpha")
-
-    importer.make_http_request = mocker.Mock(side_effect=Exception("boom"))
-    mocker.patch("trxo.commands.imports.services.error")
-
-    data = {"_type": {"_id": "svc1"}, "enabled": True}
+    payload = json.loads(shared_importer._prepare_service_payload(data))
+    assert payload["enabled"] is True
+    assert payload["config"] == {"a": 1}
+    for field in ("_id", "_rev", "_type", "_lastModified", "_lastModifiedBy"):
+        assert field not in payload
+
+
+@pytest.mark.parametrize(
+    "scope,side_effect,data,expected",
+    [
+        ("global", None, {"_type": {"_id": "svc1"}, "enabled": True}, True),
+        ("realm", None, {"_type": {"_id": "svc1"}, "enabled": True}, True),
+        (
+            "realm",
+            Exception("boom"),
+            {"_type": {"_id": "svc1"}, "enabled": True},
+            False,
+        ),
+        ("realm", None, {}, False),
+    ],
+    ids=["global_success", "realm_success", "http_error", "missing_id"],
+)
+def test_update_item(mocker, scope, side_effect, data, expected):
+    importer = ServicesImporter(scope=scope, realm="alpha")
 
-    assert importer.update_item(data, "t", "http://x") is False
+    importer.make_http_request = mocker.Mock(side_effect=side_effect)
 
+    assert importer.update_item(data, "t", "http://x") is expected
+    assert importer.make_http_request.call_count == (1 if data else 0)
 
-def test_create_services_import_command_invalid_scope(mocker):
-    mocker.patch("trxo.commands.imports.services.error")
 
+def test_create_services_import_command_invalid_scope():
     cmd = create_services_import_command()
 
     with pytest.raises(Exit):
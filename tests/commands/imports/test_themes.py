@@ -1,29 +1,33 @@
-import json
+from types import SimpleNamespace
 
 import pytest
 
+from trxo.commands.imports import themes as themes_module
 from trxo.commands.imports.themes import (
     ThemesImporter,
     create_themes_import_command,
 )
 
 
-def test_get_item_type():
-    importer = ThemesImporter()
-    assert importer.get_item_type() == "themes"
+@pytest.fixture(scope="module")
+def shared_importer():
+    """Importer shared by tests that only read instance state."""
+    return ThemesImporter()
 
 
-def test_get_api_endpoint():
-    importer = ThemesImporter()
-    url = importer.get_api_endpoint("", "http://x")
+def test_get_item_type(shared_importer):
+    assert shared_importer.get_item_type() == "themes"
+
+
+def test_get_api_endpoint(shared_importer):
+    url = shared_importer.get_api_endpoint("", "http://x")
     assert url == "http://x/openidm/config/ui/themerealm"
 
 
 def test_fetch_current_success(mocker):
     importer = ThemesImporter()
 
-    resp = mocker.Mock()
-    resp.json.return_value = {"realm": {"alpha": [{"foo": "bar"}]}}
+    resp = SimpleNamespace(json=lambda: {"realm": {"alpha": [{"foo": "bar"}]}})
 
     importer.make_http_request = mocker.Mock(return_value=resp)
 
@@ -34,8 +38,10 @@ def test_fetch_current_success(mocker):
 def test_fetch_current_json_error(mocker):
     importer = ThemesImporter()
 
-    resp = mocker.Mock()
-    resp.json.side_effect = Exception("boom")
+    def _raise():
+        raise ValueError("boom")
+
+    resp = SimpleNamespace(json=_raise)
 
     importer.make_http_request = mocker.Mock(return_value=resp)
 
@@ -43,41 +49,40 @@ def test_fetch_current_json_error(mocker):
     assert result == {}
 
 
-def test_merge_themes_add_realm():
-    importer = ThemesImporter()
-
-    current = {"realm": {}}
-    incoming = {"realm": {"alpha": [{"_id": "1", "name": "theme1"}]}}
-
-    merged = importer._merge_themes(current, incoming)
-
-    assert merged == {"realm": {"alpha": [{"_id": "1", "name": "theme1"}]}}
-
-
-def test_merge_themes_replace_theme():
-    importer = ThemesImporter()
-
-    current = {"realm": {"alpha": [{"_id": "1", "name": "old_theme"}]}}
-    incoming = {"realm": {"alpha": [{"_id": "1", "name": "new_theme"}]}}
-
-    merged = importer._merge_themes(current, incoming)
-
-    assert merged == {"realm": {"alpha": [{"_id": "1", "name": "new_theme"}]}}
-
-
-def test_merge_themes_add_new_theme_to_existing_realm():
-    importer = ThemesImporter()
-
-    current = {"realm": {"alpha": [{"_id": "1", "name": "theme1"}]}}
-    incoming = {"realm": {"alpha": [{"_id": "2", "name": "theme2"}]}}
+# (current, incoming, expected merged document)
+_MERGE_CASES = [
+    pytest.param(
+        {"realm": {}},
+        {"realm": {"alpha": [{"_id": "1", "name": "theme1"}]}},
+        {"realm": {"alpha": [{"_id": "1", "name": "theme1"}]}},
+        id="add_realm",
+    ),
+    pytest.param(
+        {"realm": {"alpha": [{"_id": "1", "name": "old_theme"}]}},
+        {"realm": {"alpha": [{"_id": "1", "name": "new_theme"}]}},
+        {"realm": {"alpha": [{"_id": "1", "name": "new_theme"}]}},
+        id="replace_theme",
+    ),
+    pytest.param(
+        {"realm": {"alpha": [{"_id": "1", "name": "theme1"}]}},
+        {"realm": {"alpha": [{"_id": "2", "name": "theme2"}]}},
+        {
+            "realm": {
+                "alpha": [
+                    {"_id": "1", "name": "theme1"},
+                    {"_id": "2", "name": "theme2"},
+                ]
+            }
+        },
+        id="add_theme_to_existing_realm",
+    ),
+]
 
-    merged = importer._merge_themes(current, incoming)
 
-    assert merged == {
-        "realm": {
-            "alpha": [{"_id": "1", "name": "theme1"}, {"_id": "2", "name": "theme2"}]
-        }
-    }
+@pytest.mark.parametrize("current,incoming,expected", _MERGE_CASES)
+def test_merge_themes(shared_importer, current, incoming, expected):
+    # _merge_themes works on a deep copy and never touches instance state
+    assert shared_importer._merge_themes(current, incoming) == expected
 
 
 def test_apply_cherry_pick_filter():
@@ -110,50 +115,40 @@ def test_apply_cherry_pick_filter():
     assert filtered[0]["realm"]["bravo"][0]["_id"] == "3"
 
 
-def test_update_item_put_success(mocker):
+@pytest.mark.parametrize(
+    "current,side_effect,expected",
+    [
+        ({"_rev": "some-rev", "realm": {}}, None, True),
+        ({"realm": {}}, Exception("boom"), False),
+    ],
+    ids=["put_success", "put_failure"],
+)
+def test_update_item(mocker, current, side_effect, expected):
     importer = ThemesImporter()
 
-    importer._fetch_current = mocker.Mock(
-        return_value={"_rev": "some-rev", "realm": {}}
-    )
-    importer.make_http_request = mocker.Mock()
-    mocker.patch("trxo.commands.imports.themes.info")
+    importer._fetch_current = mocker.Mock(return_value=current)
+    importer.make_http_request = mocker.Mock(side_effect=side_effect)
 
     incoming = {"realm": {"alpha": [{"_id": "1", "name": "theme1"}]}}
 
     result = importer.update_item(incoming, "t", "http://x")
 
-    assert result is True
+    assert result is expected
     importer.make_http_request.assert_called_once()
 
-    # ensure it was called with PUT and If-Match
+    # ensure it was called with PUT and If-Match only when a _rev was read
     args, kwargs = importer.make_http_request.call_args
     assert args[1] == "PUT"
-    assert args[2].get("If-Match") == "some-rev"
-
-
-def test_update_item_put_failure(mocker):
-    importer = ThemesImporter()
-
-    importer._fetch_current = mocker.Mock(return_value={"realm": {}})
-    importer.make_http_request = mocker.Mock(side_effect=Exception("boom"))
-    mocker.patch("trxo.commands.imports.themes.error")
-
-    incoming = {"realm": {"alpha": [{"_id": "1", "name": "theme1"}]}}
-
-    result = importer.update_item(incoming, "t", "http://x")
-
-    assert result is False
-
+    assert args[2].get("If-Match") == current.get("_rev")
 
-def test_create_themes_import_command_wires_importer(mocker, tmp_path):
-    f = tmp_path / "themes.json"
-    f.write_text(json.dumps({"realm": {"alpha": [{"a": 1}]}}))
 
+def test_create_themes_import_command_wires_importer(
+    mocker, monkeypatch, sample_items_file
+):
     importer = mocker.Mock()
-    mocker.patch("trxo.commands.imports.themes.ThemesImporter", return_value=importer)
+    monkeypatch.setattr(themes_module, "ThemesImporter", lambda *a, **k: importer)
 
     cmd = create_themes_import_command()
-    cmd(file=str(f))
+    cmd(file=sample_items_file)
 
     importer.import_from_file.assert_called_once()
@@ -2,82 +2,63 @@ import json
 
 import pytest
 
+from trxo.commands.imports import webhooks as webhooks_module
 from trxo.commands.imports.webhooks import (
     WebhooksImporter,
     create_webhooks_import_command,
 )
 
 
-def test_get_required_fields():
-    importer = WebhooksImporter(realm="alpha")
-    assert importer.get_required_fields() == ["_id"]
-
-
-def test_get_item_type():
-    importer = WebhooksImporter(realm="alpha")
-    assert importer.get_item_type() == "webhooks"
+@pytest.fixture(scope="module")
+def shared_importer():
+    """Importer shared by tests that only read instance state."""
+    return WebhooksImporter(realm="alpha")
 
 
-def test_get_api_endpoint():
-    importer = WebhooksImporter(realm="alpha")
-    url = importer.get_api_endpoint("w1", "http://x")
-    assert url.endswith("/am/json/realms/root/realms/alpha/realm-config/webhooks/w1")
+def test_get_required_fields(shared_importer):
+    assert shared_importer.get_required_fields() == ["_id"]
 
 
-def test_update_item_success_strips_rev(mocker):
-    importer = WebhooksImporter(realm="alpha")
-
-    importer.make_http_request = mocker.Mock()
-    mocker.patch("trxo.commands.imports.webhooks.info")
-
-    data = {"_id": "w1", "_rev": "123", "name": "hook"}
-
-    result = importer.update_item(data, "t", "http://x")
+def test_get_item_type(shared_importer):
+    assert shared_importer.get_item_type() == "webhooks"
 
-    assert result is True
 
-    args = importer.make_http_request.call_args.args
-    payload = json.loads(args[3])
-
-    assert payload["_id"] == "w1"
-    assert " _rev" not in payload
-    assert "_rev" not in payload
-
-
-def test_update_item_missing_id(mocker):
-    importer = WebhooksImporter(realm="alpha")
-
-    mocker.patch("trxo.commands.imports.webhooks.error")
-
-    result = importer.update_item({}, "t", "http://x")
-
-    assert result is False
+def test_get_api_endpoint(shared_importer):
+    url = shared_importer.get_api_endpoint("w1", "http://x")
+    assert url.endswith("/am/json/realms/root/realms/alpha/realm-config/webhooks/w1")
 
 
-def test_update_item_exception(mocker):
+@pytest.mark.parametrize(
+    "side_effect,data,expected",
+    [
+        (None, {"_id": "w1", "_rev": "123", "name": "hook"}, True),
+        (Exception("boom"), {"_id": "w1"}, False),
+        (None, {}, False),
+    ],
+    ids=["success", "http_error", "missing_id"],
+)
+def test_update_item(mocker, side_effect, data, expected):
     importer = WebhooksImporter(realm="alpha")
 
-    importer.make_http_request = mocker.Mock(side_effect=Exception("boom"))
-    mocker.patch("trxo.commands.imports.webhooks.error")
-
-    data = {"_id": "w1"}
+    importer.make_http_request = mocker.Mock(side_effect=side_effect)
 
     result = importer.update_item(data, "t", "http://x")
 
-    assert result is False
+    assert result is expected
 
+    if importer.make_http_request.called:
+        payload = json.loads(importer.make_http_request.call_args.args[3])
+        assert payload["_id"] == "w1"
+        assert "_rev" not in payload
 
-def test_create_webhooks_import_command_wires_importer(mocker, tmp_path):
-    f = tmp_path / "webhooks.json"
-    f.write_text(json.dumps({"data": []}))
 
+def test_create_webhooks_import_command_wires_importer(
+    mocker, monkeypatch, sample_items_file
+):
     importer = mocker.Mock()
-    mocker.patch(
-        "trxo.commands.imports.webhooks.WebhooksImporter",
-        return_value=importer,
-    )
+    monkeypatch.setattr(webhooks_module, "WebhooksImporter", lambda *a, **k: importer)
 
     cmd = create_webhooks_import_command()
-    cmd(file=str(f), realm="alpha")
+    cmd(file=sample_items_file, realm="alpha")
 
     importer.import_from_file.assert_called_once()
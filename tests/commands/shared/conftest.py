@@ -0,0 +1,38 @@
+"""Shared fixtures for the AuthManager test modules."""
+
+from unittest.mock import create_autospec
+
+import pytest
+
+from trxo.auth.token_manager import TokenManager
+from trxo.commands.shared.auth_manager import AuthManager
+from trxo.utils.config_store import ConfigStore
+
+
+# Autospec walks the real class, so build each spec once per module and reset
+# it between tests instead of re-introspecting for every test.
+@pytest.fixture(scope="module")
+def _config_store_spec():
+    return create_autospec(ConfigStore, instance=True)
+
+
+@pytest.fixture(scope="module")
+def _token_manager_spec():
+    return create_autospec(TokenManager, instance=True)
+
+
+@pytest.fixture
+def config_store(_config_store_spec):
+    _config_store_spec.reset_mock(return_value=True, side_effect=True)
+    return _config_store_spec
+
+
+@pytest.fixture
+def token_manager(_token_manager_spec):
+    _token_manager_spec.reset_mock(return_value=True, side_effect=True)
+    return _token_manager_spec
+
+
+@pytest.fixture
+def manager(config_store, token_manager):
+    return AuthManager(config_store, token_manager)
@@ -0,0 +1,32 @@
+import pytest
+import typer
+
+
+@pytest.mark.parametrize(
+    "project_config,kwargs,expected",
+    [
+        ({}, {"base_url_override": "x"}, "x"),
+        # am_base_url takes precedence over the legacy base_url field
+        (
+            {
+                "auth_mode": "onprem",
+                "am_base_url": "http://am",
+                "base_url": "http://old",
+            },
+            {},
+            "http://am",
+        ),
+    ],
+    ids=["override", "am_base_url_fallback"],
+)
+def test_get_base_url(manager, config_store, project_config, kwargs, expected):
+    config_store.get_project_config.return_value = project_config
+
+    assert manager.get_base_url("proj", **kwargs) == expected
+
+
+def test_get_base_url_missing_raises_exit(manager, config_store):
+    config_store.get_project_config.return_value = {}
+
+    with pytest.raises(typer.Exit):
+        manager.get_base_url("proj")
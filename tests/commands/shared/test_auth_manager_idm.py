@@ -0,0 +1,42 @@
+import pytest
+import typer
+
+
+def test_get_idm_credentials_success(manager, config_store):
+    config_store.get_project_config.return_value = {
+        "onprem_products": ["idm"],
+        "idm_username": "idmAdmin",
+    }
+
+    username, password = manager.get_idm_credentials("proj", idm_password="secret")
+
+    assert username == "idmAdmin"
+    assert password == "secret"
+
+
+def test_get_idm_credentials_missing_products_raises(manager, config_store):
+    config_store.get_project_config.return_value = {"onprem_products": []}
+
+    with pytest.raises(typer.Exit):
+        manager.get_idm_credentials("proj", idm_password="pw")
+
+
+@pytest.mark.parametrize(
+    "project_config,kwargs,expected",
+    [
+        ({}, {"idm_base_url_override": "http://idm"}, "http://idm"),
+        ({"idm_base_url": "http://idm-config"}, {}, "http://idm-config"),
+    ],
+    ids=["override", "from_config"],
+)
+def test_get_idm_base_url(manager, config_store, project_config, kwargs, expected):
+    config_store.get_project_config.return_value = project_config
+
+    assert manager.get_idm_base_url("proj", **kwargs) == expected
+
+
+def test_get_idm_base_url_missing_raises(manager, config_store):
+    config_store.get_project_config.return_value = {}
+
+    with pytest.raises(typer.Exit):
+        manager.get_idm_base_url("proj")
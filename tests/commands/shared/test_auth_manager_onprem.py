@@ -0,0 +1,34 @@
+from types import SimpleNamespace
+
+import pytest
+import typer
+
+
+def test_get_onprem_session_success(mocker, manager, config_store):
+    config_store.get_project_config.return_value = {
+        "base_url": "url",
+        "onprem_username": "u",
+        "onprem_realm": "root",
+    }
+
+    client = SimpleNamespace(authenticate=lambda *a, **k: {"tokenId": "sso"})
+
+    mocker.patch("trxo.commands.shared.auth_manager.OnPremAuth", return_value=client)
+
+    result = manager.get_onprem_session("proj", password="p")
+
+    assert result == "sso"
+
+
+def test_get_onprem_session_failure_raises_exit(mocker, manager, config_store):
+    config_store.get_project_config.return_value = {"base_url": "url"}
+
+    mock_client = mocker.Mock()
+    mock_client.authenticate.side_effect = Exception("fail")
+
+    mocker.patch(
+        "trxo.commands.shared.auth_manager.OnPremAuth", return_value=mock_client
+    )
+
+    with pytest.raises(typer.Exit):
+        manager.get_onprem_session("proj", username="u", password="p")
@@ -0,0 +1,31 @@
+import pytest
+import typer
+
+
+@pytest.mark.parametrize(
+    "project_config,kwargs",
+    [
+        ({}, {"override": "onprem"}),
+        ({"auth_mode": "onprem"}, {}),
+    ],
+    ids=["override", "from_config"],
+)
+def test_get_auth_mode(manager, config_store, project_config, kwargs):
+    config_store.get_project_config.return_value = project_config
+
+    assert manager.get_auth_mode("proj", **kwargs) == "onprem"
+
+
+def test_get_token_success(manager, token_manager):
+    token_manager.get_token.return_value = "token123"
+
+    result = manager.get_token("proj")
+
+    assert result == "token123"
+
+
+def test_get_token_failure_raises_exit(manager, token_manager):
+    token_manager.get_token.side_effect = Exception("fail")
+
+    with pytest.raises(typer.Exit):
+        manager.get_token("proj")
@@ -0,0 +1,111 @@
+import pytest
+import typer
+
+
+def test_validate_project_no_project_and_no_args_raises(manager, config_store):
+    config_store.get_current_project.return_value = None
+
+    with pytest.raises(typer.Exit):
+        manager.validate_project()
+
+
+def test_validate_project_returns_current_project(manager, config_store):
+    config_store.get_current_project.return_value = "proj"
+
+    result = manager.validate_project()
+    assert result == "proj"
+
+
+def test_validate_project_service_account_argument_mode(mocker, manager, config_store):
+    config_store.get_current_project.return_value = None
+
+    mocker.patch.object(manager, "_initialize_argument_mode", return_value="temp_proj")
+
+    result = manager.validate_project(
+        jwk_path="a",
+        sa_id="c",
+        base_url="d",
+    )
+
+    assert result == "temp_proj"
+
+
+def test_validate_project_onprem_argument_mode(mocker, manager, config_store):
+    config_store.get_current_project.return_value = None
+
+    mocker.patch.object(
+        manager, "_initialize_argument_mode_onprem", return_value="temp_proj"
+    )
+
+    result = manager.validate_project(
+        auth_mode="onprem",
+        base_url="url",
+        onprem_username="u",
+        onprem_password="p",
+    )
+
+    assert result == "temp_proj"
+
+
+def test_validate_project_onprem_idm_argument_mode(mocker, manager, config_store):
+    """am_base_url + idm_username/idm_password should trigger onprem argument mode."""
+    config_store.get_current_project.return_value = None
+
+    mocker.patch.object(
+        manager, "_initialize_argument_mode_onprem", return_value="temp_idm"
+    )
+
+    result = manager.validate_project(
+        auth_mode="onprem",
+        base_url="http://am",
+        am_base_url="http://am",
+        idm_username="idm_user",
+        idm_password="idm_pass",
+    )
+
+    assert result == "temp_idm"
+
+
+def test_initialize_argument_mode_onprem_stores_am_base_url(manager, config_store):
+    """Ensure am_base_url is persisted inside the temporary project config."""
+    config_store.get_current_project.return_value = None
+
+    result = manager._initialize_argument_mode_onprem(
+        base_url="http://am",
+        username="amAdmin",
+        am_base_url="http://am",
+    )
+
+    assert result is not None
+    saved = config_store.save_project.call_args[0][1]
+    assert saved.get("am_base_url") == "http://am"
+    assert saved.get("auth_mode") == "onprem"
+
+
+def test_cleanup_argument_mode_restores_original_project(manager, config_store):
+    manager._temp_project = "temp_x"
+    manager._original_project = "orig"
+
+    manager.cleanup_argument_mode()
+
+    config_store.set_current_project.assert_called_once_with("orig")
+
+
+def test_update_config_if_needed_updates_fields(manager, config_store):
+    config_store.get_current_project.return_value = "proj"
+    config_store.get_project_config.return_value = {}
+
+    manager.update_config_if_needed(
+        jwk_path="a",
+        sa_id="c",
+        base_url="d",
+    )
+
+    config_store.save_project.assert_called_once()
+    args = config_store.save_project.call_args[0]
+    saved_config = args[1]
+
+    assert saved_config["jwk_path"] == "a"
+    assert saved_config["sa_id"] == "c"
+    assert saved_config["base_url"] == "d"
+    assert "token_url" in saved_config
@@ -1,9 +1,10 @@
-import json
+from contextlib import nullcontext
+from dataclasses import dataclass, field
 
-import httpx
 import pytest
 import typer
 
+from trxo.commands.shared import base_command
 from trxo.commands.shared.base_command import BaseCommand
 
 
@@ -15,18 +16,71 @@ class DummyCommand(BaseCommand):
         return "items"
 
 
-def test_initialize_auth_service_account(mocker):
-    cmd = DummyCommand()
+@pytest.fixture(autouse=True)
+def _no_api_log(monkeypatch):
+    monkeypatch.setattr(base_command, "log_api_call", lambda *a, **k: None)
 
-    mocker.patch.object(cmd.auth_manager, "validate_project", return_value="proj")
-    mocker.patch.object(cmd.auth_manager, "update_config_if_needed")
-    mocker.patch.object(
-        cmd.auth_manager, "get_auth_mode", return_value="service-account"
-    )
-    mocker.patch.object(cmd.auth_manager, "get_base_url", return_value="http://x")
-    mocker.patch.object(cmd.auth_manager, "get_token", return_value="token")
 
-    token, base_url = cmd.initialize_auth(
+@pytest.fixture(scope="module")
+def shared_cmd():
+    """Command shared by tests that set every attribute they read.
+
+    Tests that mutate counters or auth_manager go through the ``cmd`` or
+    ``patched_auth`` fixtures, which reset that state.
+    """
+    return DummyCommand()
+
+
+@pytest.fixture
+def cmd(shared_cmd):
+    """shared_cmd with the summary counters and error mode reset for each test."""
+    shared_cmd.continue_on_error = False
+    shared_cmd.successful_updates = 0
+    shared_cmd.failed_updates = 0
+    return shared_cmd
+
+
+@dataclass
+class StubAuthManager:
+    """Plain stand-in for AuthManager covering what initialize_auth calls."""
+
+    auth_mode: str = "service-account"
+    base_url: str = "http://x"
+    validate_kwargs: dict = field(default_factory=dict)
+
+    def validate_project(self, **kwargs):
+        self.validate_kwargs = kwargs
+        return "proj"
+
+    def update_config_if_needed(self, *args, **kwargs):
+        pass
+
+    def get_auth_mode(self, project, override=None):
+        return self.auth_mode
+
+    def get_base_url(self, project, base_url_override=None):
+        return self.base_url
+
+    def get_token(self, project):
+        return "token"
+
+    def get_onprem_session(self, project, **kwargs):
+        return "sso"
+
+
+@pytest.fixture
+def patched_auth(shared_cmd, monkeypatch):
+    """shared_cmd with a fresh StubAuthManager, restored after each test.
+
+    initialize_auth also writes auth_mode, so that is restored too.
+    """
+    monkeypatch.setattr(shared_cmd, "auth_manager", StubAuthManager())
+    monkeypatch.setattr(shared_cmd, "auth_mode", shared_cmd.auth_mode)
+    return shared_cmd
+
+
+def test_initialize_auth_service_account(patched_auth):
+    token, base_url = patched_auth.initialize_auth(
         jwk_path="a",
         sa_id="c",
         base_url="http://x",
@@ -34,19 +88,13 @@ def test_initialize_auth_service_account(mocker):
 
     assert token == "token"
     assert base_url == "http://x"
-    assert cmd.auth_mode == "service-account"
-
+    assert patched_auth.auth_mode == "service-account"
 
-def test_initialize_auth_onprem(mocker):
-    cmd = DummyCommand()
 
-    mocker.patch.object(cmd.auth_manager, "validate_project", return_value="proj")
-    mocker.patch.object(cmd.auth_manager, "update_config_if_needed")
-    mocker.patch.object(cmd.auth_manager, "get_auth_mode", return_value="onprem")
-    mocker.patch.object(cmd.auth_manager, "get_base_url", return_value="http://x")
-    mocker.patch.object(cmd.auth_manager, "get_onprem_session", return_value="sso")
+def test_initialize_auth_onprem(patched_auth):
+    patched_auth.auth_manager.auth_mode = "onprem"
 
-    token, base_url = cmd.initialize_auth(
+    token, base_url = patched_auth.initialize_auth(
         auth_mode="onprem",
         base_url="http://x",
         onprem_username="u",
@@ -55,22 +103,15 @@ def test_initialize_auth_onprem(mocker):
 
     assert token == "sso"
     assert base_url == "http://x"
-    assert cmd.auth_mode == "onprem"
+    assert patched_auth.auth_mode == "onprem"
 
 
-def test_initialize_auth_onprem_with_am_base_url(mocker):
+def test_initialize_auth_onprem_with_am_base_url(patched_auth):
     """am_base_url is forwarded to validate_project so auth is performed against AM."""
-    cmd = DummyCommand()
+    patched_auth.auth_manager.auth_mode = "onprem"
+    patched_auth.auth_manager.base_url = "http://am"
 
-    validate = mocker.patch.object(
-        cmd.auth_manager, "validate_project", return_value="proj"
-    )
-    mocker.patch.object(cmd.auth_manager, "update_config_if_needed")
-    mocker.patch.object(cmd.auth_manager, "get_auth_mode", return_value="onprem")
-    mocker.patch.object(cmd.auth_manager, "get_base_url", return_value="http://am")
-    mocker.patch.object(cmd.auth_manager, "get_onprem_session", return_value="sso")
-
-    cmd.initialize_auth(
+    patched_auth.initialize_auth(
         auth_mode="onprem",
         base_url="http://am",
         am_base_url="http://am",
@@ -78,135 +119,57 @@ def test_initialize_auth_onprem_with_am_base_url(mocker):
         onprem_password="p",
     )
 
-    call_kwargs = validate.call_args.kwargs
-    assert call_kwargs.get("am_base_url") == "http://am"
+    assert patched_auth.auth_manager.validate_kwargs.get("am_base_url") == "http://am"
 
 
-def test_build_auth_headers_service_account():
-    cmd = DummyCommand()
-    cmd.auth_mode = "service-account"
+def test_build_auth_headers_service_account(shared_cmd):
+    shared_cmd.auth_mode = "service-account"
 
-    headers = cmd.build_auth_headers("token")
+    headers = shared_cmd.build_auth_headers("token")
     assert headers["Authorization"] == "Bearer token"
 
 
-def test_build_auth_headers_onprem():
-    cmd = DummyCommand()
-    cmd.auth_mode = "onprem"
+def test_build_auth_headers_onprem(shared_cmd):
+    shared_cmd.auth_mode = "onprem"
 
-    headers = cmd.build_auth_headers("sso")
+    headers = shared_cmd.build_auth_headers("sso")
     assert headers["Cookie"] == "iPlanetDirectoryPro=sso"
 
 
-def test_make_http_request_success(mocker):
-    cmd = DummyCommand()
-
-    mock_response = mocker.Mock()
-    mock_response.status_code = 200
-    mock_response.content = b"ok"
-    mock_response.headers = {}
-    mock_response.raise_for_status.return_value = None
-
-    mock_client = mocker.Mock()
-    mock_client.get.return_value = mock_response
-
-    mocker.patch(
-        "httpx.Client",
-        return_value=mocker.Mock(
-            __enter__=lambda s: mock_client, __exit__=lambda *a: None
-        ),
-    )
-    mocker.patch("trxo.commands.shared.base_command.log_api_call")
+def test_make_http_request_success(http_transport, shared_cmd):
+    http_transport(200, b"ok")
 
-    response = cmd.make_http_request("http://x")
+    response = shared_cmd.make_http_request("http://x")
 
-    assert response == mock_response
+    assert response.status_code == 200
+    assert response.content == b"ok"
 
 
-def test_make_http_request_http_error(mocker):
-    cmd = DummyCommand()
+def test_make_http_request_http_error(http_transport, shared_cmd):
+    http_transport(400, b"bad")
 
-    response = mocker.Mock()
-    response.status_code = 400
-    response.text = "bad"
-    response.content = b"bad"
-    response.headers = {}
-    response.json.side_effect = Exception()
-
-    http_error = httpx.HTTPStatusError(
-        "err",
-        request=mocker.Mock(),
-        response=response,
-    )
-
-    mock_client = mocker.Mock()
-    mock_client.get.side_effect = http_error
-
-    mocker.patch(
-        "httpx.Client",
-        return_value=mocker.Mock(
-            __enter__=lambda s: mock_client, __exit__=lambda *a: None
-        ),
-    )
-    mocker.patch("trxo.commands.shared.base_command.log_api_call")
-
-    with pytest.raises(Exception):
-        cmd.make_http_request("http://x")
-
-
-def test_print_summary_success():
-    cmd = DummyCommand()
-    cmd.successful_updates = 1
-    cmd.failed_updates = 0
-
-    cmd.print_summary()
-
-
-def test_print_summary_failure_raises():
-    cmd = DummyCommand()
-    cmd.successful_updates = 0
-    cmd.failed_updates = 1
-
-    with pytest.raises(typer.Exit):
-        cmd.print_summary()
-
-
-def test_print_summary_partial_failure_stop_mode_raises():
-    """Default/stop mode: any failure exits 1 even if some items succeeded."""
-    cmd = DummyCommand()
-    cmd.continue_on_error = False
-    cmd.successful_updates = 1
-    cmd.failed_updates = 1
-
-    with pytest.raises(typer.Exit):
-        cmd.print_summary()
-
-
-def test_print_summary_partial_failure_continue_mode_ok():
-    """Continue mode: mixed success/failure exits 0 from summary (no raise)."""
-    cmd = DummyCommand()
-    cmd.continue_on_error = True
-    cmd.successful_updates = 1
-    cmd.failed_updates = 1
-
-    cmd.print_summary()
-
-
-def test_print_summary_all_failed_continue_mode_raises():
-    """Continue mode: if every item failed, command still fails."""
-    cmd = DummyCommand()
-    cmd.continue_on_error = True
-    cmd.successful_updates = 0
-    cmd.failed_updates = 2
-
-    with pytest.raises(typer.Exit):
-        cmd.print_summary()
+    with pytest.raises(Exception, match="400 - bad"):
+        shared_cmd.make_http_request("http://x")
 
 
-def test_print_summary_no_success_raises():
-    cmd = DummyCommand()
-    cmd.successful_updates = 0
-    cmd.failed_updates = 0
+@pytest.mark.parametrize(
+    "continue_on_error,succeeded,failed,raises",
+    [
+        pytest.param(False, 1, 0, False, id="success"),
+        pytest.param(False, 0, 1, True, id="failure"),
+        # Default/stop mode: any failure exits 1 even if some items succeeded
+        pytest.param(False, 1, 1, True, id="partial_failure_stop_mode"),
+        # Continue mode: mixed success/failure exits 0 from summary
+        pytest.param(True, 1, 1, False, id="partial_failure_continue_mode"),
+        # Continue mode: if every item failed, command still fails
+        pytest.param(True, 0, 2, True, id="all_failed_continue_mode"),
+        pytest.param(False, 0, 0, True, id="no_success"),
+    ],
+)
+def test_print_summary(cmd, continue_on_error, succeeded, failed, raises):
+    cmd.continue_on_error = continue_on_error
+    cmd.successful_updates = succeeded
+    cmd.failed_updates = failed
 
-    with pytest.raises(typer.Exit):
+    with pytest.raises(typer.Exit) if raises else nullcontext():
         cmd.print_summary()
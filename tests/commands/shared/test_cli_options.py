@@ -1,3 +1,4 @@
+import pytest
 import typer
 
 from trxo.commands.shared.cli_options import (
@@ -8,66 +9,59 @@ from trxo.commands.shared.cli_options import (
 )
 from trxo.commands.shared.options import ContinueOnErrorOpt
 
+_AUTH_KEYS = {"jwk_path", "sa_id", "base_url", "am_base_url", "project_name"}
 
-def test_auth_options_contains_expected_keys():
-    opts = CommonOptions.auth_options()
 
-    assert "jwk_path" in opts
-    assert "sa_id" in opts
-    assert "base_url" in opts
-    assert "am_base_url" in opts
-    assert "project_name" in opts
+@pytest.mark.parametrize(
+    "factory,required",
+    [
+        pytest.param(CommonOptions.auth_options, _AUTH_KEYS, id="auth"),
+        pytest.param(CommonOptions.import_options, _AUTH_KEYS | {"file"}, id="import"),
+        pytest.param(
+            CommonOptions.export_options,
+            _AUTH_KEYS | {"output_dir", "output_file"},
+            id="export",
+        ),
+    ],
+)
+def test_options_contain_expected_keys(factory, required):
+    opts = factory()
+
+    assert required <= opts.keys()
     # client_id was removed in favour of sa_id only
     assert "client_id" not in opts
 
 
-def test_import_options_contains_file_and_auth():
-    opts = CommonOptions.import_options()
+# The param factories build fresh OptionInfo lists; tests only read them
+@pytest.fixture(scope="module")
+def auth_params():
+    return create_auth_params()
 
-    assert "file" in opts
-    assert "jwk_path" in opts
-    assert "sa_id" in opts
-    assert "base_url" in opts
-    assert "am_base_url" in opts
-    assert "project_name" in opts
-    assert "client_id" not in opts
 
+@pytest.fixture(scope="module")
+def import_params():
+    return create_import_params()
 
-def test_export_options_contains_dir_file_and_auth():
-    opts = CommonOptions.export_options()
 
-    assert "output_dir" in opts
-    assert "output_file" in opts
-    assert "jwk_path" in opts
-    assert "sa_id" in opts
-    assert "base_url" in opts
-    assert "am_base_url" in opts
-    assert "project_name" in opts
-    assert "client_id" not in opts
+@pytest.fixture(scope="module")
+def export_params():
+    return create_export_params()
 
 
-def test_create_auth_params_returns_five_params():
-    params = create_auth_params()
-
+def test_create_auth_params_returns_five_params(auth_params):
     # jwk_path, sa_id, base_url, am_base_url, project_name
-    assert len(params) == 5
-    assert all(isinstance(p, typer.models.OptionInfo) for p in params)
-
-
-def test_create_import_params_has_file_first():
-    params = create_import_params()
+    assert len(auth_params) == 5
+    assert all(isinstance(p, typer.models.OptionInfo) for p in auth_params)
 
-    assert len(params) == 6
-    assert isinstance(params[0], typer.models.OptionInfo)
-    assert params[0].param_decls[0] == "--file"
 
+def test_create_import_params_has_file_first(import_params):
+    assert len(import_params) == 6
+    assert isinstance(import_params[0], typer.models.OptionInfo)
+    assert import_params[0].param_decls[0] == "--file"
 
-def test_create_export_params_has_dir_and_file():
-    params = create_export_params()
 
-    flags = []
-    for p in params:
-        flags.extend(p.param_decls)
+def test_create_export_params_has_dir_and_file(export_params):
+    flags = [decl for p in export_params for decl in p.param_decls]
 
     assert "--dir" in flags
     assert "--file" in flags
@@ -4,10 +4,14 @@ import typer
 from trxo.commands.logs import log_info, show_logs
 
 
-def test_show_logs_no_log_file(mocker):
+@pytest.fixture(autouse=True)
+def logs_logger(mocker):
+    """Stub logging setup for every test and return the get_logger mock."""
     mocker.patch("trxo.commands.logs.setup_logging")
-    mocker.patch("trxo.commands.logs.get_logger")
+    return mocker.patch("trxo.commands.logs.get_logger")
+
 
+def test_show_logs_no_log_file(mocker):
     log_path = mocker.Mock()
     log_path.exists.return_value = False
 
@@ -19,55 +23,40 @@ def test_show_logs_no_log_file(mocker):
     warning.assert_called_once()
 
 
-def test_show_logs_with_lines(mocker, tmp_path):
-    mocker.patch("trxo.commands.logs.setup_logging")
-    mocker.patch("trxo.commands.logs.get_logger")
-
-    log_file = tmp_path / "trxo.log"
-    log_file.write_text("INFO one\nERROR two\nDEBUG three\n", encoding="utf-8")
-
-    mocker.patch("trxo.commands.logs.get_log_file_path", return_value=log_file)
-    console = mocker.patch("trxo.commands.logs.console")
-
-    show_logs(lines=2, follow=False, level=None)
-
-    console.print.assert_called_once()
-
-
-def test_show_logs_with_level_filter(mocker, tmp_path):
-    mocker.patch("trxo.commands.logs.setup_logging")
-    mocker.patch("trxo.commands.logs.get_logger")
-
-    log_file = tmp_path / "trxo.log"
-    log_file.write_text("INFO one\nERROR two\nERROR three\n", encoding="utf-8")
-
-    mocker.patch("trxo.commands.logs.get_log_file_path", return_value=log_file)
-    console = mocker.patch("trxo.commands.logs.console")
-
-    show_logs(lines=10, follow=False, level="ERROR")
-
-    console.print.assert_called_once()
-
-
-def test_show_logs_no_matching_lines(mocker, tmp_path):
-    mocker.patch("trxo.commands.logs.setup_logging")
-    mocker.patch("trxo.commands.logs.get_logger")
-
-    log_file = tmp_path / "trxo.log"
-    log_file.write_text("INFO one\nDEBUG two\n", encoding="utf-8")
-
-    mocker.patch("trxo.commands.logs.get_log_file_path", return_value=log_file)
-    info = mocker.patch("trxo.commands.logs.info")
+@pytest.mark.parametrize(
+    "content,lines,level,printer",
+    [
+        pytest.param(
+            "INFO one\nERROR two\nDEBUG three\n", 2, None, "console", id="lines"
+        ),
+        pytest.param(
+            "INFO one\nERROR two\nERROR three\n", 10, "ERROR", "console", id="level"
+        ),
+        pytest.param("INFO one\nDEBUG two\n", 10, "ERROR", "info", id="no_match"),
+    ],
+)
+def test_show_logs_reads_file(mocker, content, lines, level, printer):
+    log_path = mocker.Mock()
+    log_path.exists.return_value = True
 
-    show_logs(lines=10, follow=False, level="ERROR")
+    mocker.patch("trxo.commands.logs.get_log_file_path", return_value=log_path)
+    mocker.patch(
+        "trxo.commands.logs.open", mocker.mock_open(read_data=content), create=True
+    )
+    printers = {
+        "console": mocker.patch("trxo.commands.logs.console").print,
+        "info": mocker.patch("trxo.commands.logs.info"),
+    }
 
-    info.assert_called_once()
+    show_logs(lines=lines, follow=False, level=level)
 
+    printers[printer].assert_called_once()
+    for name, other in printers.items():
+        if name != printer:
+            other.assert_not_called()
 
-def test_show_logs_exception(mocker):
-    mocker.patch("trxo.commands.logs.setup_logging")
-    logger = mocker.patch("trxo.commands.logs.get_logger")
 
+def test_show_logs_exception(mocker, logs_logger):
     mocker.patch(
         "trxo.commands.logs.get_log_file_path",
         side_effect=Exception("boom"),
@@ -79,20 +68,21 @@ def test_show_logs_exception(mocker):
         show_logs(lines=10, follow=False, level=None)
 
     error.assert_called_once()
-    logger.return_value.error.assert_called_once()
-
+    logs_logger.return_value.error.assert_called_once()
 
-def test_log_info_success(mocker, tmp_path):
-    mocker.patch("trxo.commands.logs.setup_logging")
-    logger = mocker.patch("trxo.commands.logs.get_logger")
 
+@pytest.mark.parametrize("exists", [True, False], ids=["with_file", "no_log_file"])
+def test_log_info(mocker, logs_logger, exists):
     config = mocker.Mock()
     config.default_level.value = "INFO"
     config.log_retention_days = 7
 
-    log_dir = tmp_path
-    log_file = tmp_path / "trxo.log"
-    log_file.write_text("hello", encoding="utf-8")
+    log_dir = mocker.Mock()
+    log_dir.glob.return_value = []
+    log_file = mocker.Mock()
+    log_file.exists.return_value = exists
+    log_file.stat.return_value.st_size = 5
+    log_file.stat.return_value.st_mtime = 0
 
     mocker.patch("trxo.commands.logs.LogConfig", return_value=config)
     mocker.patch("trxo.commands.logs.get_log_directory", return_value=log_dir)
@@ -103,36 +93,11 @@ def test_log_info_success(mocker, tmp_path):
     log_info()
 
     console.print.assert_called_once()
-    logger.return_value.info.assert_called_once()
-
-
-def test_log_info_no_log_file(mocker, tmp_path):
-    mocker.patch("trxo.commands.logs.setup_logging")
-    logger = mocker.patch("trxo.commands.logs.get_logger")
-
-    config = mocker.Mock()
-    config.default_level.value = "INFO"
-    config.log_retention_days = 7
+    logs_logger.return_value.info.assert_called_once()
+    assert log_file.stat.called is exists
 
-    log_dir = tmp_path
-    log_file = tmp_path / "trxo.log"
-
-    mocker.patch("trxo.commands.logs.LogConfig", return_value=config)
-    mocker.patch("trxo.commands.logs.get_log_directory", return_value=log_dir)
-    mocker.patch("trxo.commands.logs.get_log_file_path", return_value=log_file)
-
-    console = mocker.patch("trxo.commands.logs.console")
-
-    log_info()
-
-    console.print.assert_called_once()
-    logger.return_value.info.assert_called_once()
-
-
-def test_log_info_exception(mocker):
-    mocker.patch("trxo.commands.logs.setup_logging")
-    logger = mocker.patch("trxo.commands.logs.get_logger")
 
+def test_log_info_exception(mocker, logs_logger):
     mocker.patch(
         "trxo.commands.logs.LogConfig",
         side_effect=Exception("boom"),
@@ -144,4 +109,4 @@ def test_log_info_exception(mocker):
         log_info()
 
     error.assert_called_once()
-    logger.return_value.error.assert_called_once()
+    logs_logger.return_value.error.assert_called_once()
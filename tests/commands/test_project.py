@@ -1,3 +1,5 @@
+from contextlib import nullcontext
+
 import pytest
 import typer
 
@@ -9,58 +11,62 @@ from trxo.commands.project import (
 )
 
 
-def test_create_project_success(mocker):
-    mock_store = mocker.patch("trxo.commands.project.config_store")
-    mock_store.get_projects.return_value = {}
-
-    create_project(name="proj1", description="desc")
-
-    mock_store.save_project.assert_called_once()
-    mock_store.get_projects.assert_called_once()
+@pytest.fixture
+def store(mocker):
+    return mocker.patch("trxo.commands.project.config_store")
 
 
-def test_create_project_already_exists(mocker):
-    mock_store = mocker.patch("trxo.commands.project.config_store")
-    mock_store.get_projects.return_value = {"proj1": {}}
+def _raises_exit(should_raise):
+    return pytest.raises(typer.Exit) if should_raise else nullcontext()
 
-    with pytest.raises(typer.Exit):
-        create_project(name="proj1", description=None)
 
+@pytest.mark.parametrize(
+    "existing,should_raise",
+    [({}, False), ({"proj1": {}}, True)],
+    ids=["success", "already_exists"],
+)
+def test_create_project(store, existing, should_raise):
+    store.get_projects.return_value = existing
 
-def test_switch_project_success(mocker):
-    mock_store = mocker.patch("trxo.commands.project.config_store")
-    mock_store.get_projects.return_value = {"proj1": {}}
+    with _raises_exit(should_raise):
+        create_project(name="proj1", description="desc")
 
-    switch(project_name="proj1")
+    store.get_projects.assert_called_once()
+    assert store.save_project.called is not should_raise
 
-    mock_store.set_current_project.assert_called_once_with("proj1")
 
+@pytest.mark.parametrize(
+    "existing,should_raise",
+    [({"proj1": {}}, False), ({}, True)],
+    ids=["success", "not_found"],
+)
+def test_switch_project(store, existing, should_raise):
+    store.get_projects.return_value = existing
 
-def test_switch_project_not_found(mocker):
-    mock_store = mocker.patch("trxo.commands.project.config_store")
-    mock_store.get_projects.return_value = {}
+    with _raises_exit(should_raise):
+        switch(project_name="proj1")
 
-    with pytest.raises(typer.Exit):
-        switch(project_name="missing")
+    if should_raise:
+        store.set_current_project.assert_not_called()
+    else:
+        store.set_current_project.assert_called_once_with("proj1")
 
 
-def test_list_projects_no_projects(mocker):
-    mock_store = mocker.patch("trxo.commands.project.config_store")
-    mock_store.get_projects.return_value = {}
-    mock_store.get_current_project.return_value = None
+def test_list_projects_no_projects(store):
+    store.get_projects.return_value = {}
+    store.get_current_project.return_value = None
 
     list_projects()
 
-    mock_store.get_projects.assert_called_once()
+    store.get_projects.assert_called_once()
 
 
-def test_list_projects_with_projects(mocker):
-    mock_store = mocker.patch("trxo.commands.project.config_store")
-    mock_store.get_projects.return_value = {
+def test_list_projects_with_projects(mocker, store):
+    store.get_projects.return_value = {
         "proj1": {"description": "d1", "created_at": "2025-01-01T10:00:00"},
         "proj2": {"description": "d2", "created_at": "2025-01-02T10:00:00"},
     }
-    mock_store.get_current_project.return_value = "proj1"
+    store.get_current_project.return_value = "proj1"
 
     mock_table = mocker.Mock()
     mocker.patch("trxo.commands.project.create_table", return_value=mock_table)
@@ -70,18 +76,18 @@ def test_list_projects_with_projects(mocker):
     assert mock_table.add_row.call_count == 2
 
 
-def test_delete_project_success(mocker):
-    mock_store = mocker.patch("trxo.commands.project.config_store")
-    mock_store.get_projects.return_value = {"proj1": {}}
-
-    delete_project("proj1")
-
-    mock_store.delete_project.assert_called_once_with("proj1")
-
+@pytest.mark.parametrize(
+    "existing,should_raise",
+    [({"proj1": {}}, False), ({}, True)],
+    ids=["success", "not_found"],
+)
+def test_delete_project(store, existing, should_raise):
+    store.get_projects.return_value = existing
 
-def test_delete_project_not_found(mocker):
-    mock_store = mocker.patch("trxo.commands.project.config_store")
-    mock_store.get_projects.return_value = {}
+    with _raises_exit(should_raise):
+        delete_project("proj1")
 
-    with pytest.raises(typer.Exit):
-        delete_project("missing")
+    if should_raise:
+        store.delete_project.assert_not_called()
+    else:
+        store.delete_project.assert_called_once_with("proj1")
@@ -2,18 +2,48 @@
 
 This module provides:
 - Common fixtures (temp directories, mock objects, etc.)
-- Test configuration (logging, paths, markers)
+- Test configuration (logging, markers)
 - Helper utilities for unit and integration tests
 """
 
-import sys
-from pathlib import Path
+import importlib
+import json
 
+import httpx
 import pytest
 
-# Add src/ to path so test modules can import trxo package
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root / "src"))
+# Modules whose console helpers are silenced for every test (see _silence_console)
+SILENCED_CONSOLE_MODULES = (
+    "trxo.commands.imports.services",
+    "trxo.commands.imports.themes",
+    "trxo.commands.imports.webhooks",
+    "trxo.commands.shared.base_command",
+    "trxo.commands.shared.auth_manager",
+    "trxo.utils.imports.cherry_pick_filter",
+    "trxo.utils.imports.file_loader",
+)
+
+
+# Pre-serialized body for sample_items_file
+SAMPLE_ITEMS_JSON = b'{"data":{"result":[{"id":"1"},{"id":"2"}]}}'
+
+
+def _noop(*args, **kwargs):
+    return None
+
+
+@pytest.fixture(autouse=True)
+def _silence_console(monkeypatch):
+    """Replace console output helpers with no-ops in SILENCED_CONSOLE_MODULES.
+
+    Tests that assert on output can still ``mocker.patch`` the helper, which
+    takes precedence for the duration of the test.
+    """
+    for module_name in SILENCED_CONSOLE_MODULES:
+        module = importlib.import_module(module_name)
+        for name in ("info", "error", "warning", "success"):
+            if hasattr(module, name):
+                monkeypatch.setattr(module, name, _noop)
 
 
 @pytest.fixture
@@ -22,9 +52,12 @@ def temp_dir(tmp_path):
     return tmp_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_config():
-    """Provide a mock configuration dict for testing."""
+    """Provide a mock configuration dict for testing.
+
+    Shared across the session; tests must copy it before mutating.
+    """
     return {
         "auth": {
             "type": "service_account",
@@ -36,9 +69,12 @@ def mock_config():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_json_data():
-    """Provide sample JSON data for export/import testing."""
+    """Provide sample JSON data for export/import testing.
+
+    Shared across the session; tests must copy it before mutating.
+    """
     return {
         "id": "test-id-123",
         "name": "Test Resource",
@@ -48,6 +84,74 @@ def sample_json_data():
     }
 
 
+@pytest.fixture(scope="session")
+def sample_items_file(tmp_path_factory):
+    """Path to a read-only import file written once per session.
+
+    Tests must not modify it; use ``tmp_path`` for files a test writes to.
+    """
+    path = tmp_path_factory.mktemp("data") / "data.json"
+    path.write_bytes(SAMPLE_ITEMS_JSON)
+    return str(path)
+
+
+@pytest.fixture
+def write_json():
+    """Provide a helper that writes ``obj`` to ``path`` as compact JSON."""
+
+    def _write(path, obj):
+        path.write_text(json.dumps(obj, separators=(",", ":")), encoding="utf-8")
+        return path
+
+    return _write
+
+
+@pytest.fixture
+def http_transport(monkeypatch):
+    """Serve every ``httpx.Client`` request from a MockTransport.
+
+    Returns a callable taking the status code (and optional body) the
+    transport should answer with; requests still go through real httpx
+    request/response handling, so ``raise_for_status`` behaves as in production.
+    """
+    real_client = httpx.Client
+
+    def _install(status_code, content=b""):
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(status_code, content=content)
+        )
+        monkeypatch.setattr(
+            httpx,
+            "Client",
+            lambda *args, **kwargs: real_client(*args, transport=transport, **kwargs),
+        )
+
+    return _install
+
+
+@pytest.fixture
+def patch_http(mocker):
+    """Patch ``make_http_request`` and ``build_auth_headers`` on a command in one call.
+
+    Returns a callable taking the target object (plus any extra attributes to
+    patch) and returning the ``patch.multiple`` dict of installed mocks.
+    ``build_auth_headers`` returns an empty header dict unless overridden.
+    """
+
+    def _patch(obj, **overrides):
+        attrs = {
+            "make_http_request": mocker.DEFAULT,
+            "build_auth_headers": mocker.DEFAULT,
+        }
+        attrs.update(overrides)
+        patched = mocker.patch.multiple(obj, **attrs)
+        if "build_auth_headers" in patched:
+            patched["build_auth_headers"].return_value = {}
+        return patched
+
+    return _patch
+
+
 def pytest_configure(config):
     """Register custom pytest markers."""
     config.addinivalue_line(
@@ -59,11 +163,19 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "slow: mark test as slow (deselect with '-m \"not slow\"')"
     )
+    config.addinivalue_line(
+        "markers", "imports: mark test as an importer command test (xdist-safe)"
+    )
 
 
 def pytest_collection_modifyitems(config, items):
     """Auto-mark tests based on their location."""
+    # Resolve the markers once; pytest.mark.<name> is validated on every access
+    unit, imports = pytest.mark.unit, pytest.mark.imports
     for item in items:
         # Mark all tests as unit by default unless they're in specific paths
         if "integration" not in item.nodeid:
-            item.add_marker(pytest.mark.unit)
+            item.add_marker(unit)
+        # Importer command tests share no mutable state and can run per-worker
+        if "tests/commands/imports/" in item.nodeid:
+            item.add_marker(imports)
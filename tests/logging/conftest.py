@@ -0,0 +1,10 @@
+"""Shared fixtures for the logging tests."""
+
+import pytest
+
+
+@pytest.fixture
+def patched_log_dir(mocker, tmp_path):
+    """Point trxo.logging.config.get_log_directory at tmp_path and return it."""
+    mocker.patch("trxo.logging.config.get_log_directory", return_value=tmp_path)
+    return tmp_path
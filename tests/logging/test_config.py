@@ -28,55 +28,25 @@ def test_log_config_defaults():
     assert cfg.max_payload_size == 1024
 
 
-def test_get_log_directory_windows(mocker, tmp_path):
-    mocker.patch("platform.system", return_value="Windows")
-    mocker.patch.dict(os.environ, {"APPDATA": str(tmp_path)})
-    log_dir = get_log_directory()
-
-    assert log_dir.exists()
-    assert log_dir.name == "logs"
-
-
-def test_get_log_directory_windows_fallback_home(mocker, tmp_path):
-    mocker.patch("platform.system", return_value="Windows")
-    mocker.patch.dict(os.environ, {"APPDATA": ""})
-    mocker.patch("pathlib.Path.home", return_value=tmp_path)
-
-    log_dir = get_log_directory()
-
-    assert log_dir.exists()
-    assert log_dir.name == "logs"
-
-
-def test_get_log_directory_macos(mocker, tmp_path):
-    mocker.patch("platform.system", return_value="Darwin")
-    mocker.patch("pathlib.Path.home", return_value=tmp_path)
-
-    log_dir = get_log_directory()
-
-    assert log_dir.exists()
-    assert "Library" in str(log_dir)
-
-
-def test_get_log_directory_linux_with_xdg(mocker, tmp_path):
-    mocker.patch("platform.system", return_value="Linux")
-    mocker.patch.dict(os.environ, {"XDG_DATA_HOME": str(tmp_path)})
-
-    log_dir = get_log_directory()
-
-    assert log_dir.exists()
-    assert log_dir.name == "logs"
-
-
-def test_get_log_directory_linux_fallback_home(mocker, tmp_path):
-    mocker.patch("platform.system", return_value="Linux")
-    mocker.patch.dict(os.environ, {"XDG_DATA_HOME": ""})
+@pytest.mark.parametrize(
+    "system,env,expected_part",
+    [
+        pytest.param("Windows", {"APPDATA": "{tmp}"}, "logs", id="windows"),
+        pytest.param("Windows", {"APPDATA": ""}, "logs", id="windows_fallback_home"),
+        pytest.param("Darwin", {}, "Library", id="macos"),
+        pytest.param("Linux", {"XDG_DATA_HOME": "{tmp}"}, "logs", id="linux_with_xdg"),
+        pytest.param("Linux", {"XDG_DATA_HOME": ""}, "logs", id="linux_fallback_home"),
+    ],
+)
+def test_get_log_directory(mocker, tmp_path, system, env, expected_part):
+    mocker.patch("platform.system", return_value=system)
+    mocker.patch.dict(os.environ, {k: v.format(tmp=tmp_path) for k, v in env.items()})
     mocker.patch("pathlib.Path.home", return_value=tmp_path)
 
     log_dir = get_log_directory()
 
     assert log_dir.exists()
-    assert log_dir.name == "logs"
+    assert expected_part in log_dir.parts
 
 
 def test_get_log_directory_permission_error_fallback(mocker, tmp_path):
@@ -101,18 +71,14 @@ def test_get_log_directory_permission_error_fallback(mocker, tmp_path):
     assert log_dir.name == "logs"
 
 
-def test_get_log_file_path_default_config(mocker, tmp_path):
-    mocker.patch("trxo.logging.config.get_log_directory", return_value=tmp_path)
-
+def test_get_log_file_path_default_config(patched_log_dir):
     path = get_log_file_path()
 
-    assert path.parent == tmp_path
+    assert path.parent == patched_log_dir
     assert path.name.endswith(".log")
 
 
-def test_get_log_file_path_custom_config(mocker, tmp_path):
-    mocker.patch("trxo.logging.config.get_log_directory", return_value=tmp_path)
-
+def test_get_log_file_path_custom_config(patched_log_dir):
     cfg = LogConfig(log_filename="custom.log")
     path = get_log_file_path(cfg)
 
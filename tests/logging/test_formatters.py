@@ -1,3 +1,4 @@
+import copy
 import logging
 
 import pytest
@@ -5,17 +6,30 @@ import pytest
 from trxo.logging.formatters import APICallFormatter, MultiplexFormatter, TRxOFormatter
 
 
-def test_trxo_formatter_basic_format():
+@pytest.fixture(scope="session")
+def record_template():
+    return logging.LogRecord("trxo.test", logging.INFO, __file__, 10, "", (), None)
+
+
+@pytest.fixture
+def make_record(record_template):
+    """Copy the template record, overriding name, level, msg and extra attributes."""
+
+    def _make(name="trxo.test", level=logging.INFO, msg="", **attrs):
+        record = copy.copy(record_template)
+        record.name = name
+        record.levelno = level
+        record.levelname = logging.getLevelName(level)
+        record.msg = msg
+        record.__dict__.update(attrs)
+        return record
+
+    return _make
+
+
+def test_trxo_formatter_basic_format(make_record):
     formatter = TRxOFormatter(include_timestamps=False)
-    record = logging.LogRecord(
-        name="trxo.test",
-        level=logging.INFO,
-        pathname=__file__,
-        lineno=10,
-        msg="hello",
-        args=(),
-        exc_info=None,
-    )
+    record = make_record(msg="hello")
 
     output = formatter.format(record)
     assert "INFO" in output
@@ -23,59 +37,37 @@ def test_trxo_formatter_basic_format():
     assert "hello" in output
 
 
-def test_trxo_formatter_sanitizes_msg(mocker):
+def test_trxo_formatter_sanitizes_msg(mocker, make_record):
     mocker.patch(
         "trxo.logging.formatters.sanitize_data",
         return_value={"token": "***"},
     )
 
     formatter = TRxOFormatter(include_timestamps=False)
-    record = logging.LogRecord(
-        name="trxo.test",
-        level=logging.INFO,
-        pathname=__file__,
-        lineno=10,
-        msg={"token": "secret"},
-        args=(),
-        exc_info=None,
-    )
+    record = make_record(msg={"token": "secret"})
 
     output = formatter.format(record)
     assert "***" in output
 
 
-def test_trxo_formatter_sanitizes_args(mocker):
-    mocker.patch(
+def test_trxo_formatter_sanitizes_args(mocker, make_record):
+    sanitize = mocker.patch(
         "trxo.logging.formatters.sanitize_data",
         return_value={"token": "***"},
     )
 
     formatter = TRxOFormatter(include_timestamps=False)
-    record = logging.LogRecord(
-        name="trxo.test",
-        level=logging.INFO,
-        pathname=__file__,
-        lineno=10,
-        msg={"token": "secret"},
-        args=(),
-        exc_info=None,
-    )
+    record = make_record(msg="payload %s", args=({"token": "secret"},))
 
     output = formatter.format(record)
     assert "***" in output
+    assert "secret" not in output
+    assert sanitize.call_args.args[0] == {"token": "secret"}
 
 
-def test_api_call_formatter_basic():
+def test_api_call_formatter_basic(make_record):
     formatter = APICallFormatter()
-    record = logging.LogRecord(
-        name="trxo.api",
-        level=logging.DEBUG,
-        pathname=__file__,
-        lineno=10,
-        msg="",
-        args=(),
-        exc_info=None,
-    )
+    record = make_record(name="trxo.api", level=logging.DEBUG)
 
     record.api_method = "GET"
     record.api_url = "/test"
@@ -88,20 +80,12 @@ def test_api_call_formatter_basic():
     assert "ms" in output
 
 
-def test_multiplex_formatter_uses_api_formatter():
+def test_multiplex_formatter_uses_api_formatter(make_record):
     default_formatter = TRxOFormatter(include_timestamps=False)
     api_formatter = APICallFormatter()
     formatter = MultiplexFormatter(default_formatter, api_formatter)
 
-    record = logging.LogRecord(
-        name="trxo.api",
-        level=logging.INFO,
-        pathname=__file__,
-        lineno=10,
-        msg="",
-        args=(),
-        exc_info=None,
-    )
+    record = make_record(name="trxo.api")
 
     record.api_method = "POST"
     record.api_url = "/login"
@@ -113,20 +97,12 @@ def test_multiplex_formatter_uses_api_formatter():
     assert "401" in output
 
 
-def test_multiplex_formatter_uses_default_formatter():
+def test_multiplex_formatter_uses_default_formatter(make_record):
     default_formatter = TRxOFormatter(include_timestamps=False)
     api_formatter = APICallFormatter()
     formatter = MultiplexFormatter(default_formatter, api_formatter)
 
-    record = logging.LogRecord(
-        name="trxo.test",
-        level=logging.WARNING,
-        pathname=__file__,
-        lineno=10,
-        msg="warning message",
-        args=(),
-        exc_info=None,
-    )
+    record = make_record(level=logging.WARNING, msg="warning message")
 
     output = formatter.format(record)
     assert "WARNING" in output
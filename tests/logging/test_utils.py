@@ -83,11 +83,6 @@ def test_cleanup_old_logs_no_dir(tmp_path):
     assert removed == 0
 
 
-def test_get_log_directory_delegates_to_config(mocker, tmp_path):
-    mocker.patch(
-        "trxo.logging.config.get_log_directory",
-        return_value=tmp_path,
-    )
-
+def test_get_log_directory_delegates_to_config(patched_log_dir):
     result = get_log_directory()
-    assert result == tmp_path
+    assert result == patched_log_dir
@@ -16,6 +16,7 @@ import pytest
 def main(argv=None):
     """Run pytest with the provided argv list. Returns pytest exit code."""
     if argv is None:
+        # --import-mode=importlib comes from addopts in pyproject.toml
         argv = ["-v"]
     return pytest.main(argv)
 
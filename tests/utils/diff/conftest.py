@@ -0,0 +1,27 @@
+"""Shared fixtures for the diff utility tests.
+
+DiffEngine, DiffReporter and DiffManager keep no per-call state, so one
+instance per module is shared. Tests that replace attributes on them must do
+so through ``mocker.patch.object`` so the change is undone after the test.
+"""
+
+import pytest
+
+from trxo.utils.diff.diff_engine import DiffEngine
+from trxo.utils.diff.diff_manager import DiffManager
+from trxo.utils.diff.diff_reporter import DiffReporter
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return DiffEngine()
+
+
+@pytest.fixture(scope="module")
+def reporter():
+    return DiffReporter()
+
+
+@pytest.fixture(scope="module")
+def manager():
+    return DiffManager()
@@ -1,6 +1,7 @@
-import json
 from pathlib import Path
 
+import pytest
+
 from trxo.constants import DEFAULT_REALM
 from trxo.utils.diff.data_fetcher import DataFetcher, get_command_api_endpoint
 
@@ -53,11 +54,10 @@ def test_fetch_data_failure_returns_none(mocker):
     assert result is None
 
 
-def test_fetch_from_local_file_happy_path(tmp_path, mocker):
+def test_fetch_from_local_file_happy_path(tmp_path, mocker, write_json):
     fetcher = DataFetcher()
 
-    file_path = tmp_path / "data.json"
-    file_path.write_text(json.dumps({"x": 1}))
+    file_path = write_json(tmp_path / "data.json", {"x": 1})
 
     mocker.patch.object(fetcher, "_get_storage_mode", return_value="local")
 
@@ -83,11 +83,9 @@ def test_fetch_from_local_file_not_found(mocker):
     assert result is None
 
 
-def test_fetch_from_git_no_repo_returns_none(mocker, tmp_path):
-    fetcher = DataFetcher()
-
-    mocker.patch.object(fetcher, "_get_storage_mode", return_value="git")
-
+@pytest.fixture
+def git_env(mocker, tmp_path):
+    """Git credentials and a repo base path of tmp_path for git-mode fetches."""
     mock_config = mocker.Mock()
     mock_config.get_git_credentials.return_value = {
         "username": "u",
@@ -97,6 +95,13 @@ def test_fetch_from_git_no_repo_returns_none(mocker, tmp_path):
 
     mocker.patch("trxo.utils.config_store.ConfigStore", return_value=mock_config)
     mocker.patch("trxo.utils.git.get_repo_base_path", return_value=tmp_path)
+    return tmp_path
+
+
+def test_fetch_from_git_no_repo_returns_none(mocker, git_env):
+    fetcher = DataFetcher()
+
+    mocker.patch.object(fetcher, "_get_storage_mode", return_value="git")
     mocker.patch("trxo.utils.diff.data_fetcher.warning")
     mocker.patch("trxo.utils.diff.data_fetcher.error")
 
@@ -108,28 +113,17 @@ def test_fetch_from_git_no_repo_returns_none(mocker, tmp_path):
     assert result is None
 
 
-def test_fetch_from_git_happy_path(mocker, tmp_path):
+def test_fetch_from_git_happy_path(mocker, git_env, write_json):
     fetcher = DataFetcher()
 
-    repo_path = tmp_path / "repo"
+    repo_path = git_env / "repo"
     repo_path.mkdir()
     (repo_path / ".git").mkdir()
 
-    file_path = repo_path / "scripts_alpha.json"
-    file_path.write_text(json.dumps({"x": 1}))
+    write_json(repo_path / "scripts_alpha.json", {"x": 1})
 
     mocker.patch.object(fetcher, "_get_storage_mode", return_value="git")
 
-    mock_config = mocker.Mock()
-    mock_config.get_git_credentials.return_value = {
-        "username": "u",
-        "repo_url": "https://x/repo.git",
-        "token": "t",
-    }
-
-    mocker.patch("trxo.utils.config_store.ConfigStore", return_value=mock_config)
-    mocker.patch("trxo.utils.git.get_repo_base_path", return_value=tmp_path)
-
     result = fetcher.fetch_from_file_or_git(
         command_name="scripts",
         realm=DEFAULT_REALM,
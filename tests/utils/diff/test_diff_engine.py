@@ -1,6 +1,6 @@
 import pytest
 
-from trxo.utils.diff.diff_engine import ChangeType, DiffEngine
+from trxo.utils.diff.diff_engine import ChangeType
 
 
 def _mock_insights(mocker):
@@ -10,82 +10,72 @@ def _mock_insights(mocker):
     )
 
 
-def test_compare_data_added_item(mocker):
-    engine = DiffEngine()
-
-    current = {"result": []}
-    new = {"result": [{"_id": "1", "name": "A"}]}
-
-    mocker.patch("trxo.utils.diff.diff_engine.DeepDiff", return_value={})
-    _mock_insights(mocker)
-
-    result = engine.compare_data(current, new, "scripts", "alpha")
-
-    assert len(result.added_items) == 1
-    assert result.added_items[0].change_type == ChangeType.ADDED
-    assert result.total_items_current == 0
-    assert result.total_items_new == 1
-
-
-def test_compare_data_removed_item(mocker):
-    engine = DiffEngine()
-
-    current = {"result": [{"_id": "1", "name": "A"}]}
-    new = {"result": []}
-
-    mocker.patch("trxo.utils.diff.diff_engine.DeepDiff", return_value={})
-    _mock_insights(mocker)
-
-    result = engine.compare_data(current, new, "scripts", "alpha")
-
-    assert len(result.removed_items) == 1
-    assert result.removed_items[0].change_type == ChangeType.REMOVED
-
-
-def test_compare_data_modified_item(mocker):
-    engine = DiffEngine()
-
-    current = {"result": [{"_id": "1", "name": "A", "x": 1}]}
-    new = {"result": [{"_id": "1", "name": "A", "x": 2}]}
-
-    fake_diff = {"values_changed": {"root['x']": {"old_value": 1, "new_value": 2}}}
-
+@pytest.fixture(scope="module")
+def _deep_diff(module_mocker):
+    return module_mocker.patch("trxo.utils.diff.diff_engine.DeepDiff")
+
+
+@pytest.fixture
+def deep_diff(_deep_diff):
+    """Module-wide DeepDiff patch, reset for each test."""
+    _deep_diff.reset_mock(return_value=True, side_effect=True)
+    return _deep_diff
+
+
+_ITEM_A = {"_id": "1", "name": "A"}
+_VALUE_CHANGED = {"values_changed": {"root['x']": {"old_value": 1, "new_value": 2}}}
+
+
+@pytest.mark.parametrize(
+    "current,new,changes,bucket,change_type",
+    [
+        pytest.param([], [_ITEM_A], {}, "added_items", ChangeType.ADDED, id="added"),
+        pytest.param(
+            [_ITEM_A], [], {}, "removed_items", ChangeType.REMOVED, id="removed"
+        ),
+        pytest.param(
+            [{**_ITEM_A, "x": 1}],
+            [{**_ITEM_A, "x": 2}],
+            _VALUE_CHANGED,
+            "modified_items",
+            ChangeType.MODIFIED,
+            id="modified",
+        ),
+        pytest.param(
+            [_ITEM_A],
+            [_ITEM_A],
+            {},
+            "unchanged_items",
+            ChangeType.UNCHANGED,
+            id="unchanged",
+        ),
+    ],
+)
+def test_compare_data(
+    mocker, engine, deep_diff, current, new, changes, bucket, change_type
+):
     diff_obj = mocker.MagicMock()
-    diff_obj.to_dict.return_value = fake_diff
-    diff_obj.get.side_effect = fake_diff.get
-    diff_obj.__bool__.return_value = True
+    diff_obj.to_dict.return_value = changes
+    diff_obj.get.side_effect = changes.get
+    diff_obj.__bool__.return_value = bool(changes)
 
-    mocker.patch("trxo.utils.diff.diff_engine.DeepDiff", return_value=diff_obj)
+    deep_diff.return_value = diff_obj
     _mock_insights(mocker)
 
-    result = engine.compare_data(current, new, "scripts", "alpha")
-
-    assert len(result.modified_items) == 1
-    assert result.modified_items[0].change_type == ChangeType.MODIFIED
-    assert result.modified_items[0].changes_count == 1
-
-
-def test_compare_data_unchanged_item(mocker):
-    engine = DiffEngine()
-
-    current = {"result": [{"_id": "1", "name": "A"}]}
-    new = {"result": [{"_id": "1", "name": "A"}]}
-
-    diff_obj = mocker.MagicMock()
-    diff_obj.__bool__.return_value = False
-
-    mocker.patch("trxo.utils.diff.diff_engine.DeepDiff", return_value=diff_obj)
-    _mock_insights(mocker)
-
-    result = engine.compare_data(current, new, "scripts", "alpha")
-
-    assert len(result.unchanged_items) == 1
-    assert result.unchanged_items[0].change_type == ChangeType.UNCHANGED
+    result = engine.compare_data(
+        {"result": current}, {"result": new}, "scripts", "alpha"
+    )
 
+    items = getattr(result, bucket)
+    assert len(items) == 1
+    assert items[0].change_type == change_type
+    assert result.total_items_current == len(current)
+    assert result.total_items_new == len(new)
+    if changes:
+        assert items[0].changes_count == 1
 
-def test_extract_items_from_data_wrapper():
-    engine = DiffEngine()
 
+def test_extract_items_from_data_wrapper(engine):
     data = {"data": {"result": [{"_id": "1"}]}}
 
     items = engine._extract_items(data)
@@ -95,9 +85,7 @@ def test_extract_items_from_data_wrapper():
     assert items == [{"_id": "1"}]
 
 
-def test_extract_items_from_command_name_key():
-    engine = DiffEngine()
-
+def test_extract_items_from_command_name_key(engine):
     data = {"nodes": {"1": {"_id": "1", "name": "A"}}}
 
     items = engine._extract_items(data, "nodes")
@@ -105,9 +93,7 @@ def test_extract_items_from_command_name_key():
     assert items == []
 
 
-def test_extract_items_from_camel_case_key():
-    engine = DiffEngine()
-
+def test_extract_items_from_camel_case_key(engine):
     data = {"emailTemplates": {"1": {"_id": "1", "name": "A"}}}
 
     items = engine._extract_items(data, "email_templates")
@@ -115,9 +101,7 @@ def test_extract_items_from_camel_case_key():
     assert items == []
 
 
-def test_create_id_map_filters_items_without_id():
-    engine = DiffEngine()
-
+def test_create_id_map_filters_items_without_id(engine):
     items = [{"_id": "1"}, {"x": 2}]
 
     id_map = engine._create_id_map(items)
@@ -126,17 +110,13 @@ def test_create_id_map_filters_items_without_id():
     assert len(id_map) == 1
 
 
-def test_get_item_id_priority():
-    engine = DiffEngine()
-
+def test_get_item_id_priority(engine):
     item = {"id": "2", "_id": "1"}
 
     assert engine._get_item_id(item) == "1"
 
 
-def test_get_item_name_priority():
-    engine = DiffEngine()
-
+def test_get_item_name_priority(engine):
     item = {"displayName": "D", "name": "N"}
 
     assert engine._get_item_name(item) == "N"
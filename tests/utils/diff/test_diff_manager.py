@@ -2,86 +2,62 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from trxo.utils.diff.diff_manager import DiffManager
+# scenario -> (current data fetched from the server, data loaded from file/git)
+_PERFORM_DIFF_SCENARIOS = {
+    "success": ({"current": 1}, {"new": 2}),
+    "current_none": (None, {"new": 2}),
+    "import_none": ({"current": 1}, None),
+}
 
 
-def test_perform_diff_success(mocker):
-    manager = DiffManager()
+@pytest.fixture
+def scenario(request, mocker, manager):
+    """Stub every perform_diff collaborator on the shared manager for one scenario."""
+    current, new = _PERFORM_DIFF_SCENARIOS[request.param]
 
-    # Mock get_command_api_endpoint at correct import path
     mocker.patch(
         "trxo.utils.diff.diff_manager.get_command_api_endpoint",
         return_value=("/api/test", None),
     )
-
-    # Mock DataFetcher methods
-    manager.data_fetcher.fetch_data = mocker.MagicMock(return_value={"current": 1})
-    manager.data_fetcher.fetch_from_file_or_git = mocker.MagicMock(
-        return_value={"new": 2}
+    mocker.patch.object(manager.data_fetcher, "fetch_data", return_value=current)
+    mocker.patch.object(
+        manager.data_fetcher, "fetch_from_file_or_git", return_value=new
     )
-
-    # Mock DiffEngine
-    fake_diff_result = MagicMock()
-    manager.diff_engine.compare_data = mocker.MagicMock(return_value=fake_diff_result)
-
-    # Mock DiffReporter
-    manager.diff_reporter.display_summary = mocker.MagicMock()
-    manager.diff_reporter.generate_html_diff = mocker.MagicMock(
-        return_value="/tmp/report.html"
+    mocker.patch.object(manager.diff_engine, "compare_data", return_value=MagicMock())
+    mocker.patch.object(manager.diff_reporter, "display_summary")
+    mocker.patch.object(
+        manager.diff_reporter, "generate_html_diff", return_value="/tmp/report.html"
     )
+    return request.param
+
 
+@pytest.mark.parametrize("scenario", list(_PERFORM_DIFF_SCENARIOS), indirect=True)
+def test_perform_diff(manager, scenario):
     result = manager.perform_diff(
         command_name="journeys",
         file_path="test.json",
         realm="alpha",
     )
 
-    assert result == fake_diff_result
-
     manager.data_fetcher.fetch_data.assert_called_once()
+    if scenario != "success":
+        assert result is None
+        manager.diff_engine.compare_data.assert_not_called()
+        return
+
+    assert result is manager.diff_engine.compare_data.return_value
     manager.data_fetcher.fetch_from_file_or_git.assert_called_once()
     manager.diff_engine.compare_data.assert_called_once()
     manager.diff_reporter.display_summary.assert_called_once()
     manager.diff_reporter.generate_html_diff.assert_called_once()
 
 
-def test_perform_diff_fails_on_current_data_fetch(mocker):
-    manager = DiffManager()
-
-    mocker.patch(
-        "trxo.utils.diff.diff_manager.get_command_api_endpoint",
-        return_value=("/api/test", None),
-    )
-
-    manager.data_fetcher.fetch_data = mocker.MagicMock(return_value=None)
-
-    result = manager.perform_diff(command_name="journeys")
-
-    assert result is None
-
-
-def test_perform_diff_fails_on_import_data_fetch(mocker):
-    manager = DiffManager()
-
-    mocker.patch(
-        "trxo.utils.diff.diff_manager.get_command_api_endpoint",
-        return_value=("/api/test", None),
-    )
-
-    manager.data_fetcher.fetch_data = mocker.MagicMock(return_value={"current": 1})
-    manager.data_fetcher.fetch_from_file_or_git = mocker.MagicMock(return_value=None)
-
-    result = manager.perform_diff(command_name="journeys")
-
-    assert result is None
-
-
-def test_quick_diff_success(mocker):
-    manager = DiffManager()
-
+def test_quick_diff_success(mocker, manager):
     fake_diff_result = MagicMock()
-    manager.diff_engine.compare_data = mocker.MagicMock(return_value=fake_diff_result)
-    manager.diff_reporter.display_summary = mocker.MagicMock()
+    mocker.patch.object(
+        manager.diff_engine, "compare_data", return_value=fake_diff_result
+    )
+    mocker.patch.object(manager.diff_reporter, "display_summary")
 
     result = manager.quick_diff(
         command_name="journeys",
@@ -95,10 +71,10 @@ def test_quick_diff_success(mocker):
     manager.diff_reporter.display_summary.assert_called_once()
 
 
-def test_quick_diff_exception(mocker):
-    manager = DiffManager()
-
-    manager.diff_engine.compare_data = mocker.MagicMock(side_effect=Exception("Boom"))
+def test_quick_diff_exception(mocker, manager):
+    mocker.patch.object(
+        manager.diff_engine, "compare_data", side_effect=Exception("Boom")
+    )
 
     result = manager.quick_diff(
         command_name="journeys",
@@ -1,7 +1,7 @@
+from dataclasses import replace
 from pathlib import Path
 
 from trxo.utils.diff.diff_engine import ChangeType, DiffResult
-from trxo.utils.diff.diff_reporter import DiffReporter
 
 
 class FakeItem:
@@ -14,134 +14,114 @@ class FakeItem:
         self.detailed_changes = detailed_changes or {}
 
 
-def make_diff_result(
-    cmd="x",
+# Read-only catalog shared by the tests; derive variants with dataclasses.replace
+_ADDED_ITEM = FakeItem("1", "a", ChangeType.ADDED)
+_MODIFIED_ITEM = FakeItem("2", "b", ChangeType.MODIFIED)
+_REMOVED_ITEM = FakeItem("3", "c", ChangeType.REMOVED)
+_EMPTY_DR = DiffResult(
+    command_name="x",
     realm=None,
-    added=None,
-    modified=None,
-    removed=None,
-    unchanged=None,
-    insights=None,
-):
-    return DiffResult(
-        command_name=cmd,
-        realm=realm,
-        total_items_current=1,
-        total_items_new=2,
-        added_items=added or [],
-        modified_items=modified or [],
-        removed_items=removed or [],
-        unchanged_items=unchanged or [],
-        raw_diff={},
-        key_insights=insights or [],
-    )
+    total_items_current=1,
+    total_items_new=2,
+    added_items=[],
+    modified_items=[],
+    removed_items=[],
+    unchanged_items=[],
+    raw_diff={},
+    key_insights=[],
+)
 
 
-def test_display_summary_no_changes(mocker):
-    rep = DiffReporter()
-    mocker.patch.object(rep, "console")
-    dr = make_diff_result()
-    rep.display_summary(dr)
+def test_display_summary_no_changes(mocker, reporter):
+    mocker.patch.object(reporter, "console")
+    reporter.display_summary(_EMPTY_DR)
 
 
-def test_display_summary_with_changes_and_insights(mocker):
-    rep = DiffReporter()
-    mocker.patch.object(rep, "console")
+def test_display_summary_with_changes_and_insights(mocker, reporter):
+    mocker.patch.object(reporter, "console")
 
-    added = [FakeItem("1", "a", ChangeType.ADDED)]
-    dr = make_diff_result(added=added, insights=["hello"])
+    dr = replace(_EMPTY_DR, added_items=[_ADDED_ITEM], key_insights=["hello"])
 
-    mocker.patch.object(rep, "_display_key_insights")
-    mocker.patch.object(rep, "display_summary")
+    mocker.patch.object(reporter, "_display_key_insights")
+    mocker.patch.object(reporter, "display_summary")
 
-    rep.display_summary(dr)
+    reporter.display_summary(dr)
 
 
-def test_display_summary_exception(mocker):
-    rep = DiffReporter()
-    mocker.patch.object(rep, "console", side_effect=Exception("boom"))
+def test_display_summary_exception(mocker, reporter):
+    mocker.patch.object(reporter, "console", side_effect=Exception("boom"))
     mocker.patch("trxo.utils.diff.diff_reporter.error")
 
-    dr = make_diff_result()
-    rep.display_summary(dr)
-
+    reporter.display_summary(_EMPTY_DR)
 
-def test_display_changes_table(mocker):
-    rep = DiffReporter()
-    mocker.patch.object(rep, "console")
 
-    items = [
-        FakeItem("1", "a", ChangeType.ADDED),
-        FakeItem("2", "b", ChangeType.MODIFIED),
-        FakeItem("3", "c", ChangeType.REMOVED),
-    ]
+def test_display_changes_table(mocker, reporter):
+    mocker.patch.object(reporter, "console")
 
-    dr = make_diff_result(
-        added=[items[0]],
-        modified=[items[1]],
-        removed=[items[2]],
+    dr = replace(
+        _EMPTY_DR,
+        added_items=[_ADDED_ITEM],
+        modified_items=[_MODIFIED_ITEM],
+        removed_items=[_REMOVED_ITEM],
     )
 
-    rep.display_summary(dr)
+    reporter.display_summary(dr)
 
 
-def test_display_key_insights_non_oauth(mocker):
-    rep = DiffReporter()
-    mocker.patch.object(rep, "console")
+def test_display_key_insights_non_oauth(mocker, reporter):
+    mocker.patch.object(reporter, "console")
 
-    dr = make_diff_result(cmd="services", insights=["x", "y"])
-    rep._display_key_insights(dr.key_insights, dr)
+    dr = replace(_EMPTY_DR, command_name="services", key_insights=["x", "y"])
+    reporter._display_key_insights(dr.key_insights, dr)
 
 
-def test_display_key_insights_oauth(mocker):
-    rep = DiffReporter()
-    mocker.patch.object(rep, "console")
+def test_display_key_insights_oauth(mocker, reporter):
+    mocker.patch.object(reporter, "console")
 
     insights = [
         "grantTypes: c1, c2",
         "scopes: c3",
     ]
 
-    mod = [FakeItem("1", "a", ChangeType.MODIFIED)]
-    dr = make_diff_result(cmd="oauth", modified=mod, insights=insights)
-
-    rep._display_key_insights(dr.key_insights, dr)
+    dr = replace(
+        _EMPTY_DR,
+        command_name="oauth",
+        modified_items=[_MODIFIED_ITEM],
+        key_insights=insights,
+    )
 
+    reporter._display_key_insights(dr.key_insights, dr)
 
-def test_has_changes_true_and_false():
-    rep = DiffReporter()
-    dr1 = make_diff_result()
-    dr2 = make_diff_result(added=[FakeItem("1", "a", ChangeType.ADDED)])
 
-    assert rep._has_changes(dr1) is False
-    assert rep._has_changes(dr2) is True
+def test_has_changes_true_and_false(reporter):
+    assert reporter._has_changes(_EMPTY_DR) is False
+    assert reporter._has_changes(replace(_EMPTY_DR, added_items=[_ADDED_ITEM])) is True
 
 
-def test_generate_html_diff_success(tmp_path, mocker):
-    rep = DiffReporter()
+def test_generate_html_diff_success(tmp_path, mocker, reporter):
     mocker.patch("trxo.utils.diff.diff_reporter.success")
 
-    dr = make_diff_result(cmd="x")
-    path = rep.generate_html_diff(dr, {"a": 1}, {"a": 2}, output_dir=str(tmp_path))
+    path = reporter.generate_html_diff(
+        _EMPTY_DR, {"a": 1}, {"a": 2}, output_dir=str(tmp_path)
+    )
 
     assert Path(path).exists()
 
 
-def test_generate_html_diff_failure(mocker):
-    rep = DiffReporter()
+def test_generate_html_diff_failure(mocker, reporter):
     mocker.patch("trxo.utils.diff.diff_reporter.info")
     mocker.patch("trxo.utils.diff.diff_reporter.error")
 
-    mocker.patch("pathlib.Path.mkdir", side_effect=Exception("boom"))
+    # Patch the module's Path reference only, not pathlib.Path for the process
+    reporter_path = mocker.patch("trxo.utils.diff.diff_reporter.Path")
+    reporter_path.return_value.mkdir.side_effect = Exception("boom")
 
-    dr = make_diff_result(cmd="x")
-    out = rep.generate_html_diff(dr, {}, {}, output_dir="bad")
+    out = reporter.generate_html_diff(_EMPTY_DR, {}, {}, output_dir="bad")
     assert out is None
+    reporter_path.return_value.mkdir.assert_called_once()
 
 
-def test_generate_html_content_branches():
-    rep = DiffReporter()
-
+def test_generate_html_content_branches(reporter):
     detailed = {
         "current_item": {"a": 1},
         "new_item": {"a": 2},
@@ -150,59 +130,51 @@ def test_generate_html_content_branches():
     }
 
     mod = [FakeItem("1", "a", ChangeType.MODIFIED, detailed_changes=detailed)]
-    dr = make_diff_result(cmd="x", modified=mod)
+    dr = replace(_EMPTY_DR, modified_items=mod)
 
-    html = rep._generate_html_content(dr, {"a": 1}, {"a": 2})
+    html = reporter._generate_html_content(dr, {"a": 1}, {"a": 2})
     assert "Diff Report" in html
 
 
-def test_generate_stats_html():
-    rep = DiffReporter()
-    dr = make_diff_result(
-        added=[FakeItem("1", "a", ChangeType.ADDED)],
-        modified=[FakeItem("2", "b", ChangeType.MODIFIED)],
-        removed=[FakeItem("3", "c", ChangeType.REMOVED)],
+def test_generate_stats_html(reporter):
+    dr = replace(
+        _EMPTY_DR,
+        added_items=[_ADDED_ITEM],
+        modified_items=[_MODIFIED_ITEM],
+        removed_items=[_REMOVED_ITEM],
     )
 
-    html = rep._generate_stats_html(dr)
+    html = reporter._generate_stats_html(dr)
     assert "Current Items" in html
     assert "Added" in html
 
 
-def test_generate_changes_html_no_changes():
-    rep = DiffReporter()
-    dr = make_diff_result()
-    html = rep._generate_changes_html(dr)
+def test_generate_changes_html_no_changes(reporter):
+    html = reporter._generate_changes_html(_EMPTY_DR)
     assert "No Changes" in html
 
 
-def test_generate_changes_html_with_changes():
-    rep = DiffReporter()
-    dr = make_diff_result(
-        added=[FakeItem("1", "a", ChangeType.ADDED)],
-        modified=[FakeItem("2", "b", ChangeType.MODIFIED)],
-    )
+def test_generate_changes_html_with_changes(reporter):
+    dr = replace(_EMPTY_DR, added_items=[_ADDED_ITEM], modified_items=[_MODIFIED_ITEM])
 
-    html = rep._generate_changes_html(dr)
+    html = reporter._generate_changes_html(dr)
     assert "Detailed Changes" in html
 
 
-def test_generate_insights_html_non_oauth():
-    rep = DiffReporter()
-    dr = make_diff_result(cmd="services", insights=["  • x", "    - y"])
-    html = rep._generate_insights_html(dr.key_insights, dr)
+def test_generate_insights_html_non_oauth(reporter):
+    dr = replace(_EMPTY_DR, command_name="services", key_insights=["  • x", "    - y"])
+    html = reporter._generate_insights_html(dr.key_insights, dr)
     assert "Key Insights" in html
 
 
-def test_generate_insights_html_oauth():
-    rep = DiffReporter()
-
+def test_generate_insights_html_oauth(reporter):
     insights = ["grantTypes: c1, c2"]
-    dr = make_diff_result(
-        cmd="oauth",
-        modified=[FakeItem("1", "a", ChangeType.MODIFIED)],
-        insights=insights,
+    dr = replace(
+        _EMPTY_DR,
+        command_name="oauth",
+        modified_items=[_MODIFIED_ITEM],
+        key_insights=insights,
     )
 
-    html = rep._generate_insights_html(dr.key_insights, dr)
+    html = reporter._generate_insights_html(dr.key_insights, dr)
     assert "modify" in html.lower() or "oauth" in html.lower()
@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 import pytest
 
@@ -6,11 +6,9 @@ from trxo.utils.diff.insights_generator import InsightsGenerator
 
 
 def make_item(item_id="id1", name="Item 1", diff=None):
-    item = MagicMock()
-    item.item_id = item_id
-    item.item_name = name
-    item.detailed_changes = {"diff": diff or {}}
-    return item
+    return SimpleNamespace(
+        item_id=item_id, item_name=name, detailed_changes={"diff": diff or {}}
+    )
 
 
 def test_generate_key_insights_no_modified_items():
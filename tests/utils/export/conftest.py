@@ -0,0 +1,40 @@
+"""Shared fixtures for the export utility tests."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from trxo.utils.export import file_saver, git_export_handler
+
+# Stand-in for the ``time`` module; the savers only use it for progress pauses
+_NO_SLEEP_TIME = SimpleNamespace(sleep=lambda seconds: None)
+
+
+class _NullTqdm:
+    """Context-manager progress bar that draws nothing."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def update(self, n=1):
+        pass
+
+    def set_description(self, desc=None):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def _quiet_progress(monkeypatch):
+    """Skip the progress bars and their pauses in the file and git savers."""
+    for module in (file_saver, git_export_handler):
+        monkeypatch.setattr(module, "time", _NO_SLEEP_TIME)
+        monkeypatch.setattr(module, "tqdm", _NullTqdm)
@@ -1,12 +1,26 @@
 import json
+from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock
 
 import pytest
 
+from trxo.utils.export import file_saver
 from trxo.utils.export.file_saver import FileSaver
 
 
+class _FrozenDatetime(datetime):
+    """datetime whose now() is pinned so versioned filenames are exact."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2026, 1, 1, 12, 0, 0, tzinfo=tz)
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    monkeypatch.setattr(file_saver, "datetime", _FrozenDatetime)
+
+
 def test_build_versioned_filename_with_realm():
     filename = FileSaver.build_versioned_filename(
         command_name="journeys",
@@ -42,18 +56,14 @@ def test_save_with_progress_success(tmp_path, mocker):
     data = {"a": 1}
     file_path = tmp_path / "test.json"
 
-    fake_pbar = MagicMock()
-    mocker.patch("trxo.utils.export.file_saver.tqdm", return_value=fake_pbar)
-    mocker.patch("trxo.utils.export.file_saver.time.sleep")
     mocker.patch("trxo.utils.export.file_saver.info")
 
     ok = FileSaver.save_with_progress(data, file_path, "test.json")
 
     assert ok is True
-    assert file_path.exists()
-
-    saved = json.loads(file_path.read_text(encoding="utf-8"))
-    assert saved == data
+    # Compare the exact text written (2-space indent, non-ASCII kept as-is)
+    expected = json.dumps(data, indent=2, ensure_ascii=False)
+    assert file_path.read_text(encoding="utf-8") == expected
 
 
 def test_save_with_progress_failure(tmp_path, mocker):
@@ -68,7 +78,7 @@ def test_save_with_progress_failure(tmp_path, mocker):
     assert ok is False
 
 
-def test_save_to_local_basic(tmp_path, mocker):
+def test_save_to_local_basic(tmp_path, mocker, frozen_now):
     data = {"items": [1, 2, 3], "metadata": {"realm": "alpha"}}
 
     mocker.patch(
@@ -82,8 +92,5 @@ def test_save_to_local_basic(tmp_path, mocker):
         output_dir=str(tmp_path),
     )
 
-    assert path is not None
-    saved_path = Path(path)
-    assert saved_path.suffix == ".json"
-    assert "alpha_journeys" in saved_path.name
+    assert Path(path).name == "alpha_journeys_v1_20260101_120000.json"
     assert "version" in data["metadata"]
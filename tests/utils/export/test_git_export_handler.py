@@ -96,8 +96,6 @@ def test_save_to_git_success(mocker, fake_config_store, fake_git_manager, tmp_pa
     handler = GitExportHandler(fake_config_store)
 
     mocker.patch.object(handler, "setup_git_repo", return_value=fake_git_manager)
-    mocker.patch("trxo.utils.export.git_export_handler.tqdm", autospec=True)
-    mocker.patch("trxo.utils.export.git_export_handler.time.sleep")
     mocker.patch("trxo.utils.export.git_export_handler.info")
 
     data = {"data": [{"id": 1}], "metadata": {"realm": "alpha"}}
@@ -1,7 +1,7 @@
 import pytest
 
 from trxo.constants import DEFAULT_PAGE_SIZE
-from trxo.utils.export.pagination_handler import PaginationHandler
+from trxo.utils.export.pagination_handler import PaginationHandler, _split_endpoint
 
 
 class DummyResponse:
@@ -59,12 +59,30 @@ def test_build_endpoint_without_scheme():
     assert result == "/am/json/users?a=1"
 
 
+def test_build_endpoint_with_scheme_keeps_fragment():
+    endpoint = "https://tenant/am/json/users?x=1#top"
+    result = PaginationHandler.build_endpoint_with_params(endpoint, {"y": 2})
+    assert result == "https://tenant/am/json/users?x=1&y=2#top"
+
+
 def test_build_endpoint_drops_none_params():
     endpoint = "/am/json/users?x=1"
     result = PaginationHandler.build_endpoint_with_params(endpoint, {"y": None})
     assert result == "/am/json/users?x=1"
 
 
+def test_build_endpoint_parses_endpoint_once():
+    endpoint = "/am/json/users?_queryFilter=true"
+    _split_endpoint.cache_clear()
+
+    first = PaginationHandler.build_endpoint_with_params(endpoint, {"_pageSize": 1})
+    second = PaginationHandler.build_endpoint_with_params(endpoint, {"_pageSize": 2})
+
+    assert _split_endpoint.cache_info().misses == 1
+    assert first == "/am/json/users?_queryFilter=true&_pageSize=1"
+    assert second == "/am/json/users?_queryFilter=true&_pageSize=2"
+
+
 def test_fetch_all_pages_not_paginated_returns_initial():
     initial = {"result": [1, 2], "remainingPagedResults": 0}
 
@@ -180,6 +198,20 @@ def test_fetch_all_pages_uses_default_page_size_on_parse_error():
     assert result["result"] == [1, 2]
 
 
+@pytest.mark.parametrize(
+    "endpoint, expected",
+    [
+        pytest.param("/users?_pageSize=5", 5, id="only-param"),
+        pytest.param("/users?a=1&_pageSize=7&b=2", 7, id="middle-param"),
+        pytest.param("/users?_pageSize=5x", DEFAULT_PAGE_SIZE, id="not-a-number"),
+        pytest.param("/users?my_pageSize=3", DEFAULT_PAGE_SIZE, id="other-param"),
+        pytest.param("/users", DEFAULT_PAGE_SIZE, id="missing"),
+    ],
+)
+def test_requested_page_size(endpoint, expected):
+    assert PaginationHandler._requested_page_size(endpoint) == expected
+
+
 def test_fetch_all_pages_handles_non_dict_json_response():
     initial = {"result": [1], "remainingPagedResults": 1}
 
@@ -200,3 +232,50 @@ def test_fetch_all_pages_handles_non_dict_json_response():
     )
 
     assert result["result"] == [1]
+
+
+def test_iter_all_pages_requests_next_page_lazily():
+    initial = {"result": [1, 2], "remainingPagedResults": 1}
+    requester = DummyRequester([{"result": [3], "remainingPagedResults": 0}])
+
+    items = PaginationHandler.iter_all_pages(
+        initial,
+        "/users?_pageSize=2",
+        requester,
+        headers={},
+        api_base_url="https://api",
+        prefetch=False,
+    )
+
+    assert [next(items), next(items)] == [1, 2]
+    assert requester.calls == []
+    assert list(items) == [3]
+    assert requester.calls == [
+        ("https://api/users?_pageSize=2&_pagedResultsOffset=2", "GET", {})
+    ]
+
+
+@pytest.mark.parametrize("prefetch", [True, False], ids=["prefetch", "sequential"])
+def test_iter_all_pages_requests_pages_in_order(prefetch):
+    initial = {"result": [1], "remainingPagedResults": 2}
+    requester = DummyRequester(
+        [
+            {"result": [2], "remainingPagedResults": 1},
+            {"result": [3], "remainingPagedResults": 0},
+        ]
+    )
+
+    items = PaginationHandler.iter_all_pages(
+        initial,
+        "/users?_pageSize=1",
+        requester,
+        headers={},
+        api_base_url="https://api",
+        prefetch=prefetch,
+    )
+
+    assert list(items) == [1, 2, 3]
+    assert [call[0] for call in requester.calls] == [
+        "https://api/users?_pageSize=1&_pagedResultsOffset=1",
+        "https://api/users?_pageSize=1&_pagedResultsOffset=2",
+    ]
@@ -23,6 +23,10 @@ def test_is_single_config_object_false_case():
     assert ViewRenderer.is_single_config_object(data) is False
 
 
+def test_is_single_config_object_false_for_non_dict():
+    assert ViewRenderer.is_single_config_object([{"_id": "1", "_rev": "2"}]) is False
+
+
 def test_create_table_no_items(mocker):
     mocker.patch("trxo.utils.export.view_renderer.info")
     ViewRenderer.create_table([], "Title", None)
@@ -46,6 +50,17 @@ def test_create_table_valid(mocker):
     assert len(table.rows) == 1
 
 
+def test_create_table_formats_cells_per_column(mocker):
+    mock_print = mocker.patch("trxo.utils.export.view_renderer.console.print")
+    mocker.patch("trxo.utils.export.view_renderer.info")
+    items = [{"a": None, "b": "x" * 60}, {"a": [1], "b": "y"}]
+    ViewRenderer.create_table(items, "Title", None)
+
+    table = mock_print.call_args[0][0]
+    cells = [list(column.cells) for column in table.columns]
+    assert cells == [["1", "2"], ["", "[1]"], ["x" * 50 + "...", "y"]]
+
+
 def test_create_table_with_selected_columns(mocker):
     mocker.patch("trxo.utils.export.view_renderer.console.print")
     mocker.patch("trxo.utils.export.view_renderer.info")
@@ -15,7 +15,6 @@ from trxo.utils.git.branches import (
 def make_repo(
     local_branches=("main",),
     remote_branches=("main",),
-    diverged=False,
     behind=0,
     ahead=0,
 ):
@@ -65,19 +64,15 @@ def make_repo(
 
     repo.remote.return_value = origin
 
-    def iter_commits(expr):
-        if diverged:
-            if expr.startswith("main..origin/main"):
-                return [1] * behind
-            if expr.startswith("origin/main..main"):
-                return [1] * ahead
-        if "origin/main" in expr and behind > 0:
-            return [1] * behind
-        if "main" in expr and ahead > 0:
-            return [1] * ahead
-        return []
-
-    repo.iter_commits.side_effect = iter_commits
+    # git rev-list --left-right --count origin/main...main -> "behind\tahead"
+    repo.git.rev_list.return_value = f"{behind}\t{ahead}"
+
+    def for_each_ref(fmt, *patterns):
+        refs = [f"refs/heads/{name}" for name in local_branches]
+        refs += [f"refs/remotes/origin/{name}" for name in remote_branches]
+        return "\n".join(r for r in refs if r.startswith(patterns))
+
+    repo.git.for_each_ref.side_effect = for_each_ref
     repo.git.checkout = MagicMock()
     repo.git.pull = MagicMock()
     repo.git.fetch = MagicMock()
@@ -108,11 +103,20 @@ def test_check_branch_sync_status_behind():
     assert status["behind"] == 2
 
 
+def test_check_branch_sync_status_ahead_counts_with_single_rev_list():
+    repo = make_repo(local_branches=("main",), remote_branches=("main",), ahead=3)
+    status = check_branch_sync_status(repo, "main")
+
+    assert (status["behind"], status["ahead"], status["diverged"]) == (0, 3, False)
+    repo.git.rev_list.assert_called_once_with(
+        "--left-right", "--count", "origin/main...main"
+    )
+
+
 def test_check_branch_sync_status_diverged():
     repo = make_repo(
         local_branches=("main",),
         remote_branches=("main",),
-        diverged=True,
         behind=1,
         ahead=1,
     )
@@ -184,6 +188,15 @@ def test_list_branches_basic():
     assert "c" in result["remote"]
 
 
+def test_list_branches_skips_remote_when_fetch_fails():
+    repo = make_repo(local_branches=("a",), remote_branches=("c",))
+    repo.remote.return_value.fetch.side_effect = Exception("offline")
+
+    result = list_branches(repo)
+
+    assert result == {"local": ["a"], "remote": []}
+
+
 def test_branch_exists_local_only():
     repo = make_repo(local_branches=("x",), remote_branches=())
     result = branch_exists(repo, "x")
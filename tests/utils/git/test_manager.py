@@ -1,8 +1,9 @@
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 import pytest
 
 from trxo.constants import DEFAULT_EXPORT_BRANCH
+from trxo.utils.git import manager
 from trxo.utils.git.manager import (
     GitManager,
     get_git_manager,
@@ -13,9 +14,20 @@ from trxo.utils.git.manager import (
 
 
 def make_repo(branch="main"):
-    repo = MagicMock()
-    repo.active_branch.name = branch
-    return repo
+    return SimpleNamespace(active_branch=SimpleNamespace(name=branch))
+
+
+@pytest.fixture(scope="module")
+def _shared_gm():
+    return GitManager("u", "t", "https://github.com/org/repo.git")
+
+
+@pytest.fixture
+def gm(_shared_gm):
+    """Module-wide GitManager with its repo cache cleared for each test."""
+    _shared_gm._repo_cache = None
+    yield _shared_gm
+    _shared_gm._repo_cache = None
 
 
 def test_git_manager_init():
@@ -31,127 +43,94 @@ def test_git_manager_build_secure_url(mocker):
     assert gm.secure_url == "secure"
 
 
-def test_git_manager_validate_credentials(mocker):
-    mocker.patch(
-        "trxo.utils.git.manager.validate_credentials", return_value={"ok": True}
+def test_git_manager_validate_credentials(gm, monkeypatch):
+    monkeypatch.setattr(
+        manager, "validate_credentials", lambda token, url: {"ok": True}
     )
-    gm = GitManager("u", "t", "https://github.com/org/repo.git")
     out = gm.validate_credentials()
     assert out == {"ok": True}
 
 
-def test_git_manager_get_or_create_repo_caches(mocker):
-    repo = make_repo()
-    mocker.patch("trxo.utils.git.manager.get_or_create_repo", return_value=repo)
+def test_git_manager_get_or_create_repo_caches(gm, monkeypatch):
+    monkeypatch.setattr(manager, "get_or_create_repo", lambda *a, **k: make_repo())
 
-    gm = GitManager("u", "t", "https://github.com/org/repo.git")
     r1 = gm.get_or_create_repo({"x": 1})
     r2 = gm.get_or_create_repo({"x": 2})
 
     assert r1 is r2
 
 
-def test_git_manager_ensure_branch(mocker):
+def test_git_manager_ensure_branch(gm, monkeypatch):
     repo = make_repo()
-    mocker.patch("trxo.utils.git.manager.ensure_branch", return_value=repo)
-
-    gm = GitManager("u", "t", "https://github.com/org/repo.git")
+    monkeypatch.setattr(manager, "ensure_branch", lambda *a, **k: repo)
     gm._repo_cache = repo
 
     out = gm.ensure_branch("dev")
     assert out is repo
 
 
-def test_git_manager_commit_and_push(mocker):
-    repo = make_repo()
-    mocker.patch("trxo.utils.git.manager.commit_and_push", return_value=True)
-
-    gm = GitManager("u", "t", "https://github.com/org/repo.git")
-    gm._repo_cache = repo
+def test_git_manager_commit_and_push(gm, monkeypatch):
+    monkeypatch.setattr(manager, "commit_and_push", lambda *a, **k: True)
+    gm._repo_cache = make_repo()
 
     ok = gm.commit_and_push(["x.json"], "msg")
     assert ok is True
 
 
-def test_git_manager_get_current_branch():
-    repo = make_repo("dev")
-    gm = GitManager("u", "t", "https://github.com/org/repo.git")
-    gm._repo_cache = repo
+def test_git_manager_get_current_branch(gm):
+    gm._repo_cache = make_repo("dev")
 
     assert gm.get_current_branch() == "dev"
 
 
-def test_git_manager_get_current_branch_without_repo():
-    gm = GitManager("u", "t", "https://github.com/org/repo.git")
+def test_git_manager_get_current_branch_without_repo(gm):
     with pytest.raises(RuntimeError):
         gm.get_current_branch()
 
 
-def test_setup_git_for_export_default_branch(mocker):
-    repo = make_repo(DEFAULT_EXPORT_BRANCH)
+@pytest.fixture
+def git_env(monkeypatch):
+    """Patch the manager's git collaborators; every step returns git_env.repo."""
+    env = SimpleNamespace(repo=make_repo(DEFAULT_EXPORT_BRANCH))
+    monkeypatch.setattr(manager, "validate_credentials", lambda *a, **k: {"ok": True})
+    monkeypatch.setattr(manager, "get_or_create_repo", lambda *a, **k: env.repo)
+    monkeypatch.setattr(manager, "ensure_branch", lambda *a, **k: env.repo)
+    return env
 
-    mocker.patch(
-        "trxo.utils.git.manager.validate_credentials", return_value={"ok": True}
-    )
-    mocker.patch("trxo.utils.git.manager.get_or_create_repo", return_value=repo)
-    mocker.patch("trxo.utils.git.manager.ensure_branch", return_value=repo)
 
-    gm = setup_git_for_export("u", "t", "https://github.com/org/repo.git")
-
-    assert isinstance(gm, GitManager)
+def _branches(local, remote=False):
+    return lambda *a, **k: {"local": local, "remote": remote}
 
 
-def test_setup_git_for_export_custom_branch(mocker):
-    repo = make_repo("feature")
-
-    mocker.patch(
-        "trxo.utils.git.manager.validate_credentials", return_value={"ok": True}
-    )
-    mocker.patch("trxo.utils.git.manager.get_or_create_repo", return_value=repo)
-    mocker.patch("trxo.utils.git.manager.ensure_branch", return_value=repo)
+@pytest.mark.parametrize("branch", [None, "feature"], ids=["default", "custom"])
+def test_setup_git_for_export(git_env, branch):
+    kwargs = {"branch": branch} if branch else {}
 
-    gm = setup_git_for_export(
-        "u", "t", "https://github.com/org/repo.git", branch="feature"
-    )
+    gm = setup_git_for_export("u", "t", "https://github.com/org/repo.git", **kwargs)
 
     assert isinstance(gm, GitManager)
+    assert gm._repo_cache is git_env.repo
 
 
-def test_setup_git_for_export_failure(mocker):
-    mocker.patch(
-        "trxo.utils.git.manager.validate_credentials", side_effect=Exception("boom")
-    )
+def test_setup_git_for_export_failure(git_env, monkeypatch):
+    def fail(*args, **kwargs):
+        raise Exception("boom")
+
+    monkeypatch.setattr(manager, "validate_credentials", fail)
 
     with pytest.raises(RuntimeError):
         setup_git_for_export("u", "t", "https://github.com/org/repo.git")
 
 
-def test_setup_git_for_import_branch_exists(mocker):
-    repo = make_repo("dev")
-
-    mocker.patch(
-        "trxo.utils.git.manager.validate_credentials", return_value={"ok": True}
-    )
-    mocker.patch("trxo.utils.git.manager.get_or_create_repo", return_value=repo)
-    mocker.patch(
-        "trxo.utils.git.manager.branch_exists",
-        return_value={"local": True, "remote": False},
-    )
-    mocker.patch("trxo.utils.git.manager.ensure_branch", return_value=repo)
+def test_setup_git_for_import_branch_exists(git_env, monkeypatch):
+    monkeypatch.setattr(manager, "branch_exists", _branches(local=True))
 
     gm = setup_git_for_import("u", "t", "https://github.com/org/repo.git", branch="dev")
     assert isinstance(gm, GitManager)
 
 
-def test_setup_git_for_import_branch_missing(mocker):
-    mocker.patch(
-        "trxo.utils.git.manager.validate_credentials", return_value={"ok": True}
-    )
-    mocker.patch("trxo.utils.git.manager.get_or_create_repo", return_value=make_repo())
-    mocker.patch(
-        "trxo.utils.git.manager.branch_exists",
-        return_value={"local": False, "remote": False},
-    )
+def test_setup_git_for_import_branch_missing(git_env, monkeypatch):
+    monkeypatch.setattr(manager, "branch_exists", _branches(local=False))
 
     with pytest.raises(RuntimeError):
         setup_git_for_import("u", "t", "https://github.com/org/repo.git", branch="nope")
@@ -162,15 +141,7 @@ def test_get_git_manager():
     assert isinstance(gm, GitManager)
 
 
-def test_validate_and_setup_git_repo(mocker):
-    repo = make_repo("main")
-
-    mocker.patch(
-        "trxo.utils.git.manager.validate_credentials", return_value={"ok": True}
-    )
-    mocker.patch("trxo.utils.git.manager.get_or_create_repo", return_value=repo)
-    mocker.patch.object(GitManager, "ensure_work_branch", return_value=repo)
-
+def test_validate_and_setup_git_repo(git_env):
     out = validate_and_setup_git_repo("u", "t", "https://github.com/org/repo.git")
 
-    assert out is repo
+    assert out is git_env.repo
@@ -1,3 +1,4 @@
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
@@ -30,9 +31,9 @@ def make_repo(
 
     def diff_side_effect(arg=None):
         if arg == "HEAD":
-            return [MagicMock(a_path=f) for f in staged]
+            return [SimpleNamespace(a_path=f) for f in staged]
         if arg is None:
-            return [MagicMock(a_path=f) for f in changed]
+            return [SimpleNamespace(a_path=f) for f in changed]
         return []
 
     repo.index.diff.side_effect = diff_side_effect
@@ -1,5 +1,6 @@
 from pathlib import Path
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
 from git import GitCommandError, InvalidGitRepositoryError
@@ -12,13 +13,14 @@ from trxo.utils.git.repository import (
     init_empty_repo,
 )
 
+# For tests whose filesystem work is fully mocked; never created on disk
+FAKE_REPO_PATH = Path("/nonexistent/trxo-repo")
+
 
 def make_repo_mock():
-    repo = MagicMock()
-    repo.git = MagicMock()
-    repo.index = MagicMock()
+    # Plain Mock: the repository code never uses dunder protocols on Repo
+    repo = Mock()
     repo.remotes = []
-    repo.remote.return_value = MagicMock()
     return repo
 
 
@@ -57,9 +59,7 @@ def test_init_empty_repo_remote_already_exists(tmp_path, mocker):
 
     repo.create_remote.side_effect = [Exception("exists"), None]
 
-    origin_remote = MagicMock()
-    origin_remote.name = "origin"
-    repo.remotes = [origin_remote]
+    repo.remotes = [SimpleNamespace(name="origin")]
 
     mocker.patch("trxo.utils.git.repository.Repo.init", return_value=repo)
 
@@ -79,14 +79,14 @@ def test_init_empty_repo_checkout_fallback(tmp_path, mocker):
     repo.git.symbolic_ref.assert_called_once_with("HEAD", "refs/heads/dev")
 
 
-def test_clone_or_init_repo_clone_success(tmp_path, mocker):
-    repo = make_repo_mock()
+def test_clone_or_init_repo_clone_success(mocker):
+    repo = object()
     mocker.patch("trxo.utils.git.repository.Repo.clone_from", return_value=repo)
-    result = clone_or_init_repo(tmp_path, "repo", "url", {})
-    assert result == repo
+    result = clone_or_init_repo(FAKE_REPO_PATH, "repo", "url", {})
+    assert result is repo
 
 
-def test_clone_or_init_repo_empty_remote_fallback(tmp_path, mocker):
+def test_clone_or_init_repo_empty_remote_fallback(mocker):
     mocker.patch(
         "trxo.utils.git.repository.Repo.clone_from",
         side_effect=GitCommandError("x", 1, "remote HEAD refers to nonexistent ref"),
@@ -95,18 +95,18 @@ def test_clone_or_init_repo_empty_remote_fallback(tmp_path, mocker):
     init_repo = make_repo_mock()
     mocker.patch("trxo.utils.git.repository.init_empty_repo", return_value=init_repo)
 
-    result = clone_or_init_repo(tmp_path, "repo", "url", {})
+    result = clone_or_init_repo(FAKE_REPO_PATH, "repo", "url", {})
     assert result == init_repo
 
 
-def test_clone_or_init_repo_clone_failure(tmp_path, mocker):
+def test_clone_or_init_repo_clone_failure(mocker):
     mocker.patch(
         "trxo.utils.git.repository.Repo.clone_from",
         side_effect=GitCommandError("x", 1, "boom"),
     )
 
     with pytest.raises(RuntimeError):
-        clone_or_init_repo(tmp_path, "repo", "url", {})
+        clone_or_init_repo(FAKE_REPO_PATH, "repo", "url", {})
 
 
 def test_get_or_create_repo_existing_valid_repo(tmp_path, mocker):
@@ -152,11 +152,11 @@ def test_get_or_create_repo_existing_repo_remote_update_fails(tmp_path, mocker):
     assert result == repo
 
 
-def test_get_or_create_repo_not_existing(tmp_path, mocker):
+def test_get_or_create_repo_not_existing(mocker):
     clone_repo = make_repo_mock()
     mocker.patch(
         "trxo.utils.git.repository.clone_or_init_repo", return_value=clone_repo
     )
 
-    result = get_or_create_repo(tmp_path / "repo", "repo", "url", {})
+    result = get_or_create_repo(FAKE_REPO_PATH, "repo", "url", {})
     assert result == clone_repo
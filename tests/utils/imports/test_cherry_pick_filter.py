@@ -1,12 +1,20 @@
+from unittest.mock import MagicMock
+
 import pytest
 
+from trxo.utils.imports import cherry_pick_filter
 from trxo.utils.imports.cherry_pick_filter import CherryPickFilter
 
 
-def test_apply_filter_happy_path_id_match(mocker):
-    mocker.patch("trxo.utils.imports.cherry_pick_filter.info")
-    mocker.patch("trxo.utils.imports.cherry_pick_filter.error")
+@pytest.fixture
+def error_mock(monkeypatch):
+    """Record cherry_pick_filter.error calls for tests that assert on them."""
+    mock = MagicMock()
+    monkeypatch.setattr(cherry_pick_filter, "error", mock)
+    return mock
+
 
+def test_apply_filter_happy_path_id_match():
     items = [{"_id": "1"}, {"_id": "2"}]
 
     result = CherryPickFilter.apply_filter(items, "1")
@@ -14,10 +22,7 @@ def test_apply_filter_happy_path_id_match(mocker):
     assert result == [{"_id": "1"}]
 
 
-def test_apply_filter_multiple_ids(mocker):
-    mocker.patch("trxo.utils.imports.cherry_pick_filter.info")
-    mocker.patch("trxo.utils.imports.cherry_pick_filter.error")
-
+def test_apply_filter_multiple_ids():
     items = [{"_id": "1"}, {"_id": "2"}, {"_id": "3"}]
 
     result = CherryPickFilter.apply_filter(items, "1,3")
@@ -25,10 +30,7 @@ def test_apply_filter_multiple_ids(mocker):
     assert result == [{"_id": "1"}, {"_id": "3"}]
 
 
-def test_apply_filter_strips_spaces(mocker):
-    mocker.patch("trxo.utils.imports.cherry_pick_filter.info")
-    mocker.patch("trxo.utils.imports.cherry_pick_filter.error")
-
+def test_apply_filter_strips_spaces():
     items = [{"_id": "1"}, {"_id": "2"}]
 
     result = CherryPickFilter.apply_filter(items, " 1 ,  2 ")
@@ -36,10 +38,7 @@ def test_apply_filter_strips_spaces(mocker):
     assert result == [{"_id": "1"}, {"_id": "2"}]
 
 
-def test_apply_filter_fallback_id_field(mocker):
-    mocker.patch("trxo.utils.imports.cherry_pick_filter.info")
-    mocker.patch("trxo.utils.imports.cherry_pick_filter.error")
-
+def test_apply_filter_fallback_id_field():
     items = [{"id": "x"}, {"id": "y"}]
 
     result = CherryPickFilter.apply_filter(items, "y")
@@ -47,10 +46,7 @@ def test_apply_filter_fallback_id_field(mocker):
     assert result == [{"id": "y"}]
 
 
-def test_apply_filter_fallback_name_field(mocker):
-    mocker.patch("trxo.utils.imports.cherry_pick_filter.info")
-    mocker.patch("trxo.utils.imports.cherry_pick_filter.error")
-
+def test_apply_filter_fallback_name_field():
     items = [{"name": "alpha"}, {"name": "beta"}]
 
     result = CherryPickFilter.apply_filter(items, "beta")
@@ -58,10 +54,7 @@ def test_apply_filter_fallback_name_field(mocker):
     assert result == [{"name": "beta"}]
 
 
-def test_apply_filter_nested_type_id(mocker):
-    mocker.patch("trxo.utils.imports.cherry_pick_filter.info")
-    mocker.patch("trxo.utils.imports.cherry_pick_filter.error")
-
+def test_apply_filter_nested_type_id():
     items = [
         {"_id": "", "_type": {"_id": "nested-1"}},
         {"_id": "x"},
@@ -72,10 +65,7 @@ def test_apply_filter_nested_type_id(mocker):
     assert result == [{"_id": "", "_type": {"_id": "nested-1"}}]
 
 
-def test_apply_filter_missing_id_logs_error(mocker):
-    error_mock = mocker.patch("trxo.utils.imports.cherry_pick_filter.error")
-    mocker.patch("trxo.utils.imports.cherry_pick_filter.info")
-
+def test_apply_filter_missing_id_logs_error(error_mock):
     items = [{"_id": "1"}]
 
     result = CherryPickFilter.apply_filter(items, "999")
@@ -84,10 +74,7 @@ def test_apply_filter_missing_id_logs_error(mocker):
     error_mock.assert_called_once()
 
 
-def test_apply_filter_partial_missing_ids(mocker):
-    error_mock = mocker.patch("trxo.utils.imports.cherry_pick_filter.error")
-    mocker.patch("trxo.utils.imports.cherry_pick_filter.info")
-
+def test_apply_filter_partial_missing_ids(error_mock):
     items = [{"_id": "1"}, {"_id": "2"}]
 
     result = CherryPickFilter.apply_filter(items, "1,999")
@@ -96,10 +83,7 @@ def test_apply_filter_partial_missing_ids(mocker):
     error_mock.assert_called_once()
 
 
-def test_apply_filter_no_valid_ids(mocker):
-    error_mock = mocker.patch("trxo.utils.imports.cherry_pick_filter.error")
-    mocker.patch("trxo.utils.imports.cherry_pick_filter.info")
-
+def test_apply_filter_no_valid_ids(error_mock):
     items = [{"_id": "1"}]
 
     result = CherryPickFilter.apply_filter(items, " , , ")
@@ -108,20 +92,14 @@ def test_apply_filter_no_valid_ids(mocker):
     error_mock.assert_called_once()
 
 
-def test_apply_filter_empty_items(mocker):
-    mocker.patch("trxo.utils.imports.cherry_pick_filter.info")
-    error_mock = mocker.patch("trxo.utils.imports.cherry_pick_filter.error")
-
+def test_apply_filter_empty_items(error_mock):
     result = CherryPickFilter.apply_filter([], "1")
 
     assert result == []
     error_mock.assert_called_once()
 
 
-def test_apply_filter_duplicate_ids(mocker):
-    mocker.patch("trxo.utils.imports.cherry_pick_filter.info")
-    mocker.patch("trxo.utils.imports.cherry_pick_filter.error")
-
+def test_apply_filter_duplicate_ids():
     items = [{"_id": "1"}, {"_id": "2"}]
 
     result = CherryPickFilter.apply_filter(items, "1,1")
@@ -141,13 +119,6 @@ def test_validate_cherry_pick_argument_option():
     assert CherryPickFilter.validate_cherry_pick_argument("--file") is False
 
 
-def test_validate_cherry_pick_argument_reserved_realm_alpha():
-    assert CherryPickFilter.validate_cherry_pick_argument("alpha") is False
-
-
-def test_validate_cherry_pick_argument_reserved_realm_bravo():
-    assert CherryPickFilter.validate_cherry_pick_argument("bravo") is False
-
-
-def test_validate_cherry_pick_argument_reserved_realm_charlie():
-    assert CherryPickFilter.validate_cherry_pick_argument("charlie") is False
+@pytest.mark.parametrize("realm", ["alpha", "bravo", "charlie"])
+def test_validate_cherry_pick_argument_reserved_realm(realm):
+    assert CherryPickFilter.validate_cherry_pick_argument(realm) is False
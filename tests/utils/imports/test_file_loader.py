@@ -1,25 +1,38 @@
 import json
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 import pytest
 
 from trxo.utils.imports.file_loader import FileLoader
 
+_SAMPLE_PAYLOADS = {
+    "collection": {"data": {"result": [{"_id": "1"}, {"_id": "2"}]}},
+    "single": {"data": {"_id": "1"}},
+    "result": {"data": {"result": [{"x": 1}]}},
+    "list": [{"x": 1}],
+    "object": {"x": 1},
+}
 
-def test_load_from_local_file_happy_path_collection(tmp_path):
-    file = tmp_path / "data.json"
-    file.write_text(json.dumps({"data": {"result": [{"_id": "1"}, {"_id": "2"}]}}))
 
-    result = FileLoader.load_from_local_file(str(file))
+@pytest.fixture(scope="module")
+def sample_files(tmp_path_factory):
+    """Canonical payloads written once per module; tests must not modify them."""
+    root = tmp_path_factory.mktemp("file_loader")
+    files = {}
+    for name, payload in _SAMPLE_PAYLOADS.items():
+        files[name] = root / f"{name}.json"
+        files[name].write_text(json.dumps(payload))
+    return files
 
-    assert result == [{"_id": "1"}, {"_id": "2"}]
 
+def test_load_from_local_file_happy_path_collection(sample_files):
+    result = FileLoader.load_from_local_file(str(sample_files["collection"]))
+
+    assert result == [{"_id": "1"}, {"_id": "2"}]
 
-def test_load_from_local_file_single_object(tmp_path):
-    file = tmp_path / "data.json"
-    file.write_text(json.dumps({"data": {"_id": "1"}}))
 
-    result = FileLoader.load_from_local_file(str(file))
+def test_load_from_local_file_single_object(sample_files):
+    result = FileLoader.load_from_local_file(str(sample_files["single"]))
 
     assert result == [{"_id": "1"}]
 
@@ -39,7 +52,7 @@ def test_load_from_local_file_invalid_json(tmp_path):
 
 def test_load_from_local_file_invalid_root_type(tmp_path):
     file = tmp_path / "data.json"
-    file.write_text(json.dumps([1, 2, 3]))
+    file.write_text("[1, 2, 3]")
 
     with pytest.raises(Exception):
         FileLoader.load_from_local_file(str(file))
@@ -47,45 +60,34 @@ def test_load_from_local_file_invalid_root_type(tmp_path):
 
 def test_load_from_local_file_missing_data_key(tmp_path):
     file = tmp_path / "data.json"
-    file.write_text(json.dumps({"x": 1}))
+    file.write_text('{"x": 1}')
 
     with pytest.raises(Exception):
         FileLoader.load_from_local_file(str(file))
 
 
-def test_load_from_git_file_happy_path_result(tmp_path):
-    file = tmp_path / "a.json"
-    file.write_text(json.dumps({"data": {"result": [{"x": 1}]}}))
-
-    result = FileLoader.load_from_git_file(file)
+def test_load_from_git_file_happy_path_result(sample_files):
+    result = FileLoader.load_from_git_file(sample_files["result"])
 
     assert result == [{"x": 1}]
 
 
-def test_load_from_git_file_direct_list(tmp_path):
-    file = tmp_path / "a.json"
-    file.write_text(json.dumps([{"x": 1}]))
-
-    result = FileLoader.load_from_git_file(file)
+def test_load_from_git_file_direct_list(sample_files):
+    result = FileLoader.load_from_git_file(sample_files["list"])
 
     assert result == [{"x": 1}]
 
 
-def test_load_from_git_file_direct_object(tmp_path):
-    file = tmp_path / "a.json"
-    file.write_text(json.dumps({"x": 1}))
-
-    result = FileLoader.load_from_git_file(file)
+def test_load_from_git_file_direct_object(sample_files):
+    result = FileLoader.load_from_git_file(sample_files["object"])
 
     assert result == [{"x": 1}]
 
 
-def test_load_from_git_file_invalid_json(tmp_path, mocker):
+def test_load_from_git_file_invalid_json(tmp_path):
     file = tmp_path / "a.json"
     file.write_text("{ bad json")
 
-    mocker.patch("trxo.utils.imports.file_loader.error")
-
     result = FileLoader.load_from_git_file(file)
 
     assert result == []
@@ -96,20 +98,50 @@ def test_load_from_git_file_invalid_json(tmp_path, mocker):
 # -------------------------
 
 
-def test_discover_git_files_with_realm(tmp_path, mocker):
-    repo = tmp_path
-    f1 = repo / "a.json"
-    f1.write_text("{}")
+@pytest.fixture
+def git_tree(tmp_path):
+    """Build a repo layout from {relative path: file content} under tmp_path."""
+
+    def _make(layout):
+        for rel, content in layout.items():
+            path = tmp_path / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+        return tmp_path
+
+    return _make
+
 
-    # Mock the discovery method
-    mocker.patch(
-        "trxo.utils.imports.file_loader.FileLoader.discover_git_files",
-        return_value=[f1],
+_RESULT_JSON = '{"data": {"result": [{"x": 1}]}}'
+
+
+def test_discover_git_files_with_realm(git_tree):
+    repo = git_tree(
+        {
+            "alpha/scripts/alpha_scripts.json": "{}",
+            "alpha/scripts/notes.json": "{}",
+            "bravo/scripts/bravo_scripts.json": "{}",
+        }
     )
 
     result = FileLoader.discover_git_files(repo, "scripts", "alpha")
 
-    assert result == [f1]
+    assert result == [repo / "alpha" / "scripts" / "alpha_scripts.json"]
+
+
+def test_discover_git_files_all_realms(git_tree):
+    repo = git_tree(
+        {
+            "alpha/scripts/alpha_scripts.json": "{}",
+            "bravo/scripts/bravo_scripts.json": "{}",
+            ".git/scripts/ignored.json": "{}",
+        }
+    )
+
+    result = FileLoader.discover_git_files(repo, "scripts", None)
+
+    names = sorted(path.name for path in result)
+    assert names == ["alpha_scripts.json", "bravo_scripts.json"]
 
 
 def test_discover_git_files_component_not_found(tmp_path):
@@ -123,21 +155,9 @@ def test_discover_git_files_component_not_found(tmp_path):
 # -------------------------
 
 
-def test_load_git_files_happy_path(tmp_path, mocker):
-    repo = tmp_path
-
-    f1 = repo / "a.json"
-    f1.write_text(json.dumps({"data": {"result": [{"x": 1}]}}))
-
-    git_manager = MagicMock()
-    git_manager.local_path = repo
-
-    mocker.patch(
-        "trxo.utils.imports.file_loader.FileLoader.discover_git_files",
-        return_value=[f1],
-    )
-
-    mocker.patch("trxo.utils.imports.file_loader.info")
+def test_load_git_files_happy_path(git_tree):
+    repo = git_tree({"alpha/scripts/alpha_scripts.json": _RESULT_JSON})
+    git_manager = SimpleNamespace(local_path=repo)
 
     result = FileLoader.load_git_files(git_manager, "scripts", "alpha")
 
@@ -145,34 +165,22 @@ def test_load_git_files_happy_path(tmp_path, mocker):
 
 
 def test_load_git_files_empty_result(tmp_path):
-    git_manager = MagicMock()
-    git_manager.local_path = tmp_path
+    git_manager = SimpleNamespace(local_path=tmp_path)
 
     result = FileLoader.load_git_files(git_manager, "scripts", "alpha")
 
     assert result == []
 
 
-def test_load_git_files_partial_failure(tmp_path, mocker):
-    repo = tmp_path
-
-    good = repo / "good.json"
-    bad = repo / "bad.json"
-
-    good.write_text(json.dumps({"data": {"result": [{"x": 1}]}}))
-    bad.write_text("{ bad json")
-
-    git_manager = MagicMock()
-    git_manager.local_path = repo
-
-    mocker.patch(
-        "trxo.utils.imports.file_loader.FileLoader.discover_git_files",
-        return_value=[good, bad],
+def test_load_git_files_partial_failure(git_tree):
+    repo = git_tree(
+        {
+            "alpha/scripts/alpha_scripts.json": _RESULT_JSON,
+            "bravo/scripts/bravo_scripts.json": "{ bad json",
+        }
     )
+    git_manager = SimpleNamespace(local_path=repo)
 
-    mocker.patch("trxo.utils.imports.file_loader.info")
-    mocker.patch("trxo.utils.imports.file_loader.warning")
-
-    result = FileLoader.load_git_files(git_manager, "scripts", "alpha")
+    result = FileLoader.load_git_files(git_manager, "scripts", None)
 
     assert result == [{"x": 1}]
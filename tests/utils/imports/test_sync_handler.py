@@ -1,29 +1,39 @@
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
 
+from trxo.utils.imports import sync_handler
 from trxo.utils.imports.sync_handler import SyncHandler
 
 
-def test_handle_sync_deletions_passes_all_args(mocker):
-    """Verify that all onprem / IDM / am_base_url args are forwarded to DiffManager."""
-    mocker.patch("trxo.utils.imports.sync_handler.info")
-    mocker.patch("trxo.utils.imports.sync_handler.warning")
-    mocker.patch("trxo.utils.imports.sync_handler.success")
-
-    diff_manager = MagicMock()
-    diff_manager.perform_diff.return_value = {"removed": [{"_id": "1"}]}
-    mocker.patch(
-        "trxo.utils.imports.sync_handler.DiffManager", return_value=diff_manager
+@pytest.fixture(autouse=True)
+def console(mocker):
+    """Replace sync_handler's console helpers; tests can assert on the mocks."""
+    return SimpleNamespace(
+        info=mocker.patch.object(sync_handler, "info"),
+        success=mocker.patch.object(sync_handler, "success"),
+        warning=mocker.patch.object(sync_handler, "warning"),
     )
 
+
+@pytest.fixture
+def patched_managers(monkeypatch):
+    """DiffManager and DeletionManager mocks wired into sync_handler."""
+    diff_manager = MagicMock()
     deletion_manager = MagicMock()
+    monkeypatch.setattr(sync_handler, "DiffManager", lambda: diff_manager)
+    monkeypatch.setattr(sync_handler, "DeletionManager", lambda: deletion_manager)
+    return diff_manager, deletion_manager
+
+
+def test_handle_sync_deletions_passes_all_args(patched_managers):
+    """Verify that all onprem / IDM / am_base_url args are forwarded to DiffManager."""
+    diff_manager, deletion_manager = patched_managers
+    diff_manager.perform_diff.return_value = {"removed": [{"_id": "1"}]}
     deletion_manager.get_items_to_delete.return_value = [{"_id": "1"}]
     deletion_manager.confirm_deletions.return_value = True
     deletion_manager.execute_deletions.return_value = {"deleted": 1}
-    mocker.patch(
-        "trxo.utils.imports.sync_handler.DeletionManager", return_value=deletion_manager
-    )
 
     SyncHandler.handle_sync_deletions(
         command_name="services",
@@ -68,3 +78,34 @@ def test_handle_sync_deletions_passes_all_args(mocker):
         generate_html=False,
         global_policy=False,  # ✅ FIX ADDED
     )
+
+
+@pytest.mark.parametrize(
+    "perform_diff, items, confirm, expected, console_call",
+    [
+        pytest.param(None, [], False, None, "warning", id="diff-fails"),
+        pytest.param({"removed": []}, [], False, None, "success", id="no-orphans"),
+        pytest.param({"removed": [1]}, [1], False, None, "warning", id="user-cancels"),
+        pytest.param({"removed": [1]}, [1], True, {"deleted": 1}, "info", id="deletes"),
+    ],
+)
+def test_handle_sync_deletions(
+    patched_managers, console, perform_diff, items, confirm, expected, console_call
+):
+    diff_manager, deletion_manager = patched_managers
+    diff_manager.perform_diff.return_value = perform_diff
+    deletion_manager.get_items_to_delete.return_value = items
+    deletion_manager.confirm_deletions.return_value = confirm
+    deletion_manager.execute_deletions.return_value = {"deleted": 1}
+
+    result = SyncHandler.handle_sync_deletions(
+        command_name="scripts",
+        item_type="scripts",
+        delete_func=MagicMock(),
+        token="tok",
+        base_url="url",
+    )
+
+    assert result == expected
+    getattr(console, console_call).assert_called()
+    assert deletion_manager.print_summary.called is (expected is not None)
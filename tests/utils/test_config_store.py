@@ -1,57 +1,96 @@
 import json
 import os
 import platform
+import shutil
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import keyring
 import pytest
+from keyring.backend import KeyringBackend
 
-from trxo.utils.config_store import SERVICE_NAME, ConfigStore
+from trxo.utils.config_store import SERVICE_NAME, ConfigStore, _config_dir_for
 
 
-@pytest.fixture
-def temp_config_dir(tmp_path, mocker):
-    mocker.patch("platform.system", return_value="Linux")
-    mocker.patch.dict(os.environ, {"XDG_CONFIG_HOME": str(tmp_path)})
-    return tmp_path
+class _MemoryKeyring(KeyringBackend):
+    """Dict-backed keyring so tests exercise the real keyring API offline."""
 
+    priority = 1
 
-@pytest.fixture
-def store(temp_config_dir):
-    return ConfigStore()
+    def __init__(self):
+        super().__init__()
+        self.passwords = {}
 
+    def set_password(self, service, username, password):
+        self.passwords[service, username] = password
 
-def test_get_config_dir_linux_xdg(temp_config_dir, mocker):
-    mocker.patch("platform.system", return_value="Linux")
-    mocker.patch.dict(os.environ, {"XDG_CONFIG_HOME": str(temp_config_dir)})
+    def get_password(self, service, username):
+        return self.passwords.get((service, username))
 
-    store = ConfigStore()
-    assert store.base_dir == temp_config_dir / "trxo"
+    def delete_password(self, service, username):
+        self.passwords.pop((service, username), None)
 
 
-def test_get_config_dir_linux_fallback(tmp_path, mocker):
-    mocker.patch("platform.system", return_value="Linux")
-    mocker.patch.dict(os.environ, {}, clear=True)
-    mocker.patch("pathlib.Path.home", return_value=tmp_path)
+@pytest.fixture(scope="module")
+def _memory_keyring():
+    previous = keyring.get_keyring()
+    backend = _MemoryKeyring()
+    keyring.set_keyring(backend)
+    yield backend
+    keyring.set_keyring(previous)
 
-    store = ConfigStore()
-    assert store.base_dir == tmp_path / ".trxo"
 
+@pytest.fixture(autouse=True)
+def memory_keyring(_memory_keyring):
+    """Module-wide in-memory keyring, emptied after each test."""
+    yield _memory_keyring
+    _memory_keyring.passwords.clear()
 
-def test_get_config_dir_windows(tmp_path, mocker):
-    mocker.patch("platform.system", return_value="Windows")
-    mocker.patch.dict(os.environ, {"APPDATA": str(tmp_path)})
 
-    store = ConfigStore()
-    assert store.base_dir == tmp_path / "trxo"
+@pytest.fixture(scope="module")
+def _shared_store(tmp_path_factory):
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(platform, "system", lambda: "Linux")
+        mp.setenv("XDG_CONFIG_HOME", str(tmp_path_factory.mktemp("config")))
+        return ConfigStore()
+
+
+@pytest.fixture
+def store(_shared_store):
+    """Module-wide ConfigStore whose config directory is emptied after each test."""
+    yield _shared_store
+    shutil.rmtree(_shared_store.base_dir)
+    _shared_store._ensure_config_dir()
 
 
-def test_get_config_dir_macos(tmp_path, mocker):
-    mocker.patch("platform.system", return_value="Darwin")
-    mocker.patch("pathlib.Path.home", return_value=tmp_path)
+def test_get_config_dir_uses_current_platform(tmp_path, mocker):
+    mocker.patch("platform.system", return_value="Linux")
+    mocker.patch.dict(os.environ, {"XDG_CONFIG_HOME": str(tmp_path)})
 
     store = ConfigStore()
-    assert store.base_dir == tmp_path / "Library" / "Application Support" / "trxo"
+    assert store.base_dir == tmp_path / "trxo"
+
+
+@pytest.mark.parametrize(
+    "system, env_key, expected",
+    [
+        pytest.param("Linux", "XDG_CONFIG_HOME", ("trxo",), id="linux-xdg"),
+        pytest.param("Linux", None, (".trxo",), id="linux-fallback"),
+        pytest.param("Windows", "APPDATA", ("trxo",), id="windows"),
+        pytest.param(
+            "Darwin",
+            None,
+            ("Library", "Application Support", "trxo"),
+            id="macos",
+        ),
+    ],
+)
+def test_config_dir_for(tmp_path, system, env_key, expected):
+    environ = {env_key: str(tmp_path)} if env_key else {}
+
+    assert _config_dir_for(system, environ, home=tmp_path) == tmp_path.joinpath(
+        *expected
+    )
 
 
 def test_save_and_get_project(store):
@@ -120,36 +159,26 @@ def test_get_token_corrupted(store):
     assert store.get_token("p1") is None
 
 
-def test_store_git_credentials_keyring(mocker, store):
-    set_pw = mocker.patch("keyring.set_password")
-
+def test_store_git_credentials_keyring(store):
     store.store_git_credentials("p1", "u", "url", "tok")
 
-    set_pw.assert_any_call("trxo:p1:git_token", "token", "tok")
-    set_pw.assert_any_call(SERVICE_NAME, "token", "tok")
+    assert keyring.get_password("trxo:p1:git_token", "token") == "tok"
+    assert keyring.get_password(SERVICE_NAME, "token") == "tok"
 
 
-def test_get_git_credentials_scoped(mocker, store):
+def test_get_git_credentials_scoped(store):
     store.save_project("p1", {"git_repo": "url", "git_username": "u"})
-
-    get_pw = mocker.patch(
-        "keyring.get_password",
-        side_effect=lambda s, k: {"trxo:p1:git_token": "tok"}.get(s),
-    )
+    keyring.set_password("trxo:p1:git_token", "token", "tok")
 
     creds = store.get_git_credentials("p1")
 
     assert creds == {"username": "u", "repo_url": "url", "token": "tok"}
 
 
-def test_get_git_credentials_fallback_global(mocker, store):
+def test_get_git_credentials_fallback_global(store):
     store.save_project("p1", {"git_repo": None, "git_username": None})
-
-    def fake_get(service, key):
-        data = {SERVICE_NAME: {"token": "tok", "username": "u", "repo_url": "url"}}
-        return data.get(service, {}).get(key)
-
-    mocker.patch("keyring.get_password", side_effect=fake_get)
+    for key, value in {"token": "tok", "username": "u", "repo_url": "url"}.items():
+        keyring.set_password(SERVICE_NAME, key, value)
 
     creds = store.get_git_credentials("p1")
     assert creds == {"username": "u", "repo_url": "url", "token": "tok"}
@@ -159,8 +188,7 @@ def test_get_git_credentials_missing_project(store):
     assert store.get_git_credentials("nope") is None
 
 
-def test_get_git_credentials_missing_all(mocker, store):
+def test_get_git_credentials_missing_all(store):
     store.save_project("p1", {})
-    mocker.patch("keyring.get_password", return_value=None)
 
     assert store.get_git_credentials("p1") is None
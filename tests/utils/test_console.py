@@ -1,32 +1,33 @@
-from unittest.mock import MagicMock
-
 import pytest
 
 import trxo.utils.console as console_utils
 
 
-def test_success_prints(mocker):
-    mock_print = mocker.patch.object(console_utils.console, "print")
-    console_utils.success("ok")
-    mock_print.assert_called_once()
-
-
-def test_error_prints(mocker):
-    mock_print = mocker.patch.object(console_utils.console, "print")
-    console_utils.error("fail")
-    mock_print.assert_called_once()
-
+@pytest.fixture(autouse=True)
+def printed(monkeypatch):
+    """Record console.print calls as (args, kwargs) instead of writing output."""
+    calls = []
+    monkeypatch.setattr(
+        console_utils.console, "print", lambda *a, **k: calls.append((a, k))
+    )
+    return calls
 
-def test_warning_prints(mocker):
-    mock_print = mocker.patch.object(console_utils.console, "print")
-    console_utils.warning("warn")
-    mock_print.assert_called_once()
 
+@pytest.mark.parametrize(
+    "helper, style",
+    [
+        pytest.param(console_utils.success, "bold green", id="success"),
+        pytest.param(console_utils.error, "bold red", id="error"),
+        pytest.param(console_utils.warning, "bold yellow", id="warning"),
+        pytest.param(console_utils.info, "cyan", id="info"),
+    ],
+)
+def test_message_helpers_print_once(printed, helper, style):
+    helper("hello")
 
-def test_info_prints(mocker):
-    mock_print = mocker.patch.object(console_utils.console, "print")
-    console_utils.info("hello")
-    mock_print.assert_called_once()
+    [(args, kwargs)] = printed
+    assert "hello" in args[0]
+    assert kwargs == {"style": style}
 
 
 def test_create_table():
@@ -35,7 +36,6 @@ def test_create_table():
     assert len(table.columns) == 2
 
 
-def test_display_panel(mocker):
-    mock_print = mocker.patch.object(console_utils.console, "print")
+def test_display_panel(printed):
     console_utils.display_panel("content", "title")
-    mock_print.assert_called_once()
+    assert len(printed) == 1
@@ -1,8 +1,22 @@
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
+import pytest
+
+from trxo.utils import deletion_manager
 from trxo.utils.deletion_manager import DeletionManager
 
 
+@pytest.fixture(autouse=True)
+def console(mocker):
+    """Replace deletion_manager's console helpers; tests can assert on the mocks."""
+    return SimpleNamespace(
+        error=mocker.patch.object(deletion_manager, "error"),
+        info=mocker.patch.object(deletion_manager, "info"),
+        success=mocker.patch.object(deletion_manager, "success"),
+        warning=mocker.patch.object(deletion_manager, "warning"),
+    )
+
+
 class FakeDiffItem:
     def __init__(self, item_id, item_name=None):
         self.item_id = item_id
@@ -24,155 +38,88 @@ def test_get_items_to_delete():
     assert result == items
 
 
-def test_confirm_deletions_no_items(mocker):
-    mocker.patch("trxo.utils.deletion_manager.info")
-    mgr = DeletionManager()
-
-    ok = mgr.confirm_deletions([], "scripts", force=False)
-
-    assert ok is True
-
+@pytest.mark.parametrize(
+    "items, force, confirm, expected",
+    [
+        pytest.param([], False, None, True, id="no-items"),
+        pytest.param([FakeDiffItem("1", "one")], True, None, True, id="force"),
+        pytest.param([FakeDiffItem("1", "one")], False, True, True, id="confirmed"),
+        pytest.param([FakeDiffItem("1", "one")], False, False, False, id="cancelled"),
+    ],
+)
+def test_confirm_deletions(items, force, confirm, expected):
+    prompts = []
+
+    def confirm_fn(prompt, default):
+        prompts.append(prompt)
+        return confirm
+
+    mgr = DeletionManager(confirm_fn=confirm_fn)
+    ok = mgr.confirm_deletions(items, "scripts", force=force)
+
+    assert ok is expected
+    assert len(prompts) == (0 if confirm is None else 1)
+
+
+@pytest.mark.parametrize(
+    "outcomes, deleted, failed",
+    [
+        pytest.param([True, True], ["1", "2"], [], id="all-success"),
+        pytest.param(
+            [True, False],
+            ["1"],
+            [("2", "Delete function returned False")],
+            id="partial-failure",
+        ),
+        pytest.param(
+            [Exception("boom")] * 2, [], [("1", "boom"), ("2", "boom")], id="exception"
+        ),
+    ],
+)
+def test_execute_deletions(outcomes, deleted, failed):
+    calls = []
+    results = iter(outcomes)
+
+    def delete_func(item_id, token, base_url):
+        calls.append((item_id, token, base_url))
+        result = next(results)
+        if isinstance(result, Exception):
+            raise result
+        return result
 
-def test_confirm_deletions_force_true(mocker):
-    mocker.patch("trxo.utils.deletion_manager.warning")
-    mocker.patch("trxo.utils.deletion_manager.info")
-
-    mgr = DeletionManager()
-    items = [FakeDiffItem("1", "one")]
-
-    ok = mgr.confirm_deletions(items, "scripts", force=True)
-
-    assert ok is True
-
-
-def test_confirm_deletions_user_confirms(mocker):
-    mocker.patch("trxo.utils.deletion_manager.warning")
-    mocker.patch("trxo.utils.deletion_manager.info")
-    mocker.patch("typer.confirm", return_value=True)
-
-    mgr = DeletionManager()
-    items = [FakeDiffItem("1", "one")]
-
-    ok = mgr.confirm_deletions(items, "scripts", force=False)
-
-    assert ok is True
-
-
-def test_confirm_deletions_user_cancels(mocker):
-    mocker.patch("trxo.utils.deletion_manager.warning")
-    mocker.patch("trxo.utils.deletion_manager.info")
-    mocker.patch("typer.confirm", return_value=False)
-
-    mgr = DeletionManager()
-    items = [FakeDiffItem("1", "one")]
-
-    ok = mgr.confirm_deletions(items, "scripts", force=False)
-
-    assert ok is False
-
-
-def test_execute_deletions_all_success(mocker):
-    mocker.patch("trxo.utils.deletion_manager.info")
-    mocker.patch("trxo.utils.deletion_manager.success")
-    mocker.patch("trxo.utils.deletion_manager.error")
-
-    delete_func = MagicMock(return_value=True)
     items = [FakeDiffItem("1"), FakeDiffItem("2")]
 
-    mgr = DeletionManager()
-    summary = mgr.execute_deletions(items, delete_func, "token", "url")
+    summary = DeletionManager().execute_deletions(items, delete_func, "token", "url")
 
-    assert summary["deleted_count"] == 2
-    assert summary["failed_count"] == 0
-    assert summary["deleted_items"] == ["1", "2"]
-    assert summary["failed_deletions"] == []
+    assert calls == [("1", "token", "url"), ("2", "token", "url")]
+    assert summary["deleted_count"] == len(deleted)
+    assert summary["failed_count"] == len(failed)
+    assert summary["deleted_items"] == deleted
+    assert [(f["id"], f["error"]) for f in summary["failed_deletions"]] == failed
 
 
-def test_execute_deletions_partial_failure(mocker):
-    mocker.patch("trxo.utils.deletion_manager.info")
-    mocker.patch("trxo.utils.deletion_manager.success")
-    mocker.patch("trxo.utils.deletion_manager.error")
-
-    delete_func = MagicMock(side_effect=[True, False])
-    items = [FakeDiffItem("1"), FakeDiffItem("2")]
-
-    mgr = DeletionManager()
-    summary = mgr.execute_deletions(items, delete_func, "token", "url")
-
-    assert summary["deleted_count"] == 1
-    assert summary["failed_count"] == 1
-    assert summary["deleted_items"] == ["1"]
-    assert summary["failed_deletions"][0]["id"] == "2"
-
-
-def test_execute_deletions_exception(mocker):
-    mocker.patch("trxo.utils.deletion_manager.info")
-    mocker.patch("trxo.utils.deletion_manager.success")
-    mocker.patch("trxo.utils.deletion_manager.error")
-
-    def boom(item_id, token, url):
-        raise Exception("boom")
-
-    items = [FakeDiffItem("1")]
-
-    mgr = DeletionManager()
-    summary = mgr.execute_deletions(items, boom, "token", "url")
-
-    assert summary["deleted_count"] == 0
-    assert summary["failed_count"] == 1
-    assert summary["failed_deletions"][0]["id"] == "1"
-    assert "boom" in summary["failed_deletions"][0]["error"]
-
-
-def test_print_summary_only_success(mocker):
-    print_mock = mocker.patch("builtins.print")
-    error_mock = mocker.patch("trxo.utils.deletion_manager.error")
-
-    mgr = DeletionManager()
-    mgr.print_summary(
-        {
-            "deleted_count": 2,
-            "failed_count": 0,
-            "deleted_items": ["1", "2"],
-            "failed_deletions": [],
-        }
-    )
-
-    print_mock.assert_called_once()
-    error_mock.assert_not_called()
-
-
-def test_print_summary_only_failures(mocker):
+@pytest.mark.parametrize(
+    "deleted_items, failed_deletions",
+    [
+        pytest.param(["1", "2"], [], id="only-success"),
+        pytest.param([], [{"id": "1", "error": "boom"}], id="only-failures"),
+        pytest.param(["1"], [{"id": "2", "error": "fail"}], id="mixed"),
+    ],
+)
+def test_print_summary(mocker, console, deleted_items, failed_deletions):
     print_mock = mocker.patch("builtins.print")
-    error_mock = mocker.patch("trxo.utils.deletion_manager.error")
 
-    mgr = DeletionManager()
-    mgr.print_summary(
-        {
-            "deleted_count": 0,
-            "failed_count": 1,
-            "deleted_items": [],
-            "failed_deletions": [{"id": "1", "error": "boom"}],
-        }
-    )
-
-    print_mock.assert_not_called()
-    assert error_mock.call_count >= 2
-
-
-def test_print_summary_mixed(mocker):
-    print_mock = mocker.patch("builtins.print")
-    error_mock = mocker.patch("trxo.utils.deletion_manager.error")
-
-    mgr = DeletionManager()
-    mgr.print_summary(
+    DeletionManager().print_summary(
         {
-            "deleted_count": 1,
-            "failed_count": 1,
-            "deleted_items": ["1"],
-            "failed_deletions": [{"id": "2", "error": "fail"}],
+            "deleted_count": len(deleted_items),
+            "failed_count": len(failed_deletions),
+            "deleted_items": deleted_items,
+            "failed_deletions": failed_deletions,
         }
     )
 
-    print_mock.assert_called_once()
-    assert error_mock.call_count >= 2
+    assert print_mock.call_count == (1 if deleted_items else 0)
+    if failed_deletions:
+        assert console.error.call_count >= 2
+    else:
+        console.error.assert_not_called()
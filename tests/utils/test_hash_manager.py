@@ -1,17 +1,26 @@
 import json
 from pathlib import Path
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 import pytest
 
+from trxo.utils import hash_manager
 from trxo.utils.hash_manager import HashManager, get_command_name_from_item_type
 
 
+@pytest.fixture(autouse=True)
+def console(mocker):
+    """Replace hash_manager's console helpers; tests can assert on the mocks."""
+    return SimpleNamespace(
+        error=mocker.patch.object(hash_manager, "error"),
+        success=mocker.patch.object(hash_manager, "success"),
+        warning=mocker.patch.object(hash_manager, "warning"),
+    )
+
+
 @pytest.fixture()
 def store(tmp_path):
-    store = MagicMock()
-    store.base_dir = tmp_path
-    return store
+    return SimpleNamespace(base_dir=tmp_path)
 
 
 @pytest.fixture()
@@ -19,14 +28,20 @@ def manager(store):
     return HashManager(store)
 
 
-def test_create_hash_same_data_same_hash(manager):
-    data1 = {"data": {"result": [{"_id": "1", "name": "a"}]}}
-    data2 = {"data": {"result": [{"_id": "1", "name": "a"}]}}
+_SCRIPTS_PAYLOAD = {"data": {"result": [{"_id": "1", "name": "a"}]}}
 
-    h1 = manager.create_hash(data1, "scripts")
-    h2 = manager.create_hash(data2, "scripts")
 
-    assert h1 == h2
+@pytest.fixture(scope="module")
+def scripts_hash(tmp_path_factory):
+    """Hash of _SCRIPTS_PAYLOAD, computed once for the module."""
+    hasher = HashManager(SimpleNamespace(base_dir=tmp_path_factory.mktemp("hashes")))
+    return hasher.create_hash(_SCRIPTS_PAYLOAD, "scripts")
+
+
+def test_create_hash_same_data_same_hash(manager, scripts_hash):
+    data = {"data": {"result": [{"_id": "1", "name": "a"}]}}
+
+    assert manager.create_hash(data, "scripts") == scripts_hash
 
 
 def test_create_hash_ignores_dynamic_fields(manager):
@@ -59,41 +74,29 @@ def test_list_all_hashes(manager):
     assert hashes["b"]["hash"] == "2"
 
 
-def test_validate_import_hash_success(manager, mocker):
-    mocker.patch("trxo.utils.hash_manager.success")
-    mocker.patch("trxo.utils.hash_manager.error")
+def test_validate_import_hash_success(manager, scripts_hash):
+    manager.save_export_hash("scripts", scripts_hash)
 
-    data = {"_id": "1"}
-    h = manager.create_hash(data, "scripts")
-    manager.save_export_hash("scripts", h)
+    assert manager.validate_import_hash(_SCRIPTS_PAYLOAD, "scripts") is True
 
-    assert manager.validate_import_hash(data, "scripts") is True
-
-
-def test_validate_import_hash_mismatch(manager, mocker):
-    error_mock = mocker.patch("trxo.utils.hash_manager.error")
-    mocker.patch("trxo.utils.hash_manager.success")
 
+def test_validate_import_hash_mismatch(manager, console):
     manager.save_export_hash("scripts", "wrong")
 
     result = manager.validate_import_hash({"_id": "1"}, "scripts")
 
     assert result is False
-    assert error_mock.call_count >= 2
+    assert console.error.call_count >= 2
 
 
-def test_validate_import_hash_missing_metadata(manager, mocker):
-    error_mock = mocker.patch("trxo.utils.hash_manager.error")
-
+def test_validate_import_hash_missing_metadata(manager, console):
     result = manager.validate_import_hash({"_id": "1"}, "scripts")
 
     assert result is False
-    error_mock.assert_called_once()
-
+    console.error.assert_called_once()
 
-def test_validate_import_hash_force_true(manager, mocker):
-    mocker.patch("trxo.utils.hash_manager.warning")
 
+def test_validate_import_hash_force_true(manager):
     result = manager.validate_import_hash({"x": 1}, "scripts", force=True)
 
     assert result is True
@@ -168,3 +171,12 @@ def test_get_command_name_from_item_type_cleanup():
 
 def test_get_command_name_from_item_type_unknown():
     assert get_command_name_from_item_type("My Custom Type") == "my_custom_type"
+
+
+def test_get_command_name_from_item_type_is_cached():
+    get_command_name_from_item_type.cache_clear()
+
+    get_command_name_from_item_type("policies (alpha)")
+    get_command_name_from_item_type("policies (alpha)")
+
+    assert get_command_name_from_item_type.cache_info().hits == 1
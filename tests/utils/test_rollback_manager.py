@@ -1,168 +1,187 @@
-from unittest.mock import MagicMock
+import json
+from collections import namedtuple
+from contextlib import nullcontext
+from types import SimpleNamespace
 
+import httpx
 import pytest
 
+from trxo.utils import rollback_manager, url
 from trxo.utils.rollback_manager import RollbackManager
 
 
-@pytest.fixture
-def manager():
-    return RollbackManager("scripts", realm="alpha")
+@pytest.fixture(scope="module")
+def _shared_managers():
+    return {}
 
 
-def test_execute_rollback_created_success(mocker, manager):
-    manager.imported_items = [{"id": "1", "action": "created"}]
+@pytest.fixture
+def manager(request, _shared_managers):
+    """Module-wide RollbackManager with its tracked state cleared per test.
 
-    mocker.patch(
-        "trxo.utils.rollback_manager.get_command_api_endpoint",
-        return_value=("/scripts", None),
-    )
-    mocker.patch("trxo.utils.url.construct_api_url", return_value="url")
+    Built for "scripts" unless parametrized indirectly with another command.
+    """
+    command = getattr(request, "param", "scripts")
+    if command not in _shared_managers:
+        _shared_managers[command] = RollbackManager(command, realm="alpha")
+    mgr = _shared_managers[command]
+    mgr.baseline_snapshot = {}
+    mgr.imported_items = []
+    mgr.raw_baseline_data = {}
+    return mgr
 
-    client = MagicMock()
-    client.__enter__.return_value = client
-    client.__exit__.return_value = None
 
-    resp = MagicMock(status_code=204)
-    client.delete.return_value = resp
+_Response = namedtuple("_Response", "status_code text", defaults=("",))
+_OK, _NO_CONTENT, _SERVER_ERROR = _Response(200), _Response(204), _Response(500)
 
-    mocker.patch("httpx.Client", return_value=client)
-    mocker.patch("trxo.utils.rollback_manager.info")
-    mocker.patch("trxo.utils.rollback_manager.warning")
 
-    report = manager.execute_rollback("token", "base")
+class _StubClient:
+    """httpx.Client stand-in answering every request with ``response``."""
 
-    assert len(report["rolled_back"]) == 1
-    assert report["rolled_back"][0]["id"] == "1"
-    assert report["rolled_back"][0]["action"] == "deleted"
+    def __init__(self):
+        self.response = _OK
+        self.verbs = []
 
+    def _request(self, verb):
+        self.verbs.append(verb)
+        return self.response
 
-def test_execute_rollback_updated_success(mocker, manager):
-    manager.imported_items = [
-        {"id": "1", "action": "updated", "baseline": {"_id": "1"}}
-    ]
+    def delete(self, *args, **kwargs):
+        return self._request("delete")
 
-    mocker.patch(
-        "trxo.utils.rollback_manager.get_command_api_endpoint",
-        return_value=("/scripts", None),
-    )
-    mocker.patch("trxo.utils.url.construct_api_url", return_value="url")
+    def put(self, *args, **kwargs):
+        return self._request("put")
 
-    client = MagicMock()
-    client.__enter__.return_value = client
-    client.__exit__.return_value = None
+    def post(self, *args, **kwargs):
+        return self._request("post")
 
-    resp = MagicMock(status_code=200)
-    client.put.return_value = resp
 
-    mocker.patch("httpx.Client", return_value=client)
-    mocker.patch("trxo.utils.rollback_manager.info")
-    mocker.patch("trxo.utils.rollback_manager.warning")
+def _returns(value):
+    return lambda *args, **kwargs: value
 
-    report = manager.execute_rollback("token", "base")
 
-    # ✅ FIXED: updated items are now restored
-    assert len(report["rolled_back"]) == 1
-    assert report["rolled_back"][0]["id"] == "1"
-    assert report["rolled_back"][0]["action"] == "restored"
+def _boom(*args, **kwargs):
+    raise Exception("boom")
 
 
-def test_execute_rollback_updated_no_change(mocker, manager):
-    manager.imported_items = [
-        {"id": "1", "action": "updated", "baseline": {"_id": "1"}}
-    ]
+@pytest.fixture(autouse=True)
+def _endpoint_and_url(monkeypatch):
+    """Resolve each command's endpoint to /<command> and every URL to "url".
 
-    mocker.patch(
-        "trxo.utils.rollback_manager.get_command_api_endpoint",
-        return_value=("/scripts", None),
+    Tests needing other values override with their own monkeypatch.setattr.
+    """
+    monkeypatch.setattr(
+        rollback_manager,
+        "get_command_api_endpoint",
+        lambda command_name, *args, **kwargs: (f"/{command_name}", None),
     )
-    mocker.patch("trxo.utils.url.construct_api_url", return_value="url")
+    monkeypatch.setattr(url, "construct_api_url", _returns("url"))
 
-    client = MagicMock()
-    client.__enter__.return_value = client
-    client.__exit__.return_value = None
 
-    resp = MagicMock(status_code=500)
-    client.put.return_value = resp
-
-    mocker.patch("httpx.Client", return_value=client)
-    mocker.patch("trxo.utils.rollback_manager.info")
-    mocker.patch("trxo.utils.rollback_manager.warning")
+@pytest.fixture
+def rollback_env(monkeypatch):
+    """Patch rollback_manager's HTTP client and console helpers.
+
+    Returns the stub httpx.Client; tests set ``client.response`` for their
+    scenario and can check ``client.verbs``.
+    """
+    monkeypatch.setattr(rollback_manager, "info", _returns(None))
+    monkeypatch.setattr(rollback_manager, "warning", _returns(None))
+
+    client = _StubClient()
+    monkeypatch.setattr(httpx, "Client", lambda *args, **kwargs: nullcontext(client))
+    return client
+
+
+# Tracked import records; execute_rollback only reads them
+_CREATED = {"id": "1", "action": "created"}
+_UPDATED = {"id": "1", "action": "updated", "baseline": {"_id": "1"}}
+
+
+@pytest.mark.parametrize(
+    "manager, record, verb, response, rolled_back",
+    [
+        pytest.param(
+            "scripts",
+            _CREATED,
+            "delete",
+            _NO_CONTENT,
+            [("1", "deleted")],
+            id="created-deleted",
+        ),
+        pytest.param(
+            "scripts",
+            _UPDATED,
+            "put",
+            _OK,
+            [("1", "restored")],
+            id="updated-restored",
+        ),
+        pytest.param(
+            "scripts",
+            _UPDATED,
+            "put",
+            _SERVER_ERROR,
+            [],
+            id="updated-restore-fails",
+        ),
+        # managed is atomic, but without a baseline document it falls back to
+        # restoring the tracked items one by one
+        pytest.param(
+            "managed",
+            _UPDATED,
+            "put",
+            _OK,
+            [("1", "restored")],
+            id="managed-restored",
+        ),
+    ],
+    indirect=["manager"],
+)
+def test_execute_rollback(rollback_env, manager, record, verb, response, rolled_back):
+    manager.imported_items = [record]
+    rollback_env.response = response
 
     report = manager.execute_rollback("token", "base")
 
-    # ❌ Failed restore → not added to rolled_back
-    assert len(report["rolled_back"]) == 0
-
+    assert rollback_env.verbs == [verb]
+    assert [(r["id"], r["action"]) for r in report["rolled_back"]] == rolled_back
 
-def test_execute_rollback_managed_special_case(mocker):
-    mgr = RollbackManager("managed", realm="alpha")
 
-    mgr.imported_items = [{"id": "x", "action": "updated", "baseline": {"_id": "x"}}]
-
-    mocker.patch(
-        "trxo.utils.rollback_manager.get_command_api_endpoint",
-        return_value=("/managed", None),
+def test_build_api_url_list_endpoint(monkeypatch, manager):
+    monkeypatch.setattr(
+        rollback_manager,
+        "get_command_api_endpoint",
+        _returns(("/scripts?_queryFilter=true", None)),
     )
-
-    mocker.patch("trxo.utils.url.construct_api_url", return_value="url")
-
-    client = MagicMock()
-    client.__enter__.return_value = client
-    client.__exit__.return_value = None
-
-    resp = MagicMock(status_code=200)
-    client.put.return_value = resp
-
-    mocker.patch("httpx.Client", return_value=client)
-    mocker.patch("trxo.utils.rollback_manager.info")
-    mocker.patch("trxo.utils.rollback_manager.warning")
-
-    report = mgr.execute_rollback("token", "base")
-
-    # ✅ FIXED: managed also restores baseline
-    assert len(report["rolled_back"]) == 1
-    assert report["rolled_back"][0]["id"] == "x"
-    assert report["rolled_back"][0]["action"] == "restored"
-
-
-def test_build_api_url_list_endpoint(mocker, manager):
-    mocker.patch(
-        "trxo.utils.rollback_manager.get_command_api_endpoint",
-        return_value=("/scripts?_queryFilter=true", None),
-    )
-    mocker.patch("trxo.utils.url.construct_api_url", return_value="final")
+    monkeypatch.setattr(url, "construct_api_url", _returns("final"))
 
     result = manager._build_api_url("1", "base")
 
     assert result == "final"
 
 
-def test_build_api_url_fallback(mocker, manager):
-    mocker.patch(
-        "trxo.utils.rollback_manager.get_command_api_endpoint",
-        side_effect=Exception("boom"),
-    )
-    mocker.patch("trxo.utils.url.construct_api_url", return_value="fallback")
+def test_build_api_url_fallback(monkeypatch, manager):
+    monkeypatch.setattr(rollback_manager, "get_command_api_endpoint", _boom)
+    monkeypatch.setattr(url, "construct_api_url", _returns("fallback"))
 
     result = manager._build_api_url("1", "base")
 
     assert result == "fallback"
 
 
-def test_persist_baseline_to_local(mocker, tmp_path):
-    import json
-
+def test_persist_baseline_to_local(monkeypatch, tmp_path):
     mgr = RollbackManager("scripts", realm="alpha", project_name="test_proj")
     mapping = {"1": {"_id": "1", "data": "test"}}
 
-    config_store_mock = MagicMock()
-    config_store_mock.get_project_dir.return_value = tmp_path
-
-    mocker.patch(
-        "trxo.utils.rollback_manager.ConfigStore", return_value=config_store_mock
+    store = SimpleNamespace(
+        get_project_dir=_returns(tmp_path), get_project_config=_returns(None)
+    )
+    monkeypatch.setattr(rollback_manager, "ConfigStore", _returns(store))
+    rotations = []
+    monkeypatch.setattr(
+        mgr, "_rotate_local_baselines", lambda *args: rotations.append(args)
     )
-    mock_rotate = mocker.patch.object(mgr, "_rotate_local_baselines")
 
     mgr._persist_baseline_to_local(mapping)
 
@@ -175,10 +194,10 @@ def test_persist_baseline_to_local(mocker, tmp_path):
     data = json.loads(files[0].read_text())
     assert data["data"] == mapping
 
-    mock_rotate.assert_called_once_with(target_dir, 5)
+    assert rotations == [(target_dir, 5)]
 
 
-def test_rotate_local_baselines(mocker, tmp_path):
+def test_rotate_local_baselines(tmp_path):
     mgr = RollbackManager("scripts", realm="alpha", project_name="test_proj")
 
     # create some dummy baseline files in tmp_path